@@ -3,21 +3,48 @@ Bubble Shooter Game - Main game logic with 3D-style graphics
 """
 
 from kivy.uix.widget import Widget
-from kivy.graphics import Color, Ellipse, Line, Rectangle, Triangle, PushMatrix, PopMatrix
+from kivy.graphics import Canvas, Color, Ellipse, Line, Rectangle, Triangle, PushMatrix, PopMatrix
+from kivy.graphics import Fbo, ClearColor, ClearBuffers, Mesh, Rotate, Translate
 from kivy.core.text import Label as CoreLabel
 from kivy.clock import Clock
 from kivy.core.image import Image as CoreImage
+from kivy.graphics.texture import Texture
 from kivy.core.audio import SoundLoader
 from kivy.storage.jsonstore import JsonStore
 import random
 import math
 import os
+import importlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter, OrderedDict, defaultdict, deque
+# Hot math/random functions bound as module names (skips the module attribute lookup per call)
+from math import sqrt, cos, sin, atan2, degrees, radians, hypot
+from random import randint, uniform
+from random import random as random_float
 try:
     from PIL import Image as PILImage
+    from PIL import ImageChops
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
 
+# NumPy is optional - used to vectorize grid position checks (pure Python fallback otherwise)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# SDL2 music player is optional - streams the background track from disk instead of decoding it all into memory
+try:
+    from kivy.core.audio.audio_sdl2 import MusicSDL2
+    STREAMING_MUSIC_AVAILABLE = True
+except Exception:
+    STREAMING_MUSIC_AVAILABLE = False
+
 # Import graphics enhancer
 try:
     from graphics_enhancer import GraphicsEnhancer
@@ -39,10 +66,92 @@ ELEMENT_COLORS = {
     AIR: (0.6, 0.2, 0.9)        # Purple (replaced white/light blue)
 }
 
+# Sprite atlas settings (all sprite images are packed into one texture)
+SPRITE_ATLAS_WIDTH = 2048  # Atlas width in pixels (safe texture size on mobile GPUs)
+SPRITE_ATLAS_DEFAULT_SIZE = 256  # Max sprite size for bubble overlays (dynamite, mine, gold, rock, diamond)
+SPRITE_ATLAS_MAX_SIZES = {
+    'jet': 512,
+    'helicopter': 512,
+    'warship': 512,
+    'balloon': 512,
+}
+SPRITE_SOURCE_OVERSAMPLE = 2  # Sources are shrunk to this multiple of the sprite size before background removal
+
+# Enemy spawning: (attribute name, minimum level, random spawn interval range in seconds)
+ENEMY_SPAWN_SPECS = (
+    ('airplane', 8, (2.0, 5.0)),
+    ('helicopter', 10, (3.0, 6.0)),
+    ('warship', 21, (4.0, 8.0)),
+    ('snake', 31, (6.0, 12.0)),
+    ('balloon', 31, (5.0, 10.0)),
+)
+
+
+# Sprite image used by each enemy (only loaded at startup when the starting level can spawn the enemy)
+ENEMY_SPRITES = {
+    'airplane': 'jet',
+    'helicopter': 'helicopter',
+    'warship': 'warship',
+    'balloon': 'balloon',
+}
+
+
+def active_enemy_specs(level):
+    """Get the enemy spawn specs unlocked at a level"""
+    return tuple(spec for spec in ENEMY_SPAWN_SPECS if level >= spec[1])
+
+
+# Worker threads used to decode/process sprite images at startup
+SPRITE_LOADER_THREADS = 4
+
+# Max entries in each generated texture cache (least recently used entries are dropped)
+TEXTURE_CACHE_SIZE = 128
+ENEMY_TEXTURE_BUCKET = 8  # Generated enemy textures are sized up to multiples of this (stretched to the exact size when drawn)
+
+# Version of the processed sprite images cached in asset/.cache (bump when the processing changes)
+PROCESSED_IMAGE_VERSION = 2
+
+# Print gameplay debug messages (shots, diamonds, remaining bubbles) - off for release builds
+DEBUG_LOG = False
+
+# Simulation runs in fixed steps (rendering stays at the Clock rate)
+PHYSICS_STEP = 1.0 / 120.0
+PHYSICS_MAX_STEPS = 8  # Cap catch-up steps after a long frame (e.g. level loading)
+
+# Most explosion particles alive at once (chain explosions drop the oldest ones)
+MAX_PARTICLES = 600
+PARTICLE_ALPHA_STEPS = 16  # Particle fade is quantized so particles can share Color instructions
+
+# Unit direction vectors for grid snapping (precomputed so snapping does no trig)
+HEX_NEIGHBOR_OFFSETS = [(cos(radians(a)), sin(radians(a))) for a in (0, 60, 120, 180, 240, 300)]  # 6 adjacent hex positions
+ALT_POSITION_OFFSETS = [(cos(radians(a)), sin(radians(a))) for a in range(0, 360, 30)]  # 12 directions for fallback positions
+TRIGGER_GUARD_OFFSETS = [(cos(radians(a)), sin(radians(a))) for a in (-90, -45, 0, 45, 90)]  # Shooter trigger guard arc, relative to aim
+# 5-point star outline directions (alternating outer/inner points), starting at the bottom point
+STAR_DIRECTIONS = [(cos(i * math.pi / 5 - math.pi / 2), sin(i * math.pi / 5 - math.pi / 2)) for i in range(10)]
+SHOOTER_DETAIL_MIN_RADIUS = 12  # Bubble radius (pixels) below which the shooter's fine details are sub-pixel and skipped
+
+# Level progression: current level number -> (module, class) of the next level
+MAX_LEVEL = 40
+LEVEL_MODULES = {n: (f"levels.level{n + 1}", f"Level{n + 1}") for n in range(1, MAX_LEVEL)}
+LEVEL_MODULES[MAX_LEVEL] = (f"levels.level{MAX_LEVEL}", f"Level{MAX_LEVEL}")  # Final level restarts itself
+_level_class_cache = {}  # Module name -> resolved level class
+
+# Sound effect pool (several preloaded copies per effect so rapid pops don't cut each other off)
+SFX_POOL_SIZE = 4
+SFX_FILES = {
+    'one_bubble': "one_bubble.mp3",      # 1-3 bubbles
+    'two_bubbles': "two_bubbles.mp3",    # 4-6 bubbles
+    'four_bubbles': "four_bubbles.mp3",  # 7+ bubbles
+    'nice_shot': "nice-shot.mp3",        # Big scores
+    'diamond': "diamond.mp3",            # Diamond revealed in a rock
+}
+
 
 class Airplane:
     """Represents an airplane that crosses the screen"""
     
+    __slots__ = ('x', 'y', 'direction', 'speed', 'width', 'height', 'active', 'exploded')
+    
     def __init__(self, x, y, direction=1, speed=200):
         self.x = x
         self.y = y
@@ -53,7 +162,7 @@ class Airplane:
         self.active = True
         self.exploded = False
     
-    def update(self, dt, screen_width):
+    def update(self, dt, screen_width, screen_height):
         """Update airplane position"""
         if not self.active or self.exploded:
             return
@@ -91,6 +200,8 @@ class Airplane:
 class Helicopter:
     """Represents a helicopter that crosses the screen"""
     
+    __slots__ = ('x', 'y', 'direction', 'speed', 'width', 'height', 'active', 'exploded')
+    
     def __init__(self, x, y, direction=1, speed=200):
         self.x = x
         self.y = y
@@ -101,7 +212,7 @@ class Helicopter:
         self.active = True
         self.exploded = False
     
-    def update(self, dt, screen_width):
+    def update(self, dt, screen_width, screen_height):
         """Update helicopter position"""
         if not self.active or self.exploded:
             return
@@ -138,6 +249,8 @@ class Helicopter:
 class Warship:
     """Represents a warship that crosses the screen"""
 
+    __slots__ = ('x', 'y', 'direction', 'speed', 'width', 'height', 'active', 'exploded')
+
     def __init__(self, x, y, direction=1, speed=150):
         self.x = x
         self.y = y
@@ -148,7 +261,7 @@ class Warship:
         self.active = True
         self.exploded = False
 
-    def update(self, dt, screen_width):
+    def update(self, dt, screen_width, screen_height):
         """Update warship position"""
         if not self.active or self.exploded:
             return
@@ -185,6 +298,10 @@ class Warship:
 class Snake:
     """Represents a snake that moves in a smooth serpentine pattern across the screen"""
 
+    __slots__ = ('x', 'y', 'direction', 'speed', 'width', 'height', 'wave_amplitude', 'wave_frequency',
+                 'wave_time', 'base_y', 'active', 'exploded', 'num_segments', 'segment_positions',
+                 'segment_spacing')
+
     def __init__(self, x, y, direction=1, speed=100, base_width=400, base_height=60, wave_amplitude=100, wave_frequency=2.0):
         self.direction = direction  # 1 for right, -1 for left
         self.speed = speed
@@ -227,7 +344,7 @@ class Snake:
         head_x += self.direction * self.speed * dt
         
         # Calculate head Y position with sinusoidal wave
-        wave_y = self.base_y + self.wave_amplitude * math.sin(self.wave_time * self.wave_frequency)
+        wave_y = self.base_y + self.wave_amplitude * sin(self.wave_time * self.wave_frequency)
         
         # Keep Y within screen bounds
         max_y = screen_height - self.height / 2 - 50
@@ -245,7 +362,7 @@ class Snake:
             # Calculate direction to previous segment
             dx = prev_x - curr_x
             dy = prev_y - curr_y
-            distance = math.sqrt(dx * dx + dy * dy)
+            distance = sqrt(dx * dx + dy * dy)
             
             # Move current segment towards previous segment
             if distance > self.segment_spacing:
@@ -281,14 +398,14 @@ class Snake:
 
         # Check collision with each segment
         segment_radius = self.height / 2
-        bubble_radius = bubble.radius
+        hit_distance = bubble.radius + segment_radius
+        hit_distance_sq = hit_distance * hit_distance
         
         for seg_x, seg_y in self.segment_positions:
             dx = bubble.x - seg_x
             dy = bubble.y - seg_y
-            distance = math.sqrt(dx * dx + dy * dy)
             
-            if distance <= (bubble_radius + segment_radius):
+            if dx * dx + dy * dy <= hit_distance_sq:
                 return True
         
         return False
@@ -297,6 +414,8 @@ class Snake:
 class Balloon:
     """Represents a balloon that drops from the top"""
 
+    __slots__ = ('x', 'y', 'speed', 'width', 'height', 'active', 'exploded')
+
     def __init__(self, x, y, speed=100):
         self.x = x
         self.y = y
@@ -306,7 +425,7 @@ class Balloon:
         self.active = True
         self.exploded = False
 
-    def update(self, dt, screen_height):
+    def update(self, dt, screen_width, screen_height):
         """Update balloon position"""
         if not self.active or self.exploded:
             return
@@ -341,11 +460,15 @@ class Balloon:
 class Bubble:
     """Represents a single bubble"""
     
+    __slots__ = ('x', 'y', 'radius', 'element_type', 'color', 'vx', 'vy', 'attached', 'hit_count',
+                 'has_dynamite', 'has_mine', 'has_golden', 'is_rock', 'has_diamond', 'showing_diamond',
+                 'diamond_show_timer', 'falling', 'gravity')
+    
     def __init__(self, x, y, element_type=None, radius=20):
         self.x = x
         self.y = y
         self.radius = radius
-        self.element_type = element_type if element_type is not None else random.randint(0, 3)
+        self.element_type = element_type if element_type is not None else randint(0, 3)
         self.color = ELEMENT_COLORS[self.element_type]
         self.vx = 0  # velocity x
         self.vy = 0  # velocity y
@@ -372,6 +495,30 @@ class Bubble:
             self.x += self.vx * dt
             self.y += self.vy * dt
     
+    def update_shot(self, dt, screen_width, screen_height):
+        """Move a shot bubble and bounce it off the side and top walls (returns False once it leaves the bottom)"""
+        radius = self.radius
+        x = self.x + self.vx * dt
+        y = self.y + self.vy * dt
+        
+        # Check wall collisions
+        if x - radius < 0:
+            x = radius
+            self.vx = -self.vx * 0.8  # Bounce with damping
+        elif x + radius > screen_width:
+            x = screen_width - radius
+            self.vx = -self.vx * 0.8
+        
+        # Check top collision (bubble going above screen - bounce off top where bubbles are)
+        if y + radius > screen_height:
+            y = screen_height - radius
+            self.vy = -self.vy * 0.8
+        
+        self.x = x
+        self.y = y
+        # Bubble going below screen is removed (shooter is at bottom)
+        return y - radius >= 0
+    
     def get_color(self):
         """Get color tuple for drawing"""
         if self.is_rock:
@@ -382,16 +529,136 @@ class Bubble:
         """Check collision with another bubble"""
         dx = self.x - other.x
         dy = self.y - other.y
-        distance = math.sqrt(dx * dx + dy * dy)
-        min_distance = self.radius + other.radius
+        min_distance = self.radius + other.radius + 1.0
         # Check if they're touching or overlapping (with small tolerance)
-        return distance < min_distance + 1.0
+        return dx * dx + dy * dy < min_distance * min_distance
     
     def matches_element(self, other):
         """Check if bubbles match element type"""
         return self.element_type == other.element_type
 
 
+class ParticleSystem:
+    """Explosion particles stored as parallel arrays (index i of every array is one particle)"""
+    __slots__ = ('x', 'y', 'vx', 'vy', 'age', 'lifetime', 'size', 'colors', 'textures')
+    
+    def __init__(self):
+        self.x = array('d')
+        self.y = array('d')
+        self.vx = array('d')
+        self.vy = array('d')
+        self.age = array('d')
+        self.lifetime = array('d')
+        self.size = array('d')
+        self.colors = []  # RGB tuple per particle
+        self.textures = []  # Texture (or None) per particle
+    
+    def __len__(self):
+        return len(self.x)
+    
+    def add(self, x, y, vx, vy, lifetime, size, color, texture=None):
+        """Add a particle"""
+        self.x.append(x)
+        self.y.append(y)
+        self.vx.append(vx)
+        self.vy.append(vy)
+        self.age.append(0.0)
+        self.lifetime.append(lifetime)
+        self.size.append(size)
+        self.colors.append(color)
+        self.textures.append(texture)
+    
+    def extend(self, x, y, vxs, vys, lifetimes, sizes, colors, textures):
+        """Add a batch of particles all starting at (x, y)"""
+        count = len(vxs)
+        self.x.extend([x] * count)
+        self.y.extend([y] * count)
+        self.vx.extend(vxs)
+        self.vy.extend(vys)
+        self.age.extend([0.0] * count)
+        self.lifetime.extend(lifetimes)
+        self.size.extend(sizes)
+        self.colors.extend(colors)
+        self.textures.extend(textures)
+    
+    def drop_oldest(self, count):
+        """Remove the count oldest particles (particles are kept in spawn order)"""
+        for values in (self.x, self.y, self.vx, self.vy, self.age, self.lifetime, self.size, self.colors, self.textures):
+            del values[:count]
+    
+    def clear(self):
+        """Remove all particles"""
+        self.truncate(0)
+    
+    def truncate(self, count):
+        """Keep only the first count particles"""
+        for values in (self.x, self.y, self.vx, self.vy, self.age, self.lifetime, self.size, self.colors, self.textures):
+            del values[count:]
+    
+    def update(self, dt, gravity):
+        """Move particles, apply gravity/friction and drop expired ones"""
+        if NUMPY_AVAILABLE and self.x:
+            # Views on the arrays must be released before they can be resized
+            self.truncate(self.update_vectorized(dt, gravity))
+            return
+        
+        x = self.x
+        y = self.y
+        vx = self.vx
+        vy = self.vy
+        age = self.age
+        lifetime = self.lifetime
+        size = self.size
+        colors = self.colors
+        textures = self.textures
+        gravity_step = gravity * dt
+        
+        # Compact live particles to the front in a single pass
+        alive = 0
+        for i in range(len(x)):
+            particle_age = age[i] + dt
+            if particle_age >= lifetime[i]:
+                continue  # Expired
+            particle_vx = vx[i]
+            particle_vy = vy[i]
+            x[alive] = x[i] + particle_vx * dt
+            y[alive] = y[i] + particle_vy * dt
+            vx[alive] = particle_vx * 0.98  # Friction
+            vy[alive] = particle_vy - gravity_step  # Gravity
+            age[alive] = particle_age
+            if alive != i:
+                lifetime[alive] = lifetime[i]
+                size[alive] = size[i]
+                colors[alive] = colors[i]
+                textures[alive] = textures[i]
+            alive += 1
+        
+        if alive < len(x):
+            self.truncate(alive)
+    
+    def update_vectorized(self, dt, gravity):
+        """NumPy version of update() on views of the arrays, returns the number of live particles"""
+        x, y, vx, vy, age, lifetime, size = [
+            np.frombuffer(values) for values in (self.x, self.y, self.vx, self.vy, self.age, self.lifetime, self.size)
+        ]
+        x += vx * dt
+        y += vy * dt
+        vx *= 0.98  # Friction
+        vy -= gravity * dt  # Gravity
+        age += dt
+        
+        # Compact live particles to the front
+        alive = age < lifetime
+        count = int(alive.sum())
+        if count < len(alive):
+            for values in (x, y, vx, vy, age, lifetime, size):
+                values[:count] = values[alive]
+            keep = np.flatnonzero(alive).tolist()
+            self.colors[:count] = [self.colors[i] for i in keep]
+            self.textures[:count] = [self.textures[i] for i in keep]
+        return count
+
+
 class BubbleShooterGame(Widget):
     """Main game widget with enhanced 3D graphics"""
     
@@ -426,17 +693,56 @@ class BubbleShooterGame(Widget):
         self.grid_spacing = self.base_grid_spacing
         self.grid_start_x = self.base_grid_start_x
         self.grid_start_y = self.base_grid_start_y
+        self.update_grid_metrics()
         
         # Game state
         self.score = 0
         self.level = level_config['level_number']
         self.level_name = level_config['name']
+        self.active_enemy_specs = active_enemy_specs(self.level)
         self.game_active = True
         self.max_shots = level_config['max_shots']
         self.shots_remaining = level_config['shots_remaining']
         self.diamond_storage = 0  # Number of diamonds collected
         self.is_loading = False  # Loading state for restart/level transition
         self.level_just_loaded = False  # Flag to prevent auto-shooting after level load
+        self._dirty = True  # Canvas needs rebuilding (see mark_dirty)
+        self.physics_time_accum = 0.0  # Unsimulated time carried over to the next frame
+        
+        # Persistent canvas layers - background, grid and UI are only rebuilt when they change,
+        # everything else (shots, enemies, shooter, particles) is redrawn on dirty frames
+        self.background_layer = Canvas()
+        self.grid_layer = Canvas()
+        self.dynamic_layer = Canvas()
+        self.ui_layer = Canvas()
+        self.canvas.add(self.background_layer)
+        self.canvas.add(self.grid_layer)
+        self.canvas.add(self.dynamic_layer)
+        self.canvas.add(self.ui_layer)
+        self._background_dirty = True
+        self._grid_dirty = True
+        self._ui_state = None  # Values shown by the UI layer when it was last built
+        
+        # Spatial hash of on-screen grid bubbles for shot collision (rebuilt after grid changes)
+        self._spatial = {}
+        self._spatial_cell = 1.0
+        self._spatial_dirty = True
+        
+        # Grid bubble positions/radii as NumPy arrays for vectorized intersection checks
+        self._grid_arrays = None
+        
+        # Bumped on every grid change so per-frame results can be reused while it stays the same
+        self._grid_version = 0
+        self._laser_hit = None  # (signature, hit_x, hit_y) from the last frame
+        
+        # Set mirror of grid_bubbles for O(1) membership checks during removals
+        self._grid_set = None
+        
+        # Grid bubbles sorted by y (with their y values) for row lookups
+        self._grid_rows = None
+        
+        # All grid bubbles bucketed by neighbor distance for match/connection searches
+        self._neighbor_hash = None
         
         # Save/load system using JsonStore (works on Android)
         self.save_store = JsonStore('player_profile.json')
@@ -475,98 +781,120 @@ class BubbleShooterGame(Widget):
         # Bind to size changes for responsive scaling
         self.bind(size=self.on_size, pos=self.on_size)
         
+        # Asset directories to search (computed once) and resolved asset paths by filename
+        self.asset_dirs = [
+            "asset",  # Relative path (works on Android)
+            os.path.join(".", "asset"),  # Current directory
+            os.path.join(os.path.dirname(__file__), "asset"),  # Same dir as game.py
+            os.path.join(os.getcwd(), "asset"),  # Current working directory
+        ]
+        self.asset_path_cache = {}
+        self.scan_asset_dirs()
+        
         # Background image
         self.background_texture = None
         self.load_background_image()
         
-        # Dynamite image
-        self.dynamite_texture = None
-        self.load_dynamite_image()
+        # Sprite atlas - sprite loaders collect their processed images here and
+        # build_sprite_atlas() packs them into a single texture (one texture bind)
+        self.sprite_atlas = None
+        self.sprite_images = {}
+        self.collect_sprite_images = PIL_AVAILABLE
         
-        # Mine image
+        # Sprite textures (assigned by the loaders / build_sprite_atlas)
+        self.dynamite_texture = None
         self.mine_texture = None
-        self.load_mine_image()
-        
-        # Gold bubble image
-        self.gold_texture = None
-        self.load_gold_image()
-        
-        # Fighter jet image
-        self.jet_texture = None
-        self.load_jet_image()
-        
-        # Helicopter image
+        self.gold_texture = None  # Gold bubble image
+        self.jet_texture = None  # Fighter jet image
         self.helicopter_texture = None
-        self.load_helicopter_image()
-
-        # Warship image (loaded lazily in draw_warship)
         self.warship_texture = None
-
-        # Rock image
+        self.warship_mirrored = None  # (texture, mirrored tex_coords) for a warship moving left
+        self.balloon_texture = None
         self.rock_texture = None
-        self.load_rock_image()
-
-        # Diamond image
         self.diamond_texture = None
-        self.load_diamond_image()
+        # Bubble sprites are needed on every level; enemy sprites only once that enemy can appear
+        # (the rest are loaded on first draw by load_sprite_once)
+        sprite_names = ['dynamite', 'mine', 'gold', 'rock', 'diamond']
+        sprite_names += [ENEMY_SPRITES[spec[0]] for spec in self.active_enemy_specs if spec[0] in ENEMY_SPRITES]
+        self.loaded_sprites = set(sprite_names)
+        sprite_loaders = [getattr(self, f"load_{name}_image") for name in sprite_names]
+        if self.collect_sprite_images:
+            # While collecting for the atlas the loaders only decode/process PIL images (which
+            # releases the GIL), so they run in parallel - textures are created on this thread
+            with ThreadPoolExecutor(max_workers=SPRITE_LOADER_THREADS) as executor:
+                for future in [executor.submit(loader) for loader in sprite_loaders]:
+                    future.result()
+        else:
+            # Loaders create Kivy textures directly - keep them on the main thread
+            for loader in sprite_loaders:
+                loader()
+
+        # Pack all collected sprite images into one atlas texture
+        self.build_sprite_atlas()
 
         # Background music
         self.background_music = None
         self.load_background_music()
         
         # Sound effects for bubble explosions
-        self.sound_one_bubble = None
-        self.sound_two_bubbles = None
-        self.sound_four_bubbles = None
-        self.sound_nice_shot = None
-        self.sound_diamond = None
+        self.sfx_pool = {}  # Effect name -> deque of preloaded sound copies
         self.load_explosion_sounds()
-        self.load_diamond_sound()
         
         # Enhanced graphics system
         self.graphics_enhancer = None
-        self.bubble_textures = {}  # Cache for bubble textures
-        self.bazooka_textures = {}  # Cache for bazooka textures
+        # Generated texture caches (LRU, see get_cached_texture / cache_texture)
+        self.bubble_textures = OrderedDict()  # Cache for bubble textures
+        self.fallback_bubble_fbos = OrderedDict()  # Pre-rendered basic bubbles when enhanced graphics are unavailable
+        self.bazooka_textures = OrderedDict()  # Cache for bazooka textures
+        self.label_textures = OrderedDict()  # Rendered text, keyed by (text, font size, color)
+        self.bazooka = None  # (Canvas, Translate, rotations) built by build_bazooka
+        self.bazooka_key = None
+        self.enemy_shape_fbos = OrderedDict()  # Pre-rendered basic-shape jets/helicopters when enhanced graphics are unavailable
         if GRAPHICS_ENHANCER_AVAILABLE:
             self.graphics_enhancer = GraphicsEnhancer()
             self.graphics_enhancer.set_scale(self.scale)
         
         # Particle effects for explosions
-        self.particles = []  # List of particle dictionaries
+        self.particles = ParticleSystem()  # Particle arrays (see ParticleSystem)
+        
+        # Enemy spawn height range (recalculated in on_size)
+        self.enemy_min_spawn_y = 1200
+        self.enemy_max_spawn_y = self.height * 0.85
         
         # Airplane (for levels > 7, but testing on level 1)
         self.airplane = None
         self.airplane_spawn_timer = 0
-        self.airplane_spawn_interval = random.uniform(2.0, 5.0)  # Random spawn interval (2-5 seconds) - faster for testing
+        self.airplane_spawn_interval = uniform(2.0, 5.0)  # Random spawn interval (2-5 seconds) - faster for testing
         self.airplane_texture = None  # Cache for airplane texture
         
         # Helicopter (for levels >= 10)
         self.helicopter = None
         self.helicopter_spawn_timer = 0
-        self.helicopter_spawn_interval = random.uniform(3.0, 6.0)  # Random spawn interval (3-6 seconds)
+        self.helicopter_spawn_interval = uniform(3.0, 6.0)  # Random spawn interval (3-6 seconds)
 
         # Warship (for levels >= 20, but testing in level 1)
         self.warship = None
         self.warship_spawn_timer = 0
-        self.warship_spawn_interval = random.uniform(4.0, 8.0)  # Random spawn interval (4-8 seconds)
-        self.warship_texture = None  # Cache for warship texture
+        self.warship_spawn_interval = uniform(4.0, 8.0)  # Random spawn interval (4-8 seconds)
 
         # Balloon (for levels > 30, but testing in level 1)
         self.balloon = None
         self.balloon_spawn_timer = 0
-        self.balloon_spawn_interval = random.uniform(5.0, 10.0)  # Random spawn interval (5-10 seconds)
-        self.balloon_texture = None  # Cache for balloon texture
+        self.balloon_spawn_interval = uniform(5.0, 10.0)  # Random spawn interval (5-10 seconds)
 
         # Snake (for levels > 10)
         self.snake = None
         self.snake_spawn_timer = 0
-        self.snake_spawn_interval = random.uniform(6.0, 12.0)  # Random spawn interval (6-12 seconds)
+        self.snake_spawn_interval = uniform(6.0, 12.0)  # Random spawn interval (6-12 seconds)
         
         # Call on_size immediately and also after a short delay to ensure window size is set
         # This ensures scaling works even if window size is already available
         self.on_size()
         from kivy.clock import Clock
         Clock.schedule_once(lambda dt: self.on_size(), 0.1)
+        
+        # Import the remaining level modules in the background so level transitions don't hitch
+        threading.Thread(target=self.preload_levels, daemon=True).start()
 
         # Note: on_touch_down, on_touch_move, on_touch_up are automatically
         # connected by Kivy when using these method names
@@ -608,10 +936,65 @@ class BubbleShooterGame(Widget):
         # Save profile
         self.save_profile()
     
+    def mark_dirty(self):
+        """Flag the canvas to be rebuilt on the next update"""
+        self._dirty = True
+    
+    def mark_grid_dirty(self):
+        """Flag the grid layer to be rebuilt (call whenever grid bubbles are added, removed or changed)"""
+        self._grid_dirty = True
+        self._spatial_dirty = True
+        self._grid_arrays = None
+        self._grid_set = None
+        self._grid_rows = None
+        self._neighbor_hash = None
+        self._grid_version += 1
+        self._dirty = True
+    
+    def rebuild_static_layers(self, include_grid=True):
+        """Rebuild the background and grid layers (and the bazooka graphics) if they changed"""
+        # Built outside any active canvas, draw_shooter only moves and rotates it
+        if self.bazooka_key != (self.bubble_radius, self.scale):
+            self.build_bazooka()
+        if self._background_dirty:
+            self._background_dirty = False
+            self.background_layer.clear()
+            with self.background_layer:
+                self.draw_background()
+        if include_grid and self._grid_dirty:
+            self._grid_dirty = False
+            self.grid_layer.clear()
+            with self.grid_layer:
+                self.draw_grid()
+    
+    def rebuild_ui_layer(self):
+        """Rebuild the UI overlay only when a value it shows has changed"""
+        ui_state = (self.score, self.total_score, self.shots_remaining, self.max_shots, self.level,
+                    self.diamond_storage, self.game_active, not self.grid_bubbles,
+                    self.diamond_texture is not None, self.width, self.height)
+        if ui_state == self._ui_state:
+            return
+        self._ui_state = ui_state
+        self.ui_layer.clear()
+        with self.ui_layer:
+            self.draw_ui()
+    
+    def is_animating(self):
+        """Check if anything on screen moves on its own (needs a redraw every frame)"""
+        if self.particles or self.shot_bubbles or self.falling_bubbles:
+            return True
+        for enemy in (self.airplane, self.helicopter, self.warship, self.snake, self.balloon):
+            if enemy is not None and enemy.active:
+                return True
+        return False
+    
     def on_size(self, *args):
         """Handle screen size changes - scale all game elements proportionally"""
         if self.width == 0 or self.height == 0:
             return
+        self.mark_dirty()
+        self._background_dirty = True
+        self.mark_grid_dirty()
         
         # Calculate scale factors based on base resolution
         scale_x = self.width / self.base_width
@@ -641,6 +1024,10 @@ class BubbleShooterGame(Widget):
         self.shooter_x = self.width / 2
         self.shooter_y = self.base_shooter_y * scale_y
         
+        # Enemy spawn height range: minimum 1200 in base resolution, up to 85% of screen height
+        self.enemy_min_spawn_y = 1200 * scale_y
+        self.enemy_max_spawn_y = self.height * 0.85
+        
         # Always reinitialize grid with scaled values
         # Store game state
         old_score = self.score
@@ -669,23 +1056,36 @@ class BubbleShooterGame(Widget):
             self.next_bubble.radius = self.bubble_radius
         
         # Update graphics enhancer scale
+        # Bubble textures are keyed by scale bin, so the cache survives resizes
         if self.graphics_enhancer:
             self.graphics_enhancer.set_scale(self.scale)
-            # Clear texture cache to regenerate at new scale
-            self.bubble_textures.clear()
         
         # Load next bubble if needed
         if self.next_bubble is None:
             self.load_next_bubble()
         
+    def update_grid_metrics(self):
+        """Cache hex grid row height, spacing-derived tolerances and inverses (call whenever grid_spacing changes)"""
+        self.grid_row_height = self.grid_spacing * 0.866  # Hex rows are spaced by sin(60)
+        self.grid_half_spacing = self.grid_spacing * 0.5  # Odd row x offset (also the top row tolerance)
+        self.grid_row_tolerance = self.grid_spacing * 0.4  # Same-row tolerance for line explosions
+        self.grid_neighbor_distance = self.grid_spacing * 1.1  # Slightly larger than grid spacing
+        self.grid_inv_spacing = 1.0 / self.grid_spacing
+        self.grid_inv_row_height = 1.0 / self.grid_row_height
+    
     def initialize_grid(self):
         """Create initial bubble grid - ensures no intersections"""
         self.grid_bubbles = []
+        self.mark_grid_dirty()
         
         # Ensure grid spacing is sufficient (minimum 2 * radius)
         min_spacing = self.bubble_radius * 2.05  # Slightly more than 2 * radius (reduced for closer spacing)
         if self.grid_spacing < min_spacing:
             self.grid_spacing = min_spacing
+        # Hex lattice neighbours are exactly grid_spacing apart, so with spacing >= 2 * radius
+        # grid bubbles can never intersect - no per-bubble intersection check is needed
+        assert self.grid_spacing >= self.bubble_radius * 2
+        self.update_grid_metrics()
         
         # Check if level has custom pattern method
         has_custom_pattern = hasattr(self.current_level, 'should_place_bubble')
@@ -709,9 +1109,9 @@ class BubbleShooterGame(Widget):
                         continue  # Skip this position based on custom pattern
                 
                 # Offset every other row for hexagonal pattern
-                x_offset = (self.grid_spacing * 0.5) if (row % 2 == 1) else 0
+                x_offset = self.grid_half_spacing if (row % 2 == 1) else 0
                 x = self.grid_start_x + col * self.grid_spacing + x_offset
-                y = self.grid_start_y - row * self.grid_spacing * 0.866
+                y = self.grid_start_y - row * self.grid_row_height
                 
                 # Skip bubbles that would extend beyond screen boundaries (only if width/height are known)
                 if self.width > 0 and self.height > 0:
@@ -732,38 +1132,36 @@ class BubbleShooterGame(Widget):
                 if self.shooter_x is not None and self.shooter_y is not None:
                     dx = x - self.shooter_x
                     dy = y - self.shooter_y
-                    distance_to_shooter = math.sqrt(dx * dx + dy * dy)
                     min_distance_from_shooter = 400 * self.scale  # 400 pixels minimum margin
-                    if distance_to_shooter < min_distance_from_shooter:
+                    if dx * dx + dy * dy < min_distance_from_shooter * min_distance_from_shooter:
                         continue  # Skip this bubble if too close to shooter
                 
-                element = random.randint(0, 3)
+                element = randint(0, 3)
                 bubble = Bubble(x, y, element, self.bubble_radius)
                 bubble.attached = True
                 
                 # Randomly assign dynamite to ~8% of bubbles
-                if random.random() < 0.08:
+                if random_float() < 0.08:
                     bubble.has_dynamite = True
                 
                 # Randomly assign mines to ~6% of bubbles (only for level > 2)
                 # Mines and dynamite are mutually exclusive
                 if self.level > 2 and not bubble.has_dynamite:
-                    if random.random() < 0.06:
+                    if random_float() < 0.06:
                         bubble.has_mine = True
                 
                 # Randomly assign golden bubbles to ~5% of bubbles (only for level > 5)
                 # Golden bubbles are mutually exclusive with dynamite and mines
                 if self.level > 5 and not bubble.has_dynamite and not bubble.has_mine:
-                    if random.random() < 0.05:
+                    if random_float() < 0.05:
                         bubble.has_golden = True
                 
-                # Verify no intersection before adding
-                if not self.check_bubble_intersections(bubble):
-                    self.grid_bubbles.append(bubble)
+                # Lattice placement cannot intersect (see spacing assertion above)
+                self.grid_bubbles.append(bubble)
         
         # Assign rocks (for levels <= 5)
         if self.level <= 5 and len(self.grid_bubbles) > 0:
-            num_rocks = random.randint(3, 5)
+            num_rocks = randint(3, 5)
             
             # Randomly select bubbles to be rocks
             # Don't mark bubbles that already have dynamite, mines, or golden
@@ -777,7 +1175,7 @@ class BubbleShooterGame(Widget):
                     bubble.is_rock = True
                 
                 # Assign diamonds to 20-50% of rocks randomly
-                diamond_chance = random.uniform(0.2, 0.5)  # 20-50% chance
+                diamond_chance = uniform(0.2, 0.5)  # 20-50% chance
                 num_diamonds = max(1, int(len(rocks_to_assign) * diamond_chance))  # At least 1 if any rocks
                 num_diamonds = min(num_diamonds, len(rocks_to_assign))  # Don't exceed number of rocks
                 
@@ -787,13 +1185,14 @@ class BubbleShooterGame(Widget):
                     bubble.has_diamond = True
                 
                 # Debug: print number of rocks and diamonds assigned
-                print(f"Assigned {len(rocks_to_assign)} rocks in level {self.level}, {len(diamonds_to_assign)} with diamonds")
+                if DEBUG_LOG:
+                    print(f"Assigned {len(rocks_to_assign)} rocks in level {self.level}, {len(diamonds_to_assign)} with diamonds")
     
     def load_next_bubble(self):
         """Load next bubble to shoot"""
         if self.shooter_x is None or self.shooter_y is None:
             return
-        element = random.randint(0, 3)
+        element = randint(0, 3)
         self.next_bubble = Bubble(self.shooter_x, self.shooter_y, element, self.bubble_radius)
         self.current_bubble = self.next_bubble
     
@@ -818,18 +1217,23 @@ class BubbleShooterGame(Widget):
             # Calculate direction toward touch point and update aim angle (aiming only)
             dx = touch.x - self.shooter_x
             dy = touch.y - self.shooter_y
-            distance = math.sqrt(dx * dx + dy * dy)
+            distance = hypot(dx, dy)
             
             if distance > 10:  # Minimum distance to aim
-                # Update aim angle (just aiming, not shooting yet)
-                self.aim_angle = math.degrees(math.atan2(dy, dx))
+                # Unit aim direction straight from the touch vector (no degrees/radians round-trip)
+                inv_distance = 1.0 / distance
+                cos_a = dx * inv_distance
+                sin_a = dy * inv_distance
+                
+                # Update aim angle (used for drawing the bazooka)
+                self.aim_angle = degrees(atan2(dy, dx))
+                self.mark_dirty()
                 
                 # Set bubble position at back of bazooka (update position while aiming)
-                angle_rad = math.radians(self.aim_angle)
                 base_radius = self.bubble_radius * 0.85  # Match the base radius used in drawing
                 bubble_offset = base_radius * 0.8  # Position bubble slightly forward from base center
-                self.current_bubble.x = self.shooter_x + math.cos(angle_rad) * bubble_offset
-                self.current_bubble.y = self.shooter_y + math.sin(angle_rad) * bubble_offset
+                self.current_bubble.x = self.shooter_x + cos_a * bubble_offset
+                self.current_bubble.y = self.shooter_y + sin_a * bubble_offset
                 
                 return True
         except Exception as e:
@@ -840,7 +1244,8 @@ class BubbleShooterGame(Widget):
         """Handle touch move - update aim angle (for visual feedback)"""
         dx = touch.x - self.shooter_x
         dy = touch.y - self.shooter_y
-        self.aim_angle = math.degrees(math.atan2(dy, dx))
+        self.aim_angle = degrees(atan2(dy, dx))
+        self.mark_dirty()
         return super().on_touch_move(touch)
     
     def on_touch_up(self, touch, *args):
@@ -862,33 +1267,38 @@ class BubbleShooterGame(Widget):
             # Calculate direction toward touch point
             dx = touch.x - self.shooter_x
             dy = touch.y - self.shooter_y
-            distance = math.sqrt(dx * dx + dy * dy)
+            distance = hypot(dx, dy)
             
             if distance > 10:  # Minimum distance to shoot
                 # Check if player has shots remaining
                 if self.shots_remaining <= 0:
                     return super().on_touch_up(touch, *args)
                 
-                # Update aim angle one final time
-                self.aim_angle = math.degrees(math.atan2(dy, dx))
+                # Unit aim direction straight from the touch vector (no degrees/radians round-trip)
+                inv_distance = 1.0 / distance
+                cos_a = dx * inv_distance
+                sin_a = dy * inv_distance
+                
+                # Update aim angle one final time (used for drawing the bazooka)
+                self.aim_angle = degrees(atan2(dy, dx))
                 
                 # Set bubble position at back of bazooka before shooting
-                angle_rad = math.radians(self.aim_angle)
                 base_radius = self.bubble_radius * 0.85  # Match the base radius used in drawing
                 bubble_offset = base_radius * 0.8  # Position bubble slightly forward from base center
-                self.current_bubble.x = self.shooter_x + math.cos(angle_rad) * bubble_offset
-                self.current_bubble.y = self.shooter_y + math.sin(angle_rad) * bubble_offset
+                self.current_bubble.x = self.shooter_x + cos_a * bubble_offset
+                self.current_bubble.y = self.shooter_y + sin_a * bubble_offset
                 
-                # Normalize direction and set velocity (scaled)
+                # Set velocity along the normalized direction (scaled)
                 speed = self.base_bubble_speed * self.scale
-                self.current_bubble.vx = (dx / distance) * speed
-                self.current_bubble.vy = (dy / distance) * speed
+                self.current_bubble.vx = cos_a * speed
+                self.current_bubble.vy = sin_a * speed
                 
                 # Shoot the bubble
                 bubble_to_shoot = self.current_bubble
                 self.current_bubble = None
                 self.shot_bubbles.append(bubble_to_shoot)
                 self.shots_remaining -= 1  # Decrement shots remaining
+                self.mark_dirty()
                 
                 # Only load next bubble if game is still active and shots remain
                 if self.shots_remaining > 0:
@@ -976,6 +1386,7 @@ class BubbleShooterGame(Widget):
         self.score = 0
         self.level = level_config['level_number']  # Update level number
         self.level_name = level_config['name']  # Update level name
+        self.active_enemy_specs = active_enemy_specs(self.level)  # Enemies that can appear on this level
         self.game_active = True
         self.is_loading = False
         self.max_shots = level_config['max_shots']
@@ -999,22 +1410,22 @@ class BubbleShooterGame(Widget):
         # Reset helicopter
         self.helicopter = None
         self.helicopter_spawn_timer = 0
-        self.helicopter_spawn_interval = random.uniform(3.0, 6.0)
+        self.helicopter_spawn_interval = uniform(3.0, 6.0)
 
         # Reset warship
         self.warship = None
         self.warship_spawn_timer = 0
-        self.warship_spawn_interval = random.uniform(4.0, 8.0)
+        self.warship_spawn_interval = uniform(4.0, 8.0)
 
         # Reset balloon
         self.balloon = None
         self.balloon_spawn_timer = 0
-        self.balloon_spawn_interval = random.uniform(5.0, 10.0)
+        self.balloon_spawn_interval = uniform(5.0, 10.0)
 
         # Reset snake
         self.snake = None
         self.snake_spawn_timer = 0
-        self.snake_spawn_interval = random.uniform(6.0, 12.0)
+        self.snake_spawn_interval = uniform(6.0, 12.0)
 
         # Reset falling bubbles (rocks)
         self.falling_bubbles = []
@@ -1036,208 +1447,95 @@ class BubbleShooterGame(Widget):
         # Clear the flag after a short delay to allow normal gameplay
         Clock.schedule_once(lambda dt: setattr(self, 'level_just_loaded', False), 0.3)
     
+    def preload_levels(self):
+        """Import all level modules and cache their classes (runs in a background thread)"""
+        for mod_name, cls_name in LEVEL_MODULES.values():
+            if mod_name in _level_class_cache:
+                continue
+            try:
+                _level_class_cache[mod_name] = getattr(importlib.import_module(mod_name), cls_name)
+            except Exception as e:
+                print(f"Error preloading {mod_name}: {e}")
+    
     def next_level(self):
         """Advance to next level"""
-        # Get current level number and advance to next level
+        # Get current level number and look up the next level
         current_level_num = self.current_level.level_number
-        
-        if current_level_num == 1:
-            # Advance to Level 2
-            from levels.level2 import Level2
-            self.current_level = Level2()
-        elif current_level_num == 2:
-            # Advance to Level 3
-            from levels.level3 import Level3
-            self.current_level = Level3()
-        elif current_level_num == 3:
-            # Advance to Level 4
-            from levels.level4 import Level4
-            self.current_level = Level4()
-        elif current_level_num == 4:
-            # Advance to Level 5
-            from levels.level5 import Level5
-            self.current_level = Level5()
-        elif current_level_num == 5:
-            # Advance to Level 6
-            from levels.level6 import Level6
-            self.current_level = Level6()
-        elif current_level_num == 6:
-            # Advance to Level 7
-            from levels.level7 import Level7
-            self.current_level = Level7()
-        elif current_level_num == 7:
-            # Advance to Level 8
-            from levels.level8 import Level8
-            self.current_level = Level8()
-        elif current_level_num == 8:
-            # Advance to Level 9
-            from levels.level9 import Level9
-            self.current_level = Level9()
-        elif current_level_num == 9:
-            # Advance to Level 10
-            from levels.level10 import Level10
-            self.current_level = Level10()
-        elif current_level_num == 10:
-            # Advance to Level 11
-            from levels.level11 import Level11
-            self.current_level = Level11()
-        elif current_level_num == 11:
-            # Advance to Level 12
-            from levels.level12 import Level12
-            self.current_level = Level12()
-        elif current_level_num == 12:
-            # Advance to Level 13
-            from levels.level13 import Level13
-            self.current_level = Level13()
-        elif current_level_num == 13:
-            # Advance to Level 14
-            from levels.level14 import Level14
-            self.current_level = Level14()
-        elif current_level_num == 14:
-            # Advance to Level 15
-            from levels.level15 import Level15
-            self.current_level = Level15()
-        elif current_level_num == 15:
-            # Advance to Level 16
-            from levels.level16 import Level16
-            self.current_level = Level16()
-        elif current_level_num == 16:
-            # Advance to Level 17
-            from levels.level17 import Level17
-            self.current_level = Level17()
-        elif current_level_num == 17:
-            # Advance to Level 18
-            from levels.level18 import Level18
-            self.current_level = Level18()
-        elif current_level_num == 18:
-            # Advance to Level 19
-            from levels.level19 import Level19
-            self.current_level = Level19()
-        elif current_level_num == 19:
-            # Advance to Level 20
-            from levels.level20 import Level20
-            self.current_level = Level20()
-        elif current_level_num == 20:
-            # Advance to Level 21
-            from levels.level21 import Level21
-            self.current_level = Level21()
-        elif current_level_num == 21:
-            # Advance to Level 22
-            from levels.level22 import Level22
-            self.current_level = Level22()
-        elif current_level_num == 22:
-            # Advance to Level 23
-            from levels.level23 import Level23
-            self.current_level = Level23()
-        elif current_level_num == 23:
-            # Advance to Level 24
-            from levels.level24 import Level24
-            self.current_level = Level24()
-        elif current_level_num == 24:
-            # Advance to Level 25
-            from levels.level25 import Level25
-            self.current_level = Level25()
-        elif current_level_num == 25:
-            # Advance to Level 26
-            from levels.level26 import Level26
-            self.current_level = Level26()
-        elif current_level_num == 26:
-            # Advance to Level 27
-            from levels.level27 import Level27
-            self.current_level = Level27()
-        elif current_level_num == 27:
-            # Advance to Level 28
-            from levels.level28 import Level28
-            self.current_level = Level28()
-        elif current_level_num == 28:
-            # Advance to Level 29
-            from levels.level29 import Level29
-            self.current_level = Level29()
-        elif current_level_num == 29:
-            # Advance to Level 30
-            from levels.level30 import Level30
-            self.current_level = Level30()
-        elif current_level_num == 30:
-            # Advance to Level 31
-            from levels.level31 import Level31
-            self.current_level = Level31()
-        elif current_level_num == 31:
-            # Advance to Level 32
-            from levels.level32 import Level32
-            self.current_level = Level32()
-        elif current_level_num == 32:
-            # Advance to Level 33
-            from levels.level33 import Level33
-            self.current_level = Level33()
-        elif current_level_num == 33:
-            # Advance to Level 34
-            from levels.level34 import Level34
-            self.current_level = Level34()
-        elif current_level_num == 34:
-            # Advance to Level 35
-            from levels.level35 import Level35
-            self.current_level = Level35()
-        elif current_level_num == 35:
-            # Advance to Level 36
-            from levels.level36 import Level36
-            self.current_level = Level36()
-        elif current_level_num == 36:
-            # Advance to Level 37
-            from levels.level37 import Level37
-            self.current_level = Level37()
-        elif current_level_num == 37:
-            # Advance to Level 38
-            from levels.level38 import Level38
-            self.current_level = Level38()
-        elif current_level_num == 38:
-            # Advance to Level 39
-            from levels.level39 import Level39
-            self.current_level = Level39()
-        elif current_level_num == 39:
-            # Advance to Level 40
-            from levels.level40 import Level40
-            self.current_level = Level40()
-        elif current_level_num == 40:
-            # Final level completed! Restart Level 40
-            from levels.level40 import Level40
-            self.current_level = Level40()
-        else:
-            # Default: restart current level
-            pass
-        
+        entry = LEVEL_MODULES.get(current_level_num)
+        if entry:
+            mod_name, cls_name = entry
+            level_class = _level_class_cache.get(mod_name)
+            if level_class is None:
+                level_class = getattr(importlib.import_module(mod_name), cls_name)
+                _level_class_cache[mod_name] = level_class
+            self.current_level = level_class()
+        # Otherwise (unknown level number) restart current level
         self.restart_game()
     
     def update(self, dt):
         """Update game state (called every frame)"""
+        # Read Kivy size properties once per frame
+        screen_width = self.width
+        screen_height = self.height
+        
         # Update shooter position to bottom center of screen (rotated 180 degrees)
-        if self.height > 0:
+        if screen_height > 0:
             # Shooter position is set in on_size, don't override it here
-            self.shooter_x = self.width / 2  # Center horizontally
+            self.shooter_x = screen_width / 2  # Center horizontally
             # Grid positions are scaled in on_size, don't override them here
         
         if self.is_loading:
-            # Show loading screen
-            self.canvas.clear()
-            with self.canvas:
-                self.draw_background()
+            # Show loading screen (grid is hidden and rebuilt once the level is loaded)
+            self.rebuild_static_layers(include_grid=False)
+            self.grid_layer.clear()
+            self._grid_dirty = True
+            self.ui_layer.clear()
+            self._ui_state = None
+            self.dynamic_layer.clear()
+            with self.dynamic_layer:
                 self.draw_loading_screen()
             return
         
         if not self.game_active:
-            # Still redraw even when game is over to show game over message
-            self.canvas.clear()
-            with self.canvas:
-                self.draw_background()
-                self.draw_grid()
+            # Game over screen is static - only redraw when something changed
+            if not self._dirty:
+                return
+            self._dirty = False
+            self.rebuild_static_layers()
+            self.dynamic_layer.clear()
+            with self.dynamic_layer:
                 self.draw_falling_bubbles()  # Draw falling rocks
                 self.draw_shot_bubbles()
                 self.draw_shooter()
                 self.draw_particles()  # Draw particles on top
-                self.draw_ui()
+            self.rebuild_ui_layer()
             return
         
-        # Update grid bubbles - check for diamonds showing
-        for grid_bubble in self.grid_bubbles[:]:
+        # Anything moving at the start of the frame needs one more redraw (covers the frame it disappears)
+        was_animating = self.is_animating()
+        
+        # Advance the simulation in fixed steps (collisions don't depend on the frame rate)
+        self.physics_time_accum = min(self.physics_time_accum + dt, PHYSICS_MAX_STEPS * PHYSICS_STEP)
+        while self.physics_time_accum >= PHYSICS_STEP and self.game_active:
+            self.physics_time_accum -= PHYSICS_STEP
+            self.tick_physics(PHYSICS_STEP)
+        
+        # Skip the rebuild when nothing visible changed (idle between shots)
+        if not (self._dirty or was_animating or self.is_animating()):
+            return
+        # Keep the flag set if the game just ended so the game over screen gets drawn
+        self._dirty = not self.game_active
+        
+        self.render_frame()
+    
+    def tick_physics(self, dt):
+        """Advance bubbles, particles and enemies by one fixed physics step"""
+        screen_width = self.width
+        screen_height = self.height
+        
+        # Update grid bubbles - check for diamonds showing (dropped diamonds are removed after the loop)
+        dropped_diamonds = []
+        for grid_bubble in self.grid_bubbles:
             if grid_bubble.is_rock and grid_bubble.showing_diamond:
                 # Update diamond show timer
                 grid_bubble.diamond_show_timer -= dt
@@ -1248,16 +1546,24 @@ class BubbleShooterGame(Widget):
                     grid_bubble.attached = False
                     grid_bubble.falling = True
                     grid_bubble.vy = 0  # Start falling from rest
-                    # Remove from grid and add to falling bubbles
-                    self.grid_bubbles.remove(grid_bubble)
+                    # Add to falling bubbles (removed from grid below)
+                    dropped_diamonds.append(grid_bubble)
                     self.falling_bubbles.append(grid_bubble)
-                    print(f"Diamond started falling (has_diamond={grid_bubble.has_diamond}, showing_diamond={grid_bubble.showing_diamond})")
-        
-        # Update falling bubbles (rocks and diamonds)
-        for bubble in self.falling_bubbles[:]:
+                    if DEBUG_LOG:
+                        print(f"Diamond started falling (has_diamond={grid_bubble.has_diamond}, showing_diamond={grid_bubble.showing_diamond})")
+        if dropped_diamonds:
+            dropped_set = set(dropped_diamonds)
+            self.grid_bubbles = [b for b in self.grid_bubbles if b not in dropped_set]
+            self.mark_grid_dirty()
+        
+        # Update falling bubbles (rocks and diamonds) - keep the ones still on screen
+        still_falling = []
+        for bubble in self.falling_bubbles:
             bubble.update(dt)
             # Remove if off screen
-            if bubble.y + bubble.radius < 0:
+            if bubble.y + bubble.radius >= 0:
+                still_falling.append(bubble)
+            else:
                 # Check if it's a diamond - check both flags to be safe
                 is_diamond = False
                 if hasattr(bubble, 'has_diamond') and bubble.has_diamond:
@@ -1271,285 +1577,76 @@ class BubbleShooterGame(Widget):
                     # Add diamond to storage
                     old_storage = self.diamond_storage
                     self.diamond_storage += 1
-                    print(f"Diamond collected! Storage: {old_storage} -> {self.diamond_storage} (has_diamond={getattr(bubble, 'has_diamond', False)}, showing_diamond={getattr(bubble, 'showing_diamond', False)})")
-                self.falling_bubbles.remove(bubble)
+                    if DEBUG_LOG:
+                        print(f"Diamond collected! Storage: {old_storage} -> {self.diamond_storage} (has_diamond={getattr(bubble, 'has_diamond', False)}, showing_diamond={getattr(bubble, 'showing_diamond', False)})")
+        self.falling_bubbles = still_falling
         
         # Update particles
         self.update_particles(dt)
         
-        # Update airplane (only for levels > 7)
-        if self.level > 7:
-            # Spawn airplane if needed
-            if self.airplane is None or not self.airplane.active:
-                self.airplane_spawn_timer += dt
-                if self.airplane_spawn_timer >= self.airplane_spawn_interval:
-                    self.airplane_spawn_timer = 0
+        # Spawn and update enemies (airplane, helicopter, warship, snake, balloon)
+        # (only enemies unlocked at this level - empty on early levels)
+        for name, min_level, interval_range in self.active_enemy_specs:
+            enemy = getattr(self, name)
+            
+            # Spawn enemy if needed
+            if enemy is None or not enemy.active:
+                timer_name = name + '_spawn_timer'
+                spawn_timer = getattr(self, timer_name) + dt
+                if spawn_timer >= getattr(self, name + '_spawn_interval'):
+                    spawn_timer = 0
                     # Set next random spawn interval
-                    self.airplane_spawn_interval = random.uniform(2.0, 5.0)
-                    
-                    # Randomly choose direction (left or right)
-                    direction = random.choice([-1, 1])
-                    # Calculate minimum Y value (1200 in base resolution, scaled)
-                    min_y_base = 1200
-                    min_y_scaled = min_y_base * (self.height / self.base_height) if self.height > 0 else min_y_base
-                    # Randomly choose Y position (minimum 1200, up to 85% of screen height)
-                    max_y = self.height * 0.85
-                    y_pos = min_y_scaled + random.random() * (max_y - min_y_scaled)
-                    if direction > 0:
-                        # Moving right: start from left side
-                        x_pos = -150
-                    else:
-                        # Moving left: start from right side
-                        x_pos = self.width + 150
-                    # Fighter speed: 1.5x for levels 10-20, normal for levels 8-9
-                    base_speed = 200 * self.scale
-                    if self.level >= 10:
-                        speed = base_speed * 1.5  # 1.5x speed for levels 10-20
-                    else:
-                        speed = base_speed  # Normal speed for levels 8-9
-                    self.airplane = Airplane(x_pos, y_pos, direction, speed=speed)
-            
-            # Update airplane
-            if self.airplane and self.airplane.active:
-                self.airplane.update(dt, self.width)
+                    setattr(self, name + '_spawn_interval', uniform(*interval_range))
+                    enemy = getattr(self, 'spawn_' + name)()
+                    setattr(self, name, enemy)
+                setattr(self, timer_name, spawn_timer)
+            
+            # Update enemy
+            if enemy and enemy.active:
+                enemy.update(dt, screen_width, screen_height)
                 
-                # Check collision with shot bubbles
-                for bubble in self.shot_bubbles[:]:
-                    if self.airplane.check_collision(bubble):
-                        # Airplane hit! Explode it
-                        self.explode_airplane(self.airplane.x, self.airplane.y)
+                # Check collision with shot bubbles (only one hit per frame, so no copy is needed)
+                for i, bubble in enumerate(self.shot_bubbles):
+                    if enemy.check_collision(bubble):
+                        self.on_enemy_hit(name, enemy, bubble)
                         # Remove the bubble that hit it
-                        self.shot_bubbles.remove(bubble)
+                        del self.shot_bubbles[i]
                         break
         
-        # Update helicopter (for levels >= 10)
-        if self.level >= 10:
-            # Spawn helicopter if needed
-            if self.helicopter is None or not self.helicopter.active:
-                self.helicopter_spawn_timer += dt
-                if self.helicopter_spawn_timer >= self.helicopter_spawn_interval:
-                    self.helicopter_spawn_timer = 0
-                    # Set next random spawn interval
-                    self.helicopter_spawn_interval = random.uniform(3.0, 6.0)
-                    
-                    # Randomly choose direction (left or right)
-                    direction = random.choice([-1, 1])
-                    # Calculate minimum Y value (1200 in base resolution, scaled)
-                    min_y_base = 1200
-                    min_y_scaled = min_y_base * (self.height / self.base_height) if self.height > 0 else min_y_base
-                    # Randomly choose Y position (minimum 1200, up to 85% of screen height)
-                    max_y = self.height * 0.85
-                    y_pos = min_y_scaled + random.random() * (max_y - min_y_scaled)
-                    if direction > 0:
-                        # Moving right: start from left side
-                        x_pos = -150
-                    else:
-                        # Moving left: start from right side
-                        x_pos = self.width + 150
-                    # Helicopter speed: gradually increases from 1x at level 10 to 2x at level 20
-                    base_speed = 200 * self.scale
-                    if self.level >= 10:
-                        # Calculate speed multiplier: 1.0 at level 10, 2.0 at level 20
-                        speed_multiplier = 1.0 + (self.level - 10) * 0.1
-                        speed = base_speed * speed_multiplier
-                    else:
-                        speed = base_speed
-                    self.helicopter = Helicopter(x_pos, y_pos, direction, speed=speed)
-            
-            # Update helicopter
-            if self.helicopter and self.helicopter.active:
-                self.helicopter.update(dt, self.width)
-                
-                # Check collision with shot bubbles
-                for bubble in self.shot_bubbles[:]:
-                    if self.helicopter.check_collision(bubble):
-                        # Helicopter hit! Explode it
-                        self.explode_helicopter(self.helicopter.x, self.helicopter.y)
-                        # Remove the bubble that hit it
-                        self.shot_bubbles.remove(bubble)
-                        break
-
-        # Update warship (for levels > 20)
-        if self.level > 20:
-            # Spawn warship if needed
-            if self.warship is None or not self.warship.active:
-                self.warship_spawn_timer += dt
-                if self.warship_spawn_timer >= self.warship_spawn_interval:
-                    self.warship_spawn_timer = 0
-                    # Set next random spawn interval
-                    self.warship_spawn_interval = random.uniform(4.0, 8.0)
-
-                    # Randomly choose direction (left or right)
-                    direction = random.choice([-1, 1])
-                    # Calculate minimum Y value (1200 in base resolution, scaled)
-                    min_y_base = 1200
-                    min_y_scaled = min_y_base * (self.height / self.base_height) if self.height > 0 else min_y_base
-                    # Randomly choose Y position (minimum 1200, up to 85% of screen height)
-                    max_y = self.height * 0.85
-                    y_pos = min_y_scaled + random.random() * (max_y - min_y_scaled)
-                    if direction > 0:
-                        # Moving right: start from left side
-                        x_pos = -200
-                    else:
-                        # Moving left: start from right side
-                        x_pos = self.width + 200
-                    # Warship speed: slower than helicopter
-                    base_speed = 150 * self.scale
-                    if self.level >= 25:
-                        # Calculate speed multiplier: 1.0 at level 25, 1.5 at level 30
-                        speed_multiplier = 1.0 + (self.level - 25) * 0.1
-                        speed = base_speed * speed_multiplier
-                    else:
-                        speed = base_speed
-                    self.warship = Warship(x_pos, y_pos, direction, speed=speed)
-
-            # Update warship
-            if self.warship and self.warship.active:
-                self.warship.update(dt, self.width)
-
-                # Check collision with shot bubbles
-                for bubble in self.shot_bubbles[:]:
-                    if self.warship.check_collision(bubble):
-                        # Warship hit! Explode it
-                        self.explode_warship(self.warship.x, self.warship.y)
-                        # Remove the bubble that hit it
-                        self.shot_bubbles.remove(bubble)
-                        break
-
-        # Update snake (for levels > 30)
-        if self.level > 30:
-            # Spawn snake if needed
-            if self.snake is None or not self.snake.active:
-                self.snake_spawn_timer += dt
-                if self.snake_spawn_timer >= self.snake_spawn_interval:
-                    self.snake_spawn_timer = 0
-                    # Set next random spawn interval
-                    self.snake_spawn_interval = random.uniform(6.0, 12.0)
-
-                    # Randomly choose direction (left or right)
-                    direction = random.choice([-1, 1])
-                    # Randomly choose Y position (middle area of screen)
-                    min_y = self.height * 0.3
-                    max_y = self.height * 0.7
-                    y_pos = min_y + random.random() * (max_y - min_y)
-                    
-                    if direction > 0:
-                        # Moving right: start from left side
-                        x_pos = -200
-                    else:
-                        # Moving left: start from right side
-                        x_pos = self.width + 200
-                    
-                    # Snake size increases with level
-                    base_width = 400
-                    base_height = 60
-                    # Size multiplier: 1.0 at level 11, 1.5 at level 20, 2.0 at level 30
-                    size_multiplier = 1.0 + (self.level - 11) * 0.05
-                    width = base_width * size_multiplier * self.scale
-                    height = base_height * size_multiplier * self.scale
-                    
-                    # Snake speed: moderate speed
-                    base_speed = 100 * self.scale
-                    if self.level >= 20:
-                        # Speed increases for higher levels
-                        speed_multiplier = 1.0 + (self.level - 20) * 0.05
-                        speed = base_speed * speed_multiplier
-                    else:
-                        speed = base_speed
-                    
-                    # Random wave parameters
-                    wave_amplitude = random.uniform(80, 150) * self.scale
-                    wave_frequency = random.uniform(1.5, 3.0)
-                    
-                    self.snake = Snake(x_pos, y_pos, direction, speed, width, height, wave_amplitude, wave_frequency)
-
-            # Update snake
-            if self.snake and self.snake.active:
-                self.snake.update(dt, self.width, self.height)
-
-                # Check collision with shot bubbles (block them)
-                for bubble in self.shot_bubbles[:]:
-                    if self.snake.check_collision(bubble):
-                        # Snake blocks the bubble - remove it
-                        self.shot_bubbles.remove(bubble)
-                        # Optional: create a small impact effect
-                        self.create_explosion_particles(bubble.x, bubble.y, bubble.get_color(), particle_count=5, speed_multiplier=0.5)
-                        break
-
-        # Update balloon (for levels > 30)
-        if self.level > 30:
-            # Spawn balloon if needed
-            if self.balloon is None or not self.balloon.active:
-                self.balloon_spawn_timer += dt
-                if self.balloon_spawn_timer >= self.balloon_spawn_interval:
-                    self.balloon_spawn_timer = 0
-                    # Set next random spawn interval
-                    self.balloon_spawn_interval = random.uniform(5.0, 10.0)
-
-                    # Randomly choose X position (across the top of screen)
-                    x_pos = random.randint(int(self.width * 0.1), int(self.width * 0.9))
-                    # Start from top of screen
-                    y_pos = self.height + 100
-                    # Balloon speed: moderate falling speed
-                    base_speed = 120 * self.scale
-                    if self.level >= 35:
-                        # Calculate speed multiplier: 1.0 at level 35, 1.5 at level 40
-                        speed_multiplier = 1.0 + (self.level - 35) * 0.1
-                        speed = base_speed * speed_multiplier
-                    else:
-                        speed = base_speed
-                    self.balloon = Balloon(x_pos, y_pos, speed=speed)
-
-            # Update balloon
-            if self.balloon and self.balloon.active:
-                self.balloon.update(dt, self.height)
-
-                # Check collision with shot bubbles
-                for bubble in self.shot_bubbles[:]:
-                    if self.balloon.check_collision(bubble):
-                        # Balloon hit! Explode it
-                        self.explode_balloon(self.balloon.x, self.balloon.y)
-                        # Remove the bubble that hit it
-                        self.shot_bubbles.remove(bubble)
-                        break
-
-        # Update shot bubbles
-        for bubble in self.shot_bubbles[:]:
-            bubble.update(dt)
-            
-            # Check wall collisions
-            if bubble.x - bubble.radius < 0:
-                bubble.x = bubble.radius
-                bubble.vx = -bubble.vx * 0.8  # Bounce with damping
-            elif bubble.x + bubble.radius > self.width:
-                bubble.x = self.width - bubble.radius
-                bubble.vx = -bubble.vx * 0.8
-            
-            # Check top collision (bubble going above screen - bounce off top where bubbles are)
-            if bubble.y + bubble.radius > self.height:
-                bubble.y = self.height - bubble.radius
-                bubble.vy = -bubble.vy * 0.8
-            
-            # Check bottom collision (bubble going below screen - remove it, shooter is at bottom)
-            if bubble.y - bubble.radius < 0:
-                self.shot_bubbles.remove(bubble)
+        # Spatial hash of on-screen grid bubbles - shot bubbles stay on screen, so they can't hit hidden ones
+        spatial, cell = self.get_spatial_hash()
+        
+        # Update shot bubbles (bubbles leaving the screen are dropped after the loop;
+        # a grid collision removes the bubble and ends the loop, so the live list is safe to iterate)
+        left_screen = False
+        for bubble in self.shot_bubbles:
+            # Move and bounce off walls, bubbles going below the screen are removed
+            if not bubble.update_shot(dt, screen_width, screen_height):
+                left_screen = True
                 continue
             
-            # Check collision with grid bubbles (prevent intersection)
-            min_distance = float('inf')
+            # Check collision with grid bubbles in the 3x3 neighboring cells (prevent intersection)
+            min_distance_sq = float('inf')
             closest_bubble = None
-            
-            for grid_bubble in self.grid_bubbles:
-                dx = bubble.x - grid_bubble.x
-                dy = bubble.y - grid_bubble.y
-                distance = math.sqrt(dx * dx + dy * dy)
-                min_dist_needed = bubble.radius + grid_bubble.radius
-                
-                if distance < min_dist_needed:
-                    # Bubble is too close - attach it
-                    if distance < min_distance:
-                        min_distance = distance
-                        closest_bubble = grid_bubble
+            bx = bubble.x
+            by = bubble.y
+            br = bubble.radius
+            cell_x = int(bx // cell)
+            cell_y = int(by // cell)
+            
+            for nx in (cell_x - 1, cell_x, cell_x + 1):
+                for ny in (cell_y - 1, cell_y, cell_y + 1):
+                    for grid_bubble in spatial.get((nx, ny), ()):
+                        dx = bx - grid_bubble.x
+                        dy = by - grid_bubble.y
+                        distance_sq = dx * dx + dy * dy
+                        min_dist_needed = br + grid_bubble.radius
+                        
+                        if distance_sq < min_dist_needed * min_dist_needed:
+                            # Bubble is too close - attach it
+                            if distance_sq < min_distance_sq:
+                                min_distance_sq = distance_sq
+                                closest_bubble = grid_bubble
             
             if closest_bubble:
                 # Check if the grid bubble is a rock
@@ -1558,6 +1655,7 @@ class BubbleShooterGame(Widget):
                     if closest_bubble.has_diamond:
                         # Diamond found! Show diamond for a couple seconds before it falls
                         closest_bubble.showing_diamond = True
+                        self.mark_grid_dirty()
                         closest_bubble.diamond_show_timer = 2.0  # Show for 2 seconds
                         # Give 3 extra shots immediately when diamond is detected
                         self.shots_remaining += 3
@@ -1565,7 +1663,8 @@ class BubbleShooterGame(Widget):
                         self.create_explosion_particles(closest_bubble.x, closest_bubble.y, (0.8, 0.9, 1.0), particle_count=20, speed_multiplier=1.2)
                         # Play diamond sound
                         self.play_diamond_sound()
-                        print(f"Diamond revealed! Got 3 extra shots. It will drop and be added to storage.")
+                        if DEBUG_LOG:
+                            print(f"Diamond revealed! Got 3 extra shots. It will drop and be added to storage.")
                     else:
                         # Regular rock - make it fall immediately
                         closest_bubble.attached = False
@@ -1574,6 +1673,7 @@ class BubbleShooterGame(Widget):
                         # Remove the rock from grid and add to falling bubbles
                         self.grid_bubbles.remove(closest_bubble)
                         self.falling_bubbles.append(closest_bubble)
+                        self.mark_grid_dirty()
                         # Create small impact particles
                         self.create_explosion_particles(closest_bubble.x, closest_bubble.y, (0.5, 0.5, 0.5), particle_count=10, speed_multiplier=0.8)
                     
@@ -1583,22 +1683,21 @@ class BubbleShooterGame(Widget):
                     # Normal bubble - attach as usual
                     self.attach_bubble(bubble, closest_bubble)
                 break
-            
-            # Remove if below screen (bubble went off bottom where shooter is)
-            if bubble.y - bubble.radius < 0:
-                self.shot_bubbles.remove(bubble)
-                continue
+        
+        # Remove bubbles that went off the bottom (where shooter is)
+        if left_screen:
+            self.shot_bubbles = [b for b in self.shot_bubbles if b.y - b.radius >= 0]
         
         # Check for game over condition: all shots used, bubbles still on screen, and no bubbles moving
         if self.shots_remaining <= 0 and len(self.grid_bubbles) > 0:
             if not self.has_moving_bubbles():
                 self.game_active = False
-        
-        # Redraw
-        self.canvas.clear()
-        with self.canvas:
-            self.draw_background()
-            self.draw_grid()
+    
+    def render_frame(self):
+        """Redraw the game (static and UI layers only when changed, dynamic layer every time)"""
+        self.rebuild_static_layers()
+        self.dynamic_layer.clear()
+        with self.dynamic_layer:
             self.draw_falling_bubbles()  # Draw falling rocks
             self.draw_shot_bubbles()
             self.draw_airplane()  # Draw airplane
@@ -1608,21 +1707,151 @@ class BubbleShooterGame(Widget):
             self.draw_snake()  # Draw snake
             self.draw_shooter()
             self.draw_particles()  # Draw particles on top
-            self.draw_ui()
+        self.rebuild_ui_layer()
+    
+    def spawn_airplane(self):
+        """Create a new airplane at a random spawn position"""
+        # Randomly choose direction (left or right)
+        direction = 1 if random_float() < 0.5 else -1
+        # Randomly choose Y position (minimum 1200 scaled, up to 85% of screen height)
+        min_y = self.enemy_min_spawn_y
+        y_pos = min_y + random_float() * (self.enemy_max_spawn_y - min_y)
+        if direction > 0:
+            # Moving right: start from left side
+            x_pos = -150
+        else:
+            # Moving left: start from right side
+            x_pos = self.width + 150
+        # Fighter speed: 1.5x for levels 10-20, normal for levels 8-9
+        base_speed = 200 * self.scale
+        if self.level >= 10:
+            speed = base_speed * 1.5  # 1.5x speed for levels 10-20
+        else:
+            speed = base_speed  # Normal speed for levels 8-9
+        return Airplane(x_pos, y_pos, direction, speed=speed)
+    
+    def spawn_helicopter(self):
+        """Create a new helicopter at a random spawn position"""
+        # Randomly choose direction (left or right)
+        direction = 1 if random_float() < 0.5 else -1
+        # Randomly choose Y position (minimum 1200 scaled, up to 85% of screen height)
+        min_y = self.enemy_min_spawn_y
+        y_pos = min_y + random_float() * (self.enemy_max_spawn_y - min_y)
+        if direction > 0:
+            # Moving right: start from left side
+            x_pos = -150
+        else:
+            # Moving left: start from right side
+            x_pos = self.width + 150
+        # Helicopter speed: gradually increases from 1x at level 10 to 2x at level 20
+        base_speed = 200 * self.scale
+        if self.level >= 10:
+            # Calculate speed multiplier: 1.0 at level 10, 2.0 at level 20
+            speed_multiplier = 1.0 + (self.level - 10) * 0.1
+            speed = base_speed * speed_multiplier
+        else:
+            speed = base_speed
+        return Helicopter(x_pos, y_pos, direction, speed=speed)
+    
+    def spawn_warship(self):
+        """Create a new warship at a random spawn position"""
+        # Randomly choose direction (left or right)
+        direction = 1 if random_float() < 0.5 else -1
+        # Randomly choose Y position (minimum 1200 scaled, up to 85% of screen height)
+        min_y = self.enemy_min_spawn_y
+        y_pos = min_y + random_float() * (self.enemy_max_spawn_y - min_y)
+        if direction > 0:
+            # Moving right: start from left side
+            x_pos = -200
+        else:
+            # Moving left: start from right side
+            x_pos = self.width + 200
+        # Warship speed: slower than helicopter
+        base_speed = 150 * self.scale
+        if self.level >= 25:
+            # Calculate speed multiplier: 1.0 at level 25, 1.5 at level 30
+            speed_multiplier = 1.0 + (self.level - 25) * 0.1
+            speed = base_speed * speed_multiplier
+        else:
+            speed = base_speed
+        return Warship(x_pos, y_pos, direction, speed=speed)
+    
+    def spawn_snake(self):
+        """Create a new snake at a random spawn position"""
+        # Randomly choose direction (left or right)
+        direction = 1 if random_float() < 0.5 else -1
+        # Randomly choose Y position (middle area of screen)
+        min_y = self.height * 0.3
+        max_y = self.height * 0.7
+        y_pos = min_y + random_float() * (max_y - min_y)
+
+        if direction > 0:
+            # Moving right: start from left side
+            x_pos = -200
+        else:
+            # Moving left: start from right side
+            x_pos = self.width + 200
+
+        # Snake size increases with level
+        base_width = 400
+        base_height = 60
+        # Size multiplier: 1.0 at level 11, 1.5 at level 20, 2.0 at level 30
+        size_multiplier = 1.0 + (self.level - 11) * 0.05
+        width = base_width * size_multiplier * self.scale
+        height = base_height * size_multiplier * self.scale
+
+        # Snake speed: moderate speed
+        base_speed = 100 * self.scale
+        if self.level >= 20:
+            # Speed increases for higher levels
+            speed_multiplier = 1.0 + (self.level - 20) * 0.05
+            speed = base_speed * speed_multiplier
+        else:
+            speed = base_speed
+
+        # Random wave parameters
+        wave_amplitude = uniform(80, 150) * self.scale
+        wave_frequency = uniform(1.5, 3.0)
+        return Snake(x_pos, y_pos, direction, speed, width, height, wave_amplitude, wave_frequency)
+    
+    def spawn_balloon(self):
+        """Create a new balloon at a random spawn position"""
+        # Randomly choose X position (across the top of screen)
+        x_pos = randint(int(self.width * 0.1), int(self.width * 0.9))
+        # Start from top of screen
+        y_pos = self.height + 100
+        # Balloon speed: moderate falling speed
+        base_speed = 120 * self.scale
+        if self.level >= 35:
+            # Calculate speed multiplier: 1.0 at level 35, 1.5 at level 40
+            speed_multiplier = 1.0 + (self.level - 35) * 0.1
+            speed = base_speed * speed_multiplier
+        else:
+            speed = base_speed
+        return Balloon(x_pos, y_pos, speed=speed)
+    
+    def on_enemy_hit(self, name, enemy, bubble):
+        """Handle a shot bubble hitting an enemy"""
+        if name == 'snake':
+            # Snake blocks the bubble - create a small impact effect
+            self.create_explosion_particles(bubble.x, bubble.y, bubble.get_color(), particle_count=5, speed_multiplier=0.5)
+        else:
+            # Airplane, helicopter, warship and balloon explode
+            getattr(self, 'explode_' + name)(enemy.x, enemy.y)
     
     def has_moving_bubbles(self):
         """Check if there are any bubbles currently moving (only shot bubbles, not falling ones)"""
         # Only check shot bubbles - falling bubbles don't prevent game over
         for bubble in self.shot_bubbles:
-            # Check if bubble has significant velocity (above small threshold)
-            speed = math.sqrt(bubble.vx * bubble.vx + bubble.vy * bubble.vy)
-            if speed > 1.0:  # Threshold to account for floating point precision
+            # Check if bubble has significant velocity (above small threshold, compared squared)
+            if bubble.vx * bubble.vx + bubble.vy * bubble.vy > 1.0:  # Threshold to account for floating point precision
                 return True
         
         return False
     
     def attach_bubble(self, bubble, grid_bubble):
         """Attach shot bubble to grid at correct position without intersection"""
+        self.mark_grid_dirty()
         bubble.attached = True
         bubble.falling = False  # Attached bubbles don't fall
         bubble.vx = 0
@@ -1635,7 +1864,8 @@ class BubbleShooterGame(Widget):
             extra_score = 500  # Fixed bonus score of 500
             self.score += extra_score
             golden_bonus_given = True
-            print(f"Golden bubble hit! Extra score: {extra_score}, Total score: {self.score}")
+            if DEBUG_LOG:
+                print(f"Golden bubble hit! Extra score: {extra_score}, Total score: {self.score}")
         
         # Find the best grid position near the collision point
         new_pos = self.find_nearest_empty_grid_position(bubble, grid_bubble)
@@ -1643,7 +1873,7 @@ class BubbleShooterGame(Widget):
         bubble.y = new_pos[1]
         
         # Verify no intersections
-        if not self.check_bubble_intersections(bubble):
+        if not self.check_bubble_intersections(bubble.x, bubble.y, bubble.radius):
             self.shot_bubbles.remove(bubble)
             self.grid_bubbles.append(bubble)
             # Check for matches
@@ -1654,13 +1884,14 @@ class BubbleShooterGame(Widget):
             bubble.x = alt_pos[0]
             bubble.y = alt_pos[1]
             
-            if not self.check_bubble_intersections(bubble):
+            if not self.check_bubble_intersections(bubble.x, bubble.y, bubble.radius):
                 self.shot_bubbles.remove(bubble)
                 self.grid_bubbles.append(bubble)
                 self.check_matches(bubble)
                 # Print remaining bubbles after this shot is processed
                 remaining_count = len(self.grid_bubbles)
-                print(f"Remaining bubbles: {remaining_count}")
+                if DEBUG_LOG:
+                    print(f"Remaining bubbles: {remaining_count}")
             else:
                 # Last resort: remove the shot bubble if no valid position
                 self.shot_bubbles.remove(bubble)
@@ -1668,61 +1899,59 @@ class BubbleShooterGame(Widget):
     def find_nearest_empty_grid_position(self, bubble, reference_bubble):
         """Find the nearest valid grid position that doesn't intersect"""
         # Calculate which grid cell the bubble should snap to
-        min_distance = float('inf')
+        min_distance_sq = float('inf')  # Squared distance of best_pos from the collision point
         best_pos = None
         
         # Check positions around the reference bubble (hexagonal grid pattern)
         # Try 6 adjacent positions in hexagonal pattern
-        angles = [0, 60, 120, 180, 240, 300]
         distance = self.grid_spacing  # This should be >= 2 * radius
+        ref_x = reference_bubble.x
+        ref_y = reference_bubble.y
+        test_xs = [ref_x + cx * distance for cx, cy in HEX_NEIGHBOR_OFFSETS]
+        test_ys = [ref_y + cy * distance for cx, cy in HEX_NEIGHBOR_OFFSETS]
         
-        for angle in angles:
-            angle_rad = math.radians(angle)
-            test_x = reference_bubble.x + math.cos(angle_rad) * distance
-            test_y = reference_bubble.y + math.sin(angle_rad) * distance
-            
-            # Create temporary bubble at test position
-            test_bubble = Bubble(test_x, test_y, bubble.element_type, bubble.radius)
-            
-            # Check if this position intersects with any existing bubbles
-            if not self.check_bubble_intersections(test_bubble, exclude_bubble=bubble):
+        # Check all positions against existing bubbles at once
+        free_positions = self.find_free_positions(test_xs, test_ys, bubble.radius, exclude_bubble=bubble)
+        
+        for test_x, test_y, is_free in zip(test_xs, test_ys, free_positions):
+            # Skip positions that intersect with existing bubbles
+            if is_free:
                 # Check minimum distance from shooter (at least 400 pixels scaled)
                 too_close_to_shooter = False
                 if self.shooter_x is not None and self.shooter_y is not None:
                     dx = test_x - self.shooter_x
                     dy = test_y - self.shooter_y
-                    distance_to_shooter = math.sqrt(dx * dx + dy * dy)
                     min_distance_from_shooter = 400 * self.scale  # 400 pixels minimum margin
-                    if distance_to_shooter < min_distance_from_shooter:
+                    if dx * dx + dy * dy < min_distance_from_shooter * min_distance_from_shooter:
                         too_close_to_shooter = True
                 
                 if not too_close_to_shooter:
                     # Check distance from original collision point
-                    dist = math.sqrt((test_x - bubble.x)**2 + (test_y - bubble.y)**2)
-                    if dist < min_distance:
-                        min_distance = dist
+                    dx = test_x - bubble.x
+                    dy = test_y - bubble.y
+                    dist_sq = dx * dx + dy * dy
+                    if dist_sq < min_distance_sq:
+                        min_distance_sq = dist_sq
                         best_pos = (test_x, test_y)
         
         # If no good adjacent position found, try snapping to exact grid
         if best_pos is None:
             # Snap to nearest grid cell
-            col = round((reference_bubble.x - self.grid_start_x) / self.grid_spacing)
-            row = round((self.grid_start_y - reference_bubble.y) / (self.grid_spacing * 0.866))
+            col = round((reference_bubble.x - self.grid_start_x) * self.grid_inv_spacing)
+            row = round((self.grid_start_y - reference_bubble.y) * self.grid_inv_row_height)
             
-            x_offset = (self.grid_spacing * 0.5) if (row % 2 == 1) else 0
+            x_offset = self.grid_half_spacing if (row % 2 == 1) else 0
             x = self.grid_start_x + col * self.grid_spacing + x_offset
-            y = self.grid_start_y - row * self.grid_spacing * 0.866
+            y = self.grid_start_y - row * self.grid_row_height
             
-            test_bubble = Bubble(x, y, bubble.element_type, bubble.radius)
-            if not self.check_bubble_intersections(test_bubble, exclude_bubble=bubble):
+            if not self.check_bubble_intersections(x, y, bubble.radius, exclude_bubble=bubble):
                 # Check minimum distance from shooter (at least 400 pixels scaled)
                 too_close_to_shooter = False
                 if self.shooter_x is not None and self.shooter_y is not None:
                     dx = x - self.shooter_x
                     dy = y - self.shooter_y
-                    distance_to_shooter = math.sqrt(dx * dx + dy * dy)
                     min_distance_from_shooter = 400 * self.scale  # 400 pixels minimum margin
-                    if distance_to_shooter < min_distance_from_shooter:
+                    if dx * dx + dy * dy < min_distance_from_shooter * min_distance_from_shooter:
                         too_close_to_shooter = True
                 
                 if not too_close_to_shooter:
@@ -1739,52 +1968,151 @@ class BubbleShooterGame(Widget):
         # Try positions further away
         distances = [self.grid_spacing * 1.5, self.grid_spacing * 2.0]
         
-        for dist in distances:
-            for angle in range(0, 360, 30):
-                angle_rad = math.radians(angle)
-                test_x = reference_bubble.x + math.cos(angle_rad) * dist
-                test_y = reference_bubble.y + math.sin(angle_rad) * dist
-                
-                # Check minimum distance from shooter (at least 400 pixels scaled)
-                too_close_to_shooter = False
-                if self.shooter_x is not None and self.shooter_y is not None:
-                    dx = test_x - self.shooter_x
-                    dy = test_y - self.shooter_y
-                    distance_to_shooter = math.sqrt(dx * dx + dy * dy)
-                    min_distance_from_shooter = 400 * self.scale  # 400 pixels minimum margin
-                    if distance_to_shooter < min_distance_from_shooter:
-                        too_close_to_shooter = True
-                
-                if not too_close_to_shooter:
-                    test_bubble = Bubble(test_x, test_y, bubble.element_type, bubble.radius)
-                    if not self.check_bubble_intersections(test_bubble, exclude_bubble=bubble):
-                        return (test_x, test_y)
+        ref_x = reference_bubble.x
+        ref_y = reference_bubble.y
+        test_xs = [ref_x + cx * dist for dist in distances for cx, cy in ALT_POSITION_OFFSETS]
+        test_ys = [ref_y + cy * dist for dist in distances for cx, cy in ALT_POSITION_OFFSETS]
+        
+        # Check all positions against existing bubbles at once
+        free_positions = self.find_free_positions(test_xs, test_ys, bubble.radius, exclude_bubble=bubble)
+        
+        for test_x, test_y, is_free in zip(test_xs, test_ys, free_positions):
+            # Check minimum distance from shooter (at least 400 pixels scaled)
+            too_close_to_shooter = False
+            if self.shooter_x is not None and self.shooter_y is not None:
+                dx = test_x - self.shooter_x
+                dy = test_y - self.shooter_y
+                min_distance_from_shooter = 400 * self.scale  # 400 pixels minimum margin
+                if dx * dx + dy * dy < min_distance_from_shooter * min_distance_from_shooter:
+                    too_close_to_shooter = True
+            
+            if not too_close_to_shooter and is_free:
+                return (test_x, test_y)
         
         # Fallback: position above reference
         return (reference_bubble.x, reference_bubble.y + self.grid_spacing)
     
-    def check_bubble_intersections(self, bubble, exclude_bubble=None):
-        """Check if a bubble intersects with any other bubbles in the grid"""
+    def get_grid_arrays(self):
+        """Get grid bubbles with their x, y, radius and rock flag as NumPy arrays (rebuilt after grid changes)"""
+        grid_bubbles = self.grid_bubbles
+        if self._grid_arrays is None or len(self._grid_arrays[0]) != len(grid_bubbles):
+            self._grid_arrays = (
+                list(grid_bubbles),
+                np.array([b.x for b in grid_bubbles], dtype=np.float64),
+                np.array([b.y for b in grid_bubbles], dtype=np.float64),
+                np.array([b.radius for b in grid_bubbles], dtype=np.float64),
+                np.array([b.is_rock for b in grid_bubbles], dtype=bool),
+            )
+        return self._grid_arrays
+    
+    def get_grid_set(self):
+        """Get grid bubbles as a set (rebuilt after grid changes)"""
+        if self._grid_set is None or len(self._grid_set) != len(self.grid_bubbles):
+            self._grid_set = set(self.grid_bubbles)
+        return self._grid_set
+    
+    def remove_grid_bubbles(self, bubbles):
+        """Explode the given bubbles out of the grid in one pass, returns how many were removed"""
+        to_remove = self.get_grid_set().intersection(bubbles)
+        if not to_remove:
+            return 0
+        
+        for bubble in to_remove:
+            # Create particle effect for this bubble
+            self.create_explosion_particles(bubble.x, bubble.y, bubble.get_color())
+        self.grid_bubbles = [b for b in self.grid_bubbles if b not in to_remove]
+        return len(to_remove)
+    
+    def find_bubbles_in_row(self, y):
+        """Get all non-rock grid bubbles in the same row as y (within the row tolerance)"""
+        grid_bubbles = self.grid_bubbles
+        if self._grid_rows is None or len(self._grid_rows[0]) != len(grid_bubbles):
+            by_y = sorted(grid_bubbles, key=lambda b: b.y)
+            self._grid_rows = ([b.y for b in by_y], by_y)
+        ys, by_y = self._grid_rows
+        
+        lo = bisect_left(ys, y - self.grid_row_tolerance)
+        hi = bisect_right(ys, y + self.grid_row_tolerance)
+        # Skip rocks - they don't explode
+        return [bubble for bubble in by_y[lo:hi] if not bubble.is_rock]
+    
+    def find_bubbles_in_radius(self, x, y, radius):
+        """Get all non-rock grid bubbles whose center is within radius of (x, y)"""
+        radius_sq = radius * radius
+        if not NUMPY_AVAILABLE:
+            # Only visit the neighbor hash cells that overlap the radius
+            buckets, cell = self.get_neighbor_hash()
+            reach = int(radius // cell) + 1
+            cell_x = int(x // cell)
+            cell_y = int(y // cell)
+            in_radius = []
+            for nx in range(cell_x - reach, cell_x + reach + 1):
+                for ny in range(cell_y - reach, cell_y + reach + 1):
+                    for bubble in buckets.get((nx, ny), ()):
+                        # Skip rocks - they don't explode
+                        if bubble.is_rock:
+                            continue
+                        dx = bubble.x - x
+                        dy = bubble.y - y
+                        if dx * dx + dy * dy <= radius_sq:
+                            in_radius.append(bubble)
+            return in_radius
+        
+        bubbles, bx, by, _, brock = self.get_grid_arrays()
+        if not bubbles:
+            return []
+        
+        # One vectorized squared-distance pass instead of a sqrt per bubble (rocks don't explode)
+        dx = bx - x
+        dy = by - y
+        idxs = np.flatnonzero((dx * dx + dy * dy <= radius_sq) & ~brock)
+        return [bubbles[i] for i in idxs.tolist()]
+    
+    def find_free_positions(self, xs, ys, radius, exclude_bubble=None):
+        """Check candidate positions against the grid, returns a list of True (free) / False (intersects)"""
+        if not NUMPY_AVAILABLE:
+            return [not self.check_bubble_intersections(x, y, radius, exclude_bubble=exclude_bubble)
+                    for x, y in zip(xs, ys)]
+        
+        bubbles, bx, by, brad, _ = self.get_grid_arrays()
+        if not bubbles:
+            return [True] * len(xs)
+        
+        # (candidates, bubbles) squared distances compared against squared sum of radii
+        dx = bx - np.asarray(xs, dtype=np.float64)[:, None]
+        dy = by - np.asarray(ys, dtype=np.float64)[:, None]
+        min_distance = brad + radius
+        hits = dx * dx + dy * dy < min_distance * min_distance
+        # The excluded bubble is usually the shot bubble, which isn't in the grid yet (O(1) set check)
+        if exclude_bubble is not None and exclude_bubble in self.get_grid_set():
+            index = next(i for i, grid_bubble in enumerate(bubbles) if grid_bubble is exclude_bubble)
+            hits[:, index] = False
+        return (~hits.any(axis=1)).tolist()
+    
+    def check_bubble_intersections(self, x, y, radius, exclude_bubble=None):
+        """Check if a bubble of the given radius at (x, y) intersects with any bubbles in the grid"""
+        if NUMPY_AVAILABLE:
+            return not self.find_free_positions([x], [y], radius, exclude_bubble=exclude_bubble)[0]
+        
         for grid_bubble in self.grid_bubbles:
             if grid_bubble == exclude_bubble:
                 continue
             
-            dx = bubble.x - grid_bubble.x
-            dy = bubble.y - grid_bubble.y
-            distance = math.sqrt(dx * dx + dy * dy)
-            min_distance = bubble.radius + grid_bubble.radius
+            dx = x - grid_bubble.x
+            dy = y - grid_bubble.y
+            min_distance = radius + grid_bubble.radius
             
             # If distance is less than sum of radii, they intersect
-            # Use strict check: distance must be >= min_distance
-            if distance < min_distance:
+            # Use strict check: distance must be >= min_distance (compared squared)
+            if dx * dx + dy * dy < min_distance * min_distance:
                 return True
         
         return False
     
     def check_matches(self, bubble):
         """Check for matching bubbles"""
-        matches = [bubble]
-        self.find_connected_matches(bubble, matches, [])
+        self.mark_grid_dirty()
+        matches = self.find_connected_matches(bubble)
         
         if len(matches) >= 3:
             # Check if any matched bubble has dynamite or mines
@@ -1793,9 +2121,10 @@ class BubbleShooterGame(Widget):
             mine_positions = []
             
             # Count how many bubbles will be removed
+            grid_set = self.get_grid_set()
             exploded_count = 0
             for match in matches:
-                if match in self.grid_bubbles:
+                if match in grid_set:
                     # Create particle effect for this bubble
                     self.create_explosion_particles(match.x, match.y, match.get_color())
                     
@@ -1806,8 +2135,9 @@ class BubbleShooterGame(Widget):
                     # Check for mines before removing
                     if match.has_mine:
                         mine_positions.append((match.x, match.y))
-                    self.grid_bubbles.remove(match)
+                    grid_set.discard(match)
                     exploded_count += 1
+            self.grid_bubbles = [b for b in self.grid_bubbles if b in grid_set]
             
             # Calculate score: exploded bubbles * remaining shooting bubbles
             if exploded_count > 0:
@@ -1848,30 +2178,15 @@ class BubbleShooterGame(Widget):
     
     def trigger_dynamite_explosion(self, x, y):
         """Trigger dynamite explosion at position (x, y), removing all bubbles within level-based radius"""
+        self.mark_grid_dirty()
         bubble_radius_count = self.get_dynamite_radius()
         explosion_radius = bubble_radius_count * self.bubble_radius * 2  # Convert to pixel radius (bubble diameters)
         
-        bubbles_to_explode = []
-        for bubble in self.grid_bubbles[:]:
-            # Skip rocks - they don't explode
-            if bubble.is_rock:
-                continue
-            dx = bubble.x - x
-            dy = bubble.y - y
-            distance = math.sqrt(dx * dx + dy * dy)
-            
-            # If bubble is within explosion radius, mark it for removal
-            if distance <= explosion_radius:
-                bubbles_to_explode.append(bubble)
+        # All bubbles within explosion radius are marked for removal
+        bubbles_to_explode = self.find_bubbles_in_radius(x, y, explosion_radius)
         
         # Remove all bubbles in explosion radius
-        exploded_count = 0
-        for bubble in bubbles_to_explode:
-            if bubble in self.grid_bubbles:
-                # Create particle effect for this bubble
-                self.create_explosion_particles(bubble.x, bubble.y, bubble.get_color())
-                self.grid_bubbles.remove(bubble)
-                exploded_count += 1
+        exploded_count = self.remove_grid_bubbles(bubbles_to_explode)
         
         # Create large explosion effect at dynamite position
         self.create_explosion_particles(x, y, (1.0, 0.5, 0.2), particle_count=30, speed_multiplier=2.0)
@@ -1895,6 +2210,7 @@ class BubbleShooterGame(Widget):
 
     def explode_warship(self, x, y):
         """Explode warship and remove all bubbles in the same horizontal line"""
+        self.mark_grid_dirty()
         if self.warship:
             self.warship.exploded = True
             self.warship.active = False
@@ -1902,36 +2218,13 @@ class BubbleShooterGame(Widget):
         # Create large explosion particles
         self.create_explosion_particles(x, y, (0.8, 0.2, 0.2), particle_count=40, speed_multiplier=2.5)
 
-        # Find the row (y coordinate) of the warship
-        warship_y = y
-
-        # Tolerance for determining if bubbles are in the same row
-        # Account for hexagonal grid where rows are spaced by grid_spacing * 0.866
-        # Use half the spacing as tolerance
-        row_tolerance = self.grid_spacing * 0.4  # Allow tolerance for row detection
-
-        bubbles_to_explode = []
-        dynamite_to_trigger = []
-
-        for bubble in self.grid_bubbles[:]:
-            # Skip rocks - they don't explode
-            if bubble.is_rock:
-                continue
-            # Check if bubble is in the same row (horizontal line)
-            if abs(bubble.y - warship_y) <= row_tolerance:
-                bubbles_to_explode.append(bubble)
-                # Check if this bubble has dynamite (will trigger after removal)
-                if bubble.has_dynamite:
-                    dynamite_to_trigger.append((bubble.x, bubble.y))
+        # All bubbles in the same row (horizontal line)
+        bubbles_to_explode = self.find_bubbles_in_row(y)
+        # Bubbles with dynamite will trigger after removal
+        dynamite_to_trigger = [(bubble.x, bubble.y) for bubble in bubbles_to_explode if bubble.has_dynamite]
 
         # Remove all bubbles in the same horizontal line
-        exploded_count = 0
-        for bubble in bubbles_to_explode:
-            if bubble in self.grid_bubbles:
-                # Create particle effect for this bubble
-                self.create_explosion_particles(bubble.x, bubble.y, bubble.get_color())
-                self.grid_bubbles.remove(bubble)
-                exploded_count += 1
+        exploded_count = self.remove_grid_bubbles(bubbles_to_explode)
 
         # Trigger dynamite explosions after removing bubbles (to avoid double processing)
         for dx, dy in dynamite_to_trigger:
@@ -1956,6 +2249,7 @@ class BubbleShooterGame(Widget):
 
     def explode_balloon(self, x, y):
         """Explode balloon and remove all bubbles within radius of 2 balloons"""
+        self.mark_grid_dirty()
         if self.balloon:
             self.balloon.exploded = True
             self.balloon.active = False
@@ -1965,31 +2259,12 @@ class BubbleShooterGame(Widget):
 
         # Find and remove all bubbles within radius of 2 balloons
         explosion_radius = 2 * self.grid_spacing  # Radius of 2 bubbles in grid units, converted to pixels
-        bubbles_to_explode = []
-        dynamite_to_trigger = []
-
-        for bubble in self.grid_bubbles[:]:
-            # Skip rocks - they don't explode
-            if bubble.is_rock:
-                continue
-            dx = bubble.x - x
-            dy = bubble.y - y
-            distance = math.sqrt(dx * dx + dy * dy)
-
-            if distance <= explosion_radius:
-                bubbles_to_explode.append(bubble)
-                # Check if this bubble has dynamite (will trigger after removal)
-                if bubble.has_dynamite:
-                    dynamite_to_trigger.append((bubble.x, bubble.y))
+        bubbles_to_explode = self.find_bubbles_in_radius(x, y, explosion_radius)
+        # Bubbles with dynamite will trigger after removal
+        dynamite_to_trigger = [(bubble.x, bubble.y) for bubble in bubbles_to_explode if bubble.has_dynamite]
 
         # Remove bubbles and add score
-        exploded_count = 0
-        for bubble in bubbles_to_explode:
-            if bubble in self.grid_bubbles:
-                # Create particle effect for this bubble
-                self.create_explosion_particles(bubble.x, bubble.y, bubble.get_color())
-                self.grid_bubbles.remove(bubble)
-                exploded_count += 1
+        exploded_count = self.remove_grid_bubbles(bubbles_to_explode)
 
         # Trigger dynamite explosions after removing bubbles (to avoid double processing)
         for dx, dy in dynamite_to_trigger:
@@ -2014,6 +2289,7 @@ class BubbleShooterGame(Widget):
 
     def explode_airplane(self, x, y):
         """Explode airplane and remove all bubbles within radius 4"""
+        self.mark_grid_dirty()
         if self.airplane:
             self.airplane.exploded = True
             self.airplane.active = False
@@ -2023,26 +2299,10 @@ class BubbleShooterGame(Widget):
         
         # Find and remove all bubbles within radius 4 (scaled)
         explosion_radius = 4 * self.grid_spacing  # Radius 4 in grid units, converted to pixels
-        bubbles_to_remove = []
-        
-        for bubble in self.grid_bubbles[:]:
-            # Skip rocks - they don't explode
-            if bubble.is_rock:
-                continue
-            dx = bubble.x - x
-            dy = bubble.y - y
-            distance = math.sqrt(dx * dx + dy * dy)
-            
-            if distance <= explosion_radius:
-                # Create particle effect for this bubble
-                self.create_explosion_particles(bubble.x, bubble.y, bubble.get_color())
-                bubbles_to_remove.append(bubble)
+        bubbles_to_remove = self.find_bubbles_in_radius(x, y, explosion_radius)
         
         # Remove bubbles and add score
-        exploded_count = len(bubbles_to_remove)
-        for bubble in bubbles_to_remove:
-            if bubble in self.grid_bubbles:
-                self.grid_bubbles.remove(bubble)
+        exploded_count = self.remove_grid_bubbles(bubbles_to_remove)
         
         # Calculate score: exploded bubbles * remaining shooting bubbles
         if exploded_count > 0:
@@ -2063,6 +2323,7 @@ class BubbleShooterGame(Widget):
     
     def explode_helicopter(self, x, y):
         """Explode helicopter and remove all bubbles in the same horizontal line"""
+        self.mark_grid_dirty()
         if self.helicopter:
             self.helicopter.exploded = True
             self.helicopter.active = False
@@ -2070,36 +2331,13 @@ class BubbleShooterGame(Widget):
         # Create large explosion particles
         self.create_explosion_particles(x, y, (0.0, 1.0, 0.5), particle_count=30, speed_multiplier=2.0)
         
-        # Find the row (y coordinate) of the helicopter
-        helicopter_y = y
-        
-        # Tolerance for determining if bubbles are in the same row
-        # Account for hexagonal grid where rows are spaced by grid_spacing * 0.866
-        # Use half the row spacing as tolerance
-        row_tolerance = self.grid_spacing * 0.4  # Allow tolerance for row detection
-        
-        bubbles_to_explode = []
-        dynamite_to_trigger = []
-        
-        for bubble in self.grid_bubbles[:]:
-            # Skip rocks - they don't explode
-            if bubble.is_rock:
-                continue
-            # Check if bubble is in the same row (within tolerance)
-            if abs(bubble.y - helicopter_y) <= row_tolerance:
-                bubbles_to_explode.append(bubble)
-                # Check if this bubble has dynamite (will trigger after removal)
-                if bubble.has_dynamite:
-                    dynamite_to_trigger.append((bubble.x, bubble.y))
+        # All bubbles in the same row (within tolerance)
+        bubbles_to_explode = self.find_bubbles_in_row(y)
+        # Bubbles with dynamite will trigger after removal
+        dynamite_to_trigger = [(bubble.x, bubble.y) for bubble in bubbles_to_explode if bubble.has_dynamite]
         
         # Remove all bubbles in the same row
-        exploded_count = 0
-        for bubble in bubbles_to_explode:
-            if bubble in self.grid_bubbles:
-                # Create particle effect for this bubble
-                self.create_explosion_particles(bubble.x, bubble.y, bubble.get_color())
-                self.grid_bubbles.remove(bubble)
-                exploded_count += 1
+        exploded_count = self.remove_grid_bubbles(bubbles_to_explode)
         
         # Trigger dynamite explosions after removing bubbles (to avoid double processing)
         for dx, dy in dynamite_to_trigger:
@@ -2124,36 +2362,14 @@ class BubbleShooterGame(Widget):
     
     def trigger_mine_explosion(self, x, y):
         """Trigger mine explosion at position (x, y), removing all bubbles in the same row"""
-        # Find the row (y coordinate) of the mine
-        mine_y = y
-        
-        # Tolerance for determining if bubbles are in the same row
-        # Account for hexagonal grid where rows are spaced by grid_spacing * 0.866
-        # Use half the row spacing as tolerance
-        row_tolerance = self.grid_spacing * 0.4  # Allow tolerance for row detection
-        
-        bubbles_to_explode = []
-        dynamite_to_trigger = []
-        
-        for bubble in self.grid_bubbles[:]:
-            # Skip rocks - they don't explode
-            if bubble.is_rock:
-                continue
-            # Check if bubble is in the same row (within tolerance)
-            if abs(bubble.y - mine_y) <= row_tolerance:
-                bubbles_to_explode.append(bubble)
-                # Check if this bubble has dynamite (will trigger after removal)
-                if bubble.has_dynamite:
-                    dynamite_to_trigger.append((bubble.x, bubble.y))
+        self.mark_grid_dirty()
+        # All bubbles in the same row (within tolerance)
+        bubbles_to_explode = self.find_bubbles_in_row(y)
+        # Bubbles with dynamite will trigger after removal
+        dynamite_to_trigger = [(bubble.x, bubble.y) for bubble in bubbles_to_explode if bubble.has_dynamite]
         
         # Remove all bubbles in the same row
-        exploded_count = 0
-        for bubble in bubbles_to_explode:
-            if bubble in self.grid_bubbles:
-                # Create particle effect for this bubble
-                self.create_explosion_particles(bubble.x, bubble.y, bubble.get_color())
-                self.grid_bubbles.remove(bubble)
-                exploded_count += 1
+        exploded_count = self.remove_grid_bubbles(bubbles_to_explode)
         
         # Create large explosion effect at mine position
         self.create_explosion_particles(x, y, (1.0, 0.8, 0.0), particle_count=25, speed_multiplier=1.8)
@@ -2179,124 +2395,170 @@ class BubbleShooterGame(Widget):
         if len(self.grid_bubbles) == 0:
             self.game_active = False  # Player wins!
     
-    def find_connected_matches(self, bubble, matches, visited):
-        """Find all connected bubbles of same element"""
-        visited.append(bubble)
-        
-        # Check neighbors within grid spacing (hexagonal pattern)
-        neighbor_distance = self.grid_spacing * 1.1  # Slightly larger than grid spacing
-        
-        for other in self.grid_bubbles:
-            if other not in visited and other != bubble:
-                dx = bubble.x - other.x
-                dy = bubble.y - other.y
-                distance = math.sqrt(dx * dx + dy * dy)
-                
-                # Check if they're neighbors (touching) and same element
-                if distance < neighbor_distance and bubble.matches_element(other):
+    def get_neighbor_hash(self):
+        """Get all grid bubbles bucketed into cells of one neighbor distance (rebuilt after grid changes)"""
+        grid_bubbles = self.grid_bubbles
+        if self._neighbor_hash is None or self._neighbor_hash[2] != len(grid_bubbles):
+            # Neighbors are always within the 3x3 surrounding cells
+            cell = self.grid_neighbor_distance
+            buckets = defaultdict(list)
+            for b in grid_bubbles:
+                buckets[(int(b.x // cell), int(b.y // cell))].append(b)
+            self._neighbor_hash = (buckets, cell, len(grid_bubbles))
+        return self._neighbor_hash[0], self._neighbor_hash[1]
+    
+    def get_grid_neighbors(self, bubble):
+        """Get the grid bubbles touching the given bubble (looks at the 3x3 surrounding hash cells only)"""
+        buckets, neighbor_distance = self.get_neighbor_hash()
+        neighbor_distance_sq = neighbor_distance * neighbor_distance
+        x = bubble.x
+        y = bubble.y
+        cell_x = int(x // neighbor_distance)
+        cell_y = int(y // neighbor_distance)
+        neighbors = []
+        for nx in (cell_x - 1, cell_x, cell_x + 1):
+            for ny in (cell_y - 1, cell_y, cell_y + 1):
+                for other in buckets.get((nx, ny), ()):
+                    if other is bubble:
+                        continue
+                    dx = x - other.x
+                    dy = y - other.y
+                    if dx * dx + dy * dy < neighbor_distance_sq:
+                        neighbors.append(other)
+        return neighbors
+    
+    def find_connected_matches(self, start):
+        """Find all connected bubbles of same element, returns a list starting with start"""
+        # Iterative flood fill (no recursion limit) over the neighboring cells only
+        visited = {start}
+        stack = [start]
+        matches = [start]
+        
+        while stack:
+            current = stack.pop()
+            for other in self.get_grid_neighbors(current):
+                # Neighbors (touching) of the same element are connected
+                if other not in visited and current.matches_element(other):
+                    visited.add(other)
                     matches.append(other)
-                    self.find_connected_matches(other, matches, visited)
+                    stack.append(other)
+        
+        return matches
     
     def create_explosion_particles(self, x, y, color, particle_count=15, speed_multiplier=1.0):
         """Create particle effects for bubble explosions"""
         if not self.graphics_enhancer or not PIL_AVAILABLE:
             return
         
-        base_speed = 200 * speed_multiplier * self.scale
+        # Keep the particle count bounded - make room by dropping the oldest particles
+        particle_count = min(particle_count, MAX_PARTICLES)
+        overflow = len(self.particles) + particle_count - MAX_PARTICLES
+        if overflow > 0:
+            self.particles.drop_oldest(overflow)
         
-        for _ in range(particle_count):
-            # Random angle for particle direction
-            angle = random.uniform(0, 2 * math.pi)
-            # Random speed variation
-            speed = random.uniform(base_speed * 0.5, base_speed * 1.5)
-            
-            # Random lifetime (0.3 to 0.8 seconds)
-            lifetime = random.uniform(0.3, 0.8)
-            
-            # Random size
-            size = random.uniform(3 * self.scale, 8 * self.scale)
-            
-            # Slight color variation
-            color_variation = random.uniform(0.8, 1.2)
-            particle_color = (
-                min(1.0, color[0] * color_variation),
-                min(1.0, color[1] * color_variation),
-                min(1.0, color[2] * color_variation)
-            )
-            
-            particle = {
-                'x': x,
-                'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'color': particle_color,
-                'size': size,
-                'lifetime': lifetime,
-                'age': 0.0,
-                'texture': None
-            }
-            
-            # Create texture if graphics enhancer is available
-            if self.graphics_enhancer:
-                particle['texture'] = self.graphics_enhancer.create_particle_texture(
-                    int(size * 2), particle_color, fade=True
-                )
-            
-            self.particles.append(particle)
+        base_speed = 200 * speed_multiplier * self.scale
+        min_size = 3 * self.scale
+        max_size = 8 * self.scale
+        
+        # Random direction, speed, lifetime (0.3 to 0.8 seconds), size and color variation per particle
+        if NUMPY_AVAILABLE:
+            angles = np.random.uniform(0, 2 * math.pi, particle_count)
+            speeds = np.random.uniform(base_speed * 0.5, base_speed * 1.5, particle_count)
+            vxs = (np.cos(angles) * speeds).tolist()
+            vys = (np.sin(angles) * speeds).tolist()
+            lifetimes = np.random.uniform(0.3, 0.8, particle_count).tolist()
+            sizes = np.random.uniform(min_size, max_size, particle_count).tolist()
+            variations = np.random.uniform(0.8, 1.2, particle_count).tolist()
+        else:
+            angles = [uniform(0, 2 * math.pi) for _ in range(particle_count)]
+            speeds = [uniform(base_speed * 0.5, base_speed * 1.5) for _ in range(particle_count)]
+            vxs = [cos(angle) * speed for angle, speed in zip(angles, speeds)]
+            vys = [sin(angle) * speed for angle, speed in zip(angles, speeds)]
+            lifetimes = [uniform(0.3, 0.8) for _ in range(particle_count)]
+            sizes = [uniform(min_size, max_size) for _ in range(particle_count)]
+            variations = [uniform(0.8, 1.2) for _ in range(particle_count)]
+        
+        # Slight color variation
+        red, green, blue = color[0], color[1], color[2]
+        colors = [(min(1.0, red * v), min(1.0, green * v), min(1.0, blue * v)) for v in variations]
+        
+        # Particles of similar size/color share one texture
+        get_texture = self.graphics_enhancer.get_particle_texture
+        textures = [get_texture(size * 2, particle_color) for size, particle_color in zip(sizes, colors)]
+        
+        self.particles.extend(x, y, vxs, vys, lifetimes, sizes, colors, textures)
     
     def update_particles(self, dt):
         """Update particle positions and lifetimes"""
-        for particle in self.particles[:]:
-            # Update position
-            particle['x'] += particle['vx'] * dt
-            particle['y'] += particle['vy'] * dt
-            
-            # Apply gravity/friction
-            particle['vy'] -= 300 * dt * self.scale  # Gravity
-            particle['vx'] *= 0.98  # Friction
-            
-            # Update age
-            particle['age'] += dt
-            
-            # Remove expired particles
-            if particle['age'] >= particle['lifetime']:
-                self.particles.remove(particle)
+        if not self.particles:
+            return
+        self.particles.update(dt, 300 * self.scale)
     
     def draw_particles(self):
         """Draw all particles"""
-        for particle in self.particles:
-            # Calculate alpha based on remaining lifetime
-            remaining_life = 1.0 - (particle['age'] / particle['lifetime'])
-            alpha = max(0.0, min(1.0, remaining_life))
-            
-            if particle['texture']:
-                # Draw using texture
-                size = particle['size'] * 2
-                Color(1, 1, 1, alpha)
-                Rectangle(texture=particle['texture'],
-                         pos=(particle['x'] - size / 2, particle['y'] - size / 2),
-                         size=(size, size))
+        particles = self.particles
+        if not particles:
+            return
+        xs = particles.x
+        ys = particles.y
+        ages = particles.age
+        lifetimes = particles.lifetime
+        sizes = particles.size
+        textures = particles.textures
+        colors = particles.colors
+        
+        # Group particles by texture (or fallback color) and quantized alpha so each group sets Color once
+        textured_groups = defaultdict(list)
+        plain_groups = defaultdict(list)
+        for i in range(len(particles)):
+            # Alpha based on remaining lifetime, in PARTICLE_ALPHA_STEPS steps
+            remaining_life = 1.0 - (ages[i] / lifetimes[i])
+            alpha_step = int(max(0.0, min(1.0, remaining_life)) * PARTICLE_ALPHA_STEPS + 0.5)
+            if alpha_step == 0:
+                continue  # Fully faded
+            
+            texture = textures[i]
+            if texture:
+                textured_groups[(id(texture), alpha_step)].append(i)
             else:
-                # Fallback: draw simple circle
-                color = particle['color']
-                Color(color[0], color[1], color[2], alpha)
-                Ellipse(pos=(particle['x'] - particle['size'], particle['y'] - particle['size']),
-                       size=(particle['size'] * 2, particle['size'] * 2))
+                plain_groups[(colors[i], alpha_step)].append(i)
+        
+        for (_, alpha_step), indices in textured_groups.items():
+            # Draw using texture
+            Color(1, 1, 1, alpha_step / PARTICLE_ALPHA_STEPS)
+            texture = textures[indices[0]]
+            for i in indices:
+                size = sizes[i] * 2
+                Rectangle(texture=texture,
+                         pos=(xs[i] - size / 2, ys[i] - size / 2),
+                         size=(size, size))
+        
+        for (color, alpha_step), indices in plain_groups.items():
+            # Fallback: draw simple circles
+            Color(color[0], color[1], color[2], alpha_step / PARTICLE_ALPHA_STEPS)
+            for i in indices:
+                size = sizes[i]
+                Ellipse(pos=(xs[i] - size, ys[i] - size),
+                       size=(size * 2, size * 2))
     
     def check_floating_bubbles(self):
         """Check for bubbles not connected to topmost line and make them fall"""
+        self.mark_grid_dirty()
         if len(self.grid_bubbles) == 0:
             return
         
         # Find all bubbles in the topmost line (at grid_start_y)
         # Only bubbles at the topmost line are considered "attached to top"
-        top_threshold = self.grid_spacing * 0.5  # Tolerance for "top row" (half grid spacing)
-        top_bubbles = []
-        
         # Find all bubbles at the topmost line (at grid_start_y)
-        for bubble in self.grid_bubbles:
-            if abs(bubble.y - self.grid_start_y) <= top_threshold:
-                top_bubbles.append(bubble)
+        # Tolerance for "top row" is half grid spacing
+        if NUMPY_AVAILABLE:
+            bubbles, _, by, _, _ = self.get_grid_arrays()
+            top_idxs = np.flatnonzero(np.abs(by - self.grid_start_y) <= self.grid_half_spacing)
+            top_bubbles = [bubbles[i] for i in top_idxs.tolist()]
+        else:
+            top_min = self.grid_start_y - self.grid_half_spacing
+            top_max = self.grid_start_y + self.grid_half_spacing
+            top_bubbles = [bubble for bubble in self.grid_bubbles if top_min <= bubble.y <= top_max]
         
         if not top_bubbles:
             # If no top bubbles found, all bubbles are disconnected - explode them all immediately
@@ -2311,7 +2573,8 @@ class BubbleShooterGame(Widget):
                 # Remove all bubbles immediately
                 self.grid_bubbles.clear()
                 # Print remaining bubbles
-                print(f"Remaining bubbles: 0")
+                if DEBUG_LOG:
+                    print(f"Remaining bubbles: 0")
             
             # Check if all bubbles are cleared (win condition)
             if len(self.grid_bubbles) == 0:
@@ -2320,28 +2583,20 @@ class BubbleShooterGame(Widget):
         
         # Use BFS to find all bubbles connected to top bubbles
         connected_bubbles = set()
-        queue = list(top_bubbles)
+        queue = deque(top_bubbles)
         
         for bubble in top_bubbles:
             connected_bubbles.add(bubble)
         
-        # BFS traversal to find all connected bubbles
+        # BFS traversal to find all connected bubbles (neighbor hash is built once for the whole search)
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             
-            # Find all neighbors of current bubble
-            neighbor_distance = self.grid_spacing * 1.1  # Slightly larger than grid spacing
-            
-            for other in self.grid_bubbles:
+            # If bubbles are touching/neighbors, they're connected
+            for other in self.get_grid_neighbors(current):
                 if other not in connected_bubbles:
-                    dx = current.x - other.x
-                    dy = current.y - other.y
-                    distance = math.sqrt(dx * dx + dy * dy)
-                    
-                    # If bubbles are touching/neighbors, they're connected
-                    if distance < neighbor_distance:
-                        connected_bubbles.add(other)
-                        queue.append(other)
+                    connected_bubbles.add(other)
+                    queue.append(other)
         
         # Remove all bubbles that are NOT connected to the top (explode them immediately)
         disconnected_bubbles = []
@@ -2350,13 +2605,12 @@ class BubbleShooterGame(Widget):
                 disconnected_bubbles.append(bubble)
         
         # Remove disconnected bubbles immediately (explode them)
-        disconnected_count = 0
+        disconnected_count = len(disconnected_bubbles)
         for bubble in disconnected_bubbles:
-            if bubble in self.grid_bubbles:
-                # Create particle effect for falling bubble
-                self.create_explosion_particles(bubble.x, bubble.y, bubble.get_color())
-                self.grid_bubbles.remove(bubble)
-                disconnected_count += 1
+            # Create particle effect for falling bubble
+            self.create_explosion_particles(bubble.x, bubble.y, bubble.get_color())
+        if disconnected_bubbles:
+            self.grid_bubbles = [b for b in self.grid_bubbles if b in connected_bubbles]
         
         # Calculate score: all disconnected bubbles * remaining shooting bubbles
         if disconnected_count > 0:
@@ -2369,50 +2623,182 @@ class BubbleShooterGame(Widget):
                 self.play_nice_shot_sound()
             # Print remaining bubbles after removing disconnected ones
             remaining_count = len(self.grid_bubbles)
-            print(f"Remaining bubbles: {remaining_count}")
+            if DEBUG_LOG:
+                print(f"Remaining bubbles: {remaining_count}")
         
         # Check if all bubbles are cleared (win condition)
         if len(self.grid_bubbles) == 0:
-            print(f"Remaining bubbles: 0")
+            if DEBUG_LOG:
+                print(f"Remaining bubbles: 0")
             self.game_active = False  # Player wins!
     
+    def scan_asset_dirs(self):
+        """Resolve every asset up front with one directory listing per asset directory"""
+        for asset_dir in self.asset_dirs:
+            try:
+                with os.scandir(asset_dir) as entries:
+                    for entry in entries:
+                        # Earlier directories take priority, same as get_asset_path
+                        if entry.is_file():
+                            self.asset_path_cache.setdefault(entry.name, entry.path)
+            except OSError:
+                continue  # Directory doesn't exist here
+    
     def get_asset_path(self, filename):
         """Get asset path that works on both desktop and Android"""
-        # Try multiple possible paths
-        possible_paths = [
-            os.path.join("asset", filename),  # Relative path (works on Android)
-            os.path.join(".", "asset", filename),  # Current directory
-            os.path.join(os.path.dirname(__file__), "asset", filename),  # Same dir as game.py
-            os.path.join(os.getcwd(), "asset", filename),  # Current working directory
-        ]
+        # Each filename is only probed on disk once
+        if filename in self.asset_path_cache:
+            return self.asset_path_cache[filename]
         
-        # On Windows, also try the original hardcoded path as fallback
-        if os.name == 'nt':
-            possible_paths.append(
-                r"C:\Users\aminz\OneDrive\Documents\GitHub\bubble-shooter\bubble-shooter\bubble-shooter\asset\{}".format(filename)
-            )
+        # Try multiple possible paths
+        possible_paths = [os.path.join(asset_dir, filename) for asset_dir in self.asset_dirs]
         
+        found_path = None
         for path in possible_paths:
             if os.path.exists(path):
-                return path
+                found_path = path
+                break
         
-        return None
+        self.asset_path_cache[filename] = found_path
+        return found_path
+    
+    def key_white_background(self, pil_img, threshold=240):
+        """Make white / near-white pixels of an RGBA image transparent (no per-pixel Python loop)"""
+        if NUMPY_AVAILABLE:
+            arr = np.array(pil_img)
+            # Pixels above the threshold in all of R, G and B
+            mask = (arr[..., :3] > threshold).all(axis=-1)
+            arr[mask] = (255, 255, 255, 0)  # Transparent
+            return PILImage.fromarray(arr, 'RGBA')
+        
+        # Without NumPy: build the same mask from per-band lookup tables
+        r, g, b, a = pil_img.split()
+        lut = [255 if v > threshold else 0 for v in range(256)]
+        mask = ImageChops.multiply(ImageChops.multiply(r.point(lut), g.point(lut)), b.point(lut))
+        pil_img.putalpha(ImageChops.subtract(a, mask))
+        return pil_img
+    
+    def get_sprite_source_size(self, name):
+        """Get the size a sprite source is downscaled to before processing"""
+        return SPRITE_ATLAS_MAX_SIZES.get(name, SPRITE_ATLAS_DEFAULT_SIZE) * SPRITE_SOURCE_OVERSAMPLE
+    
+    def load_processed_image(self, path, cache_name, process, max_size=None):
+        """Open an image as RGBA and run process(pil_img) on it, reusing the result cached in asset/.cache"""
+        if max_size:
+            # Size is part of the cache name so changing it regenerates the cache
+            cache_name = f"{cache_name}_{max_size}"
+        cache_dir = os.path.join(os.path.dirname(path), ".cache")
+        cache_path = os.path.join(cache_dir, f"{cache_name}.v{PROCESSED_IMAGE_VERSION}.png")
+        try:
+            if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(path):
+                return PILImage.open(cache_path).convert('RGBA')
+        except Exception as e:
+            print(f"Error loading cached image {cache_path}: {e}")
+        
+        pil_img = PILImage.open(path)
+        # Convert to RGBA if not already
+        if pil_img.mode != 'RGBA':
+            pil_img = pil_img.convert('RGBA')
+        if max_size:
+            # Shrink large sources first so the per-pixel processing runs on far fewer pixels
+            pil_img.thumbnail((max_size, max_size), PILImage.BILINEAR)
+        pil_img = process(pil_img)
+        
+        # Save the processed copy so later launches skip the processing (asset dir may be read-only)
+        # Stored as a 256-color palette PNG with per-index alpha - a fraction of the RGBA size to read back
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            pil_img.quantize(colors=256, method=PILImage.FASTOCTREE).save(cache_path, 'PNG', optimize=True)
+        except Exception as e:
+            print(f"Could not cache processed image {cache_path}: {e}")
+        return pil_img
+    
+    def load_keyed_image(self, path, name):
+        """Open the source of sprite `name` with its white background removed (cached on disk after the first run)"""
+        cache_name = os.path.splitext(os.path.basename(path))[0] + "_keyed"
+        return self.load_processed_image(path, cache_name, self.key_white_background,
+                                         self.get_sprite_source_size(name))
+    
+    def load_sprite_texture(self, name, pil_img):
+        """Create a texture from a processed sprite image, or collect it for the sprite atlas"""
+        if self.collect_sprite_images:
+            # Downscale to atlas cell size (keeps aspect ratio); texture is assigned in build_sprite_atlas
+            max_size = SPRITE_ATLAS_MAX_SIZES.get(name, SPRITE_ATLAS_DEFAULT_SIZE)
+            pil_img.thumbnail((max_size, max_size))
+            self.sprite_images[name] = pil_img
+            return None
+        
+        # Upload the RGBA pixels directly (no PNG encode/decode round trip)
+        if pil_img.mode != 'RGBA':
+            pil_img = pil_img.convert('RGBA')
+        texture = Texture.create(size=pil_img.size, colorfmt='rgba')
+        texture.blit_buffer(pil_img.tobytes(), colorfmt='rgba', bufferfmt='ubyte')
+        # PIL rows run top-down, Kivy textures have their origin at the bottom-left
+        texture.flip_vertical()
+        return texture
+    
+    def load_sprite_once(self, name):
+        """Load a sprite that was not needed at startup the first time it is drawn (no retry if it fails)"""
+        if name not in self.loaded_sprites:
+            self.loaded_sprites.add(name)
+            getattr(self, f"load_{name}_image")()
+    
+    def build_sprite_atlas(self):
+        """Pack collected sprite images into one atlas texture and use its regions as sprite textures"""
+        self.collect_sprite_images = False
+        if not self.sprite_images:
+            return
+        
+        try:
+            # Shelf packing: tallest sprites first, rows no wider than the atlas
+            names = sorted(self.sprite_images, key=lambda n: self.sprite_images[n].height, reverse=True)
+            placements = {}
+            shelf_x = 0
+            shelf_y = 0
+            shelf_height = 0
+            for name in names:
+                img = self.sprite_images[name]
+                if shelf_x + img.width > SPRITE_ATLAS_WIDTH:
+                    # Start a new shelf below the current one
+                    shelf_y += shelf_height
+                    shelf_x = 0
+                    shelf_height = 0
+                placements[name] = (shelf_x, shelf_y)
+                shelf_x += img.width
+                shelf_height = max(shelf_height, img.height)
+            atlas_height = shelf_y + shelf_height
+            
+            atlas_img = PILImage.new('RGBA', (SPRITE_ATLAS_WIDTH, atlas_height), (0, 0, 0, 0))
+            for name, (px, py) in placements.items():
+                atlas_img.paste(self.sprite_images[name], (px, py))
+            
+            # Kivy textures have their origin at the bottom-left
+            atlas_img = atlas_img.transpose(PILImage.FLIP_TOP_BOTTOM)
+            self.sprite_atlas = Texture.create(size=atlas_img.size, colorfmt='rgba')
+            self.sprite_atlas.blit_buffer(atlas_img.tobytes(), colorfmt='rgba', bufferfmt='ubyte')
+            
+            # Point every sprite texture at its region of the atlas
+            for name, (px, py) in placements.items():
+                img = self.sprite_images[name]
+                region = self.sprite_atlas.get_region(px, atlas_height - py - img.height, img.width, img.height)
+                setattr(self, f"{name}_texture", region)
+            print(f"Sprite atlas built: {len(placements)} sprites, {SPRITE_ATLAS_WIDTH}x{atlas_height}")
+        except Exception as e:
+            print(f"Error building sprite atlas: {e}")
+            # Fall back to one texture per sprite
+            self.sprite_atlas = None
+            for name, img in self.sprite_images.items():
+                setattr(self, f"{name}_texture", self.load_sprite_texture(name, img))
+        
+        self.sprite_images = {}
     
     def load_background_image(self):
         """Load background image texture - using first background for all levels"""
         # For now, use first background (10013168.jpg) for all levels
         background_filename = "10013168.jpg"
+        background_path = self.get_asset_path(background_filename)
         
-        # Try hardcoded path first
-        hardcoded_path = r"C:\Users\aminz\OneDrive\Documents\GitHub\bubble-shooter\bubble-shooter\bubble-shooter\asset\10013168.jpg"
-        if os.path.exists(hardcoded_path):
-            background_path = hardcoded_path
-        else:
-            # Try relative path as fallback
-            background_path = self.get_asset_path(background_filename)
-        
-        # Verify path exists
-        if background_path and os.path.exists(background_path):
+        if background_path:
             try:
                 img = CoreImage(background_path)
                 self.background_texture = img.texture
@@ -2425,45 +2811,19 @@ class BubbleShooterGame(Widget):
         else:
             print(f"ERROR: Background image not found for level {self.level}")
             print(f"  Filename: {background_filename}")
-            print(f"  Path: {background_path}")
-            print(f"  Path exists: {os.path.exists(background_path) if background_path else False}")
             self.background_texture = None
     
     def load_dynamite_image(self):
         """Load dynamite image texture with white background removed"""
         dynamite_path = self.get_asset_path("istockphoto-1139873743-612x612.jpg")
-        if dynamite_path and os.path.exists(dynamite_path):
+        if dynamite_path:
             try:
                 if PIL_AVAILABLE:
-                    # Use PIL to remove white background
-                    pil_img = PILImage.open(dynamite_path)
-                    # Convert to RGBA if not already
-                    if pil_img.mode != 'RGBA':
-                        pil_img = pil_img.convert('RGBA')
-                    
-                    # Get image data
-                    data = pil_img.getdata()
-                    # Create new image data with transparent white pixels
-                    new_data = []
-                    for item in data:
-                        # If pixel is white or near-white (threshold for slight variations)
-                        # Make it transparent
-                        if item[0] > 240 and item[1] > 240 and item[2] > 240:
-                            new_data.append((255, 255, 255, 0))  # Transparent
-                        else:
-                            new_data.append(item)  # Keep original
-                    
-                    pil_img.putdata(new_data)
-                    
-                    # Save to temporary file or use BytesIO
-                    import io
-                    img_bytes = io.BytesIO()
-                    pil_img.save(img_bytes, format='PNG')
-                    img_bytes.seek(0)
+                    # Use PIL to remove white background (cached on disk after the first run)
+                    pil_img = self.load_keyed_image(dynamite_path, 'dynamite')
                     
-                    # Load processed image
-                    img = CoreImage(img_bytes, ext='png')
-                    self.dynamite_texture = img.texture
+                    # Create texture (or collect image for the sprite atlas)
+                    self.dynamite_texture = self.load_sprite_texture('dynamite', pil_img)
                 else:
                     # Fallback: load image without processing
                     img = CoreImage(dynamite_path)
@@ -2478,38 +2838,14 @@ class BubbleShooterGame(Widget):
     def load_mine_image(self):
         """Load mine image texture with white background removed"""
         mine_path = self.get_asset_path("istockphoto-1474907248-612x612.jpg")
-        if mine_path and os.path.exists(mine_path):
+        if mine_path:
             try:
                 if PIL_AVAILABLE:
-                    # Use PIL to remove white background
-                    pil_img = PILImage.open(mine_path)
-                    # Convert to RGBA if not already
-                    if pil_img.mode != 'RGBA':
-                        pil_img = pil_img.convert('RGBA')
-                    
-                    # Get image data
-                    data = pil_img.getdata()
-                    # Create new image data with transparent white pixels
-                    new_data = []
-                    for item in data:
-                        # If pixel is white or near-white (threshold for slight variations)
-                        # Make it transparent
-                        if item[0] > 240 and item[1] > 240 and item[2] > 240:
-                            new_data.append((255, 255, 255, 0))  # Transparent
-                        else:
-                            new_data.append(item)  # Keep original
+                    # Use PIL to remove white background (cached on disk after the first run)
+                    pil_img = self.load_keyed_image(mine_path, 'mine')
                     
-                    pil_img.putdata(new_data)
-                    
-                    # Save to temporary file or use BytesIO
-                    import io
-                    img_bytes = io.BytesIO()
-                    pil_img.save(img_bytes, format='PNG')
-                    img_bytes.seek(0)
-                    
-                    # Load processed image
-                    img = CoreImage(img_bytes, ext='png')
-                    self.mine_texture = img.texture
+                    # Create texture (or collect image for the sprite atlas)
+                    self.mine_texture = self.load_sprite_texture('mine', pil_img)
                 else:
                     # Fallback: load image without processing
                     img = CoreImage(mine_path)
@@ -2524,44 +2860,16 @@ class BubbleShooterGame(Widget):
     def load_rock_image(self):
         """Load rock image texture with white background removed"""
         # Use the specified rock image
-        rock_path = r"C:\Users\aminz\OneDrive\Documents\GitHub\bubble-shooter\bubble-shooter\bubble-shooter\asset\rock.jpg"
+        rock_path = self.get_asset_path("rock.jpg")
         
-        # Also try relative path for cross-platform compatibility
-        if not os.path.exists(rock_path):
-            rock_path = self.get_asset_path("rock.jpg")
-        
-        if rock_path and os.path.exists(rock_path):
+        if rock_path:
             try:
                 if PIL_AVAILABLE:
-                    # Use PIL to remove white background
-                    pil_img = PILImage.open(rock_path)
-                    # Convert to RGBA if not already
-                    if pil_img.mode != 'RGBA':
-                        pil_img = pil_img.convert('RGBA')
-                    
-                    # Get image data
-                    data = pil_img.getdata()
-                    # Create new image data with transparent white pixels
-                    new_data = []
-                    for item in data:
-                        # If pixel is white or near-white (threshold for slight variations)
-                        # Make it transparent
-                        if item[0] > 240 and item[1] > 240 and item[2] > 240:
-                            new_data.append((255, 255, 255, 0))  # Transparent
-                        else:
-                            new_data.append(item)  # Keep original
-                    
-                    pil_img.putdata(new_data)
-                    
-                    # Save to temporary file or use BytesIO
-                    import io
-                    img_bytes = io.BytesIO()
-                    pil_img.save(img_bytes, format='PNG')
-                    img_bytes.seek(0)
+                    # Use PIL to remove white background (cached on disk after the first run)
+                    pil_img = self.load_keyed_image(rock_path, 'rock')
                     
-                    # Load processed image
-                    img = CoreImage(img_bytes, ext='png')
-                    self.rock_texture = img.texture
+                    # Create texture (or collect image for the sprite atlas)
+                    self.rock_texture = self.load_sprite_texture('rock', pil_img)
                     print(f"Successfully loaded rock image: {rock_path}")
                 else:
                     # Fallback: load image without processing
@@ -2577,44 +2885,16 @@ class BubbleShooterGame(Widget):
     def load_diamond_image(self):
         """Load diamond image texture with white background removed"""
         # Use the specified diamond image
-        diamond_path = r"C:\Users\aminz\OneDrive\Documents\GitHub\bubble-shooter\bubble-shooter\bubble-shooter\asset\diamond.jpg"
-        
-        # Also try relative path for cross-platform compatibility
-        if not os.path.exists(diamond_path):
-            diamond_path = self.get_asset_path("diamond.jpg")
+        diamond_path = self.get_asset_path("diamond.jpg")
         
-        if diamond_path and os.path.exists(diamond_path):
+        if diamond_path:
             try:
                 if PIL_AVAILABLE:
-                    # Use PIL to remove white background
-                    pil_img = PILImage.open(diamond_path)
-                    # Convert to RGBA if not already
-                    if pil_img.mode != 'RGBA':
-                        pil_img = pil_img.convert('RGBA')
-                    
-                    # Get image data
-                    data = pil_img.getdata()
-                    # Create new image data with transparent white pixels
-                    new_data = []
-                    for item in data:
-                        # If pixel is white or near-white (threshold for slight variations)
-                        # Make it transparent
-                        if item[0] > 240 and item[1] > 240 and item[2] > 240:
-                            new_data.append((255, 255, 255, 0))  # Transparent
-                        else:
-                            new_data.append(item)  # Keep original
+                    # Use PIL to remove white background (cached on disk after the first run)
+                    pil_img = self.load_keyed_image(diamond_path, 'diamond')
                     
-                    pil_img.putdata(new_data)
-                    
-                    # Save to temporary file or use BytesIO
-                    import io
-                    img_bytes = io.BytesIO()
-                    pil_img.save(img_bytes, format='PNG')
-                    img_bytes.seek(0)
-                    
-                    # Load processed image
-                    img = CoreImage(img_bytes, ext='png')
-                    self.diamond_texture = img.texture
+                    # Create texture (or collect image for the sprite atlas)
+                    self.diamond_texture = self.load_sprite_texture('diamond', pil_img)
                     print(f"Successfully loaded diamond image: {diamond_path}")
                 else:
                     # Fallback: load image without processing
@@ -2630,16 +2910,19 @@ class BubbleShooterGame(Widget):
     def load_jet_image(self):
         """Load fighter jet image texture"""
         # Use the specified jet image
-        jet_path = r"C:\Users\aminz\OneDrive\Documents\GitHub\bubble-shooter\bubble-shooter\bubble-shooter\asset\jet.png"
-        
-        # Also try relative path for cross-platform compatibility
-        if not os.path.exists(jet_path):
-            jet_path = self.get_asset_path("jet.png")
+        jet_path = self.get_asset_path("jet.png")
         
-        if jet_path and os.path.exists(jet_path):
+        if jet_path:
             try:
-                img = CoreImage(jet_path)
-                self.jet_texture = img.texture
+                if PIL_AVAILABLE:
+                    pil_img = PILImage.open(jet_path)
+                    if pil_img.mode != 'RGBA':
+                        pil_img = pil_img.convert('RGBA')
+                    # Create texture (or collect image for the sprite atlas)
+                    self.jet_texture = self.load_sprite_texture('jet', pil_img)
+                else:
+                    img = CoreImage(jet_path)
+                    self.jet_texture = img.texture
             except Exception as e:
                 print(f"Error loading jet image: {e}")
                 self.jet_texture = None
@@ -2650,44 +2933,16 @@ class BubbleShooterGame(Widget):
     def load_helicopter_image(self):
         """Load helicopter image texture with white background removed"""
         # Use the specified helicopter image
-        helicopter_path = r"C:\Users\aminz\OneDrive\Documents\GitHub\bubble-shooter\bubble-shooter\bubble-shooter\asset\helicopter_apache.jpg"
+        helicopter_path = self.get_asset_path("helicopter_apache.jpg")
         
-        # Also try relative path for cross-platform compatibility
-        if not os.path.exists(helicopter_path):
-            helicopter_path = self.get_asset_path("helicopter_apache.jpg")
-        
-        if helicopter_path and os.path.exists(helicopter_path):
+        if helicopter_path:
             try:
                 if PIL_AVAILABLE:
-                    # Use PIL to remove white background
-                    pil_img = PILImage.open(helicopter_path)
-                    # Convert to RGBA if not already
-                    if pil_img.mode != 'RGBA':
-                        pil_img = pil_img.convert('RGBA')
-                    
-                    # Get image data
-                    data = pil_img.getdata()
-                    # Create new image data with transparent white pixels
-                    new_data = []
-                    for item in data:
-                        # If pixel is white or near-white (threshold for slight variations)
-                        # Make it transparent
-                        if item[0] > 240 and item[1] > 240 and item[2] > 240:
-                            new_data.append((255, 255, 255, 0))  # Transparent
-                        else:
-                            new_data.append(item)  # Keep original
+                    # Use PIL to remove white background (cached on disk after the first run)
+                    pil_img = self.load_keyed_image(helicopter_path, 'helicopter')
                     
-                    pil_img.putdata(new_data)
-                    
-                    # Save to temporary file or use BytesIO
-                    import io
-                    img_bytes = io.BytesIO()
-                    pil_img.save(img_bytes, format='PNG')
-                    img_bytes.seek(0)
-                    
-                    # Load processed image
-                    img = CoreImage(img_bytes, ext='png')
-                    self.helicopter_texture = img.texture
+                    # Create texture (or collect image for the sprite atlas)
+                    self.helicopter_texture = self.load_sprite_texture('helicopter', pil_img)
                     print(f"Helicopter image loaded with background removed: {helicopter_path}")
                 else:
                     # Fallback: load image without processing
@@ -2706,44 +2961,16 @@ class BubbleShooterGame(Widget):
     def load_warship_image(self):
         """Load warship image texture with white background removed"""
         # Use the specified warship image
-        warship_path = r"C:\Users\aminz\OneDrive\Documents\GitHub\bubble-shooter\bubble-shooter\bubble-shooter\asset\warship.jpg"
+        warship_path = self.get_asset_path("warship.jpg")
 
-        # Also try relative path for cross-platform compatibility
-        if not os.path.exists(warship_path):
-            warship_path = self.get_asset_path("warship.jpg")
-
-        if warship_path and os.path.exists(warship_path):
+        if warship_path:
             try:
                 if PIL_AVAILABLE:
-                    # Use PIL to remove white background
-                    pil_img = PILImage.open(warship_path)
-                    # Convert to RGBA if not already
-                    if pil_img.mode != 'RGBA':
-                        pil_img = pil_img.convert('RGBA')
-
-                    # Get image data
-                    data = pil_img.getdata()
-                    # Create new image data with transparent white pixels
-                    new_data = []
-                    for item in data:
-                        # If pixel is white or near-white (threshold for slight variations)
-                        # Make it transparent
-                        if item[0] > 240 and item[1] > 240 and item[2] > 240:
-                            new_data.append((255, 255, 255, 0))  # Transparent
-                        else:
-                            new_data.append(item)  # Keep original
-
-                    pil_img.putdata(new_data)
-
-                    # Save to temporary file or use BytesIO
-                    import io
-                    img_bytes = io.BytesIO()
-                    pil_img.save(img_bytes, format='PNG')
-                    img_bytes.seek(0)
-
-                    # Load processed image
-                    img = CoreImage(img_bytes, ext='png')
-                    self.warship_texture = img.texture
+                    # Use PIL to remove white background (cached on disk after the first run)
+                    pil_img = self.load_keyed_image(warship_path, 'warship')
+                    
+                    # Create texture (or collect image for the sprite atlas)
+                    self.warship_texture = self.load_sprite_texture('warship', pil_img)
                 else:
                     # Fallback: load image without processing
                     img = CoreImage(warship_path)
@@ -2757,44 +2984,16 @@ class BubbleShooterGame(Widget):
     def load_balloon_image(self):
         """Load balloon image texture with white background removed"""
         # Use the specified balloon image
-        balloon_path = r"C:\Users\aminz\OneDrive\Documents\GitHub\bubble-shooter\bubble-shooter\bubble-shooter\asset\balloon.jpg"
+        balloon_path = self.get_asset_path("balloon.jpg")
 
-        # Also try relative path for cross-platform compatibility
-        if not os.path.exists(balloon_path):
-            balloon_path = self.get_asset_path("balloon.jpg")
-
-        if balloon_path and os.path.exists(balloon_path):
+        if balloon_path:
             try:
                 if PIL_AVAILABLE:
-                    # Use PIL to remove white background
-                    pil_img = PILImage.open(balloon_path)
-                    # Convert to RGBA if not already
-                    if pil_img.mode != 'RGBA':
-                        pil_img = pil_img.convert('RGBA')
-
-                    # Get image data
-                    data = pil_img.getdata()
-                    # Create new image data with transparent white pixels
-                    new_data = []
-                    for item in data:
-                        # If pixel is white or near-white (threshold for slight variations)
-                        # Make it transparent
-                        if item[0] > 240 and item[1] > 240 and item[2] > 240:
-                            new_data.append((255, 255, 255, 0))  # Transparent
-                        else:
-                            new_data.append(item)  # Keep original
-
-                    pil_img.putdata(new_data)
-
-                    # Save to temporary file or use BytesIO
-                    import io
-                    img_bytes = io.BytesIO()
-                    pil_img.save(img_bytes, format='PNG')
-                    img_bytes.seek(0)
-
-                    # Load processed image
-                    img = CoreImage(img_bytes, ext='png')
-                    self.balloon_texture = img.texture
+                    # Use PIL to remove white background (cached on disk after the first run)
+                    pil_img = self.load_keyed_image(balloon_path, 'balloon')
+                    
+                    # Create texture (or collect image for the sprite atlas)
+                    self.balloon_texture = self.load_sprite_texture('balloon', pil_img)
                 else:
                     # Fallback: load image without processing
                     img = CoreImage(balloon_path)
@@ -2808,20 +3007,24 @@ class BubbleShooterGame(Widget):
     def load_background_music(self):
         """Load and play background music"""
         # Use the specified background music file
-        music_path = r"C:\Users\aminz\OneDrive\Documents\GitHub\bubble-shooter\bubble-shooter\bubble-shooter\asset\kids-game-gaming-background-music-297733.mp3"
+        music_path = self.get_asset_path("kids-game-gaming-background-music-297733.mp3")
         
-        # Also try relative path for cross-platform compatibility
-        if not os.path.exists(music_path):
-            music_path = self.get_asset_path("kids-game-gaming-background-music-297733.mp3")
-        
-        if music_path and os.path.exists(music_path):
+        if music_path:
             try:
-                self.background_music = SoundLoader.load(music_path)
+                self.background_music = None
+                if STREAMING_MUSIC_AVAILABLE:
+                    # Streamed playback (decoded on demand); sound effects stay fully loaded for zero latency
+                    try:
+                        self.background_music = MusicSDL2(source=music_path)
+                    except Exception as e:
+                        print(f"Error streaming background music, loading it instead: {e}")
+                if not self.background_music:
+                    self.background_music = SoundLoader.load(music_path)
                 if self.background_music:
                     self.background_music.loop = True  # Loop the music
                     self.background_music.volume = 0.10  # Set volume to 10%
                     self.background_music.play()  # Start playing
-                    print(f"Background music loaded and playing at 10% volume: {music_path}")
+                    print(f"Background music loaded and playing at 10% volume ({type(self.background_music).__name__}): {music_path}")
                 else:
                     print(f"Failed to load background music: {music_path}")
             except Exception as e:
@@ -2832,89 +3035,51 @@ class BubbleShooterGame(Widget):
             self.background_music = None
     
     def load_explosion_sounds(self):
-        """Load sound effects for bubble explosions"""
-        # Load one_bubble.mp3 (for 1-3 bubbles)
-        one_bubble_path = self.get_asset_path("one_bubble.mp3")
-        if one_bubble_path and os.path.exists(one_bubble_path):
-            try:
-                self.sound_one_bubble = SoundLoader.load(one_bubble_path)
-                if not self.sound_one_bubble:
-                    print(f"Failed to load one_bubble.mp3")
-            except Exception as e:
-                print(f"Error loading one_bubble.mp3: {e}")
-        else:
-            print(f"Sound file not found: one_bubble.mp3")
-        
-        # Load two_bubbles.mp3 (for 4-6 bubbles)
-        two_bubbles_path = self.get_asset_path("two_bubbles.mp3")
-        if two_bubbles_path and os.path.exists(two_bubbles_path):
-            try:
-                self.sound_two_bubbles = SoundLoader.load(two_bubbles_path)
-                if not self.sound_two_bubbles:
-                    print(f"Failed to load two_bubbles.mp3")
-            except Exception as e:
-                print(f"Error loading two_bubbles.mp3: {e}")
-        else:
-            print(f"Sound file not found: two_bubbles.mp3")
-        
-        # Load four_bubbles.mp3 (for 7+ bubbles)
-        four_bubbles_path = self.get_asset_path("four_bubbles.mp3")
-        if four_bubbles_path and os.path.exists(four_bubbles_path):
-            try:
-                self.sound_four_bubbles = SoundLoader.load(four_bubbles_path)
-                if not self.sound_four_bubbles:
-                    print(f"Failed to load four_bubbles.mp3")
-            except Exception as e:
-                print(f"Error loading four_bubbles.mp3: {e}")
-        else:
-            print(f"Sound file not found: four_bubbles.mp3")
-        
-        # Load nice-shot.mp3 (for big scores)
-        nice_shot_path = self.get_asset_path("nice-shot.mp3")
-        if nice_shot_path and os.path.exists(nice_shot_path):
+        """Load sound effects for bubble explosions into a pool of preloaded copies"""
+        for name, filename in SFX_FILES.items():
+            sound_path = self.get_asset_path(filename)
+            if not sound_path:
+                print(f"Sound file not found: {filename}")
+                continue
             try:
-                self.sound_nice_shot = SoundLoader.load(nice_shot_path)
-                if not self.sound_nice_shot:
-                    print(f"Failed to load nice-shot.mp3")
+                # Load several copies up front so replaying never waits on a decode
+                copies = []
+                for _ in range(SFX_POOL_SIZE):
+                    sound = SoundLoader.load(sound_path)
+                    if not sound:
+                        break
+                    copies.append(sound)
+                if copies:
+                    self.sfx_pool[name] = deque(copies, SFX_POOL_SIZE)
+                else:
+                    print(f"Failed to load {filename}")
             except Exception as e:
-                print(f"Error loading nice-shot.mp3: {e}")
-        else:
-            print(f"Sound file not found: nice-shot.mp3")
+                print(f"Error loading {filename}: {e}")
+    
+    def play_sfx(self, name):
+        """Play the next pooled copy of a sound effect"""
+        pool = self.sfx_pool.get(name)
+        if not pool:
+            return
+        # Rotate through the copies so overlapping plays use different sounds
+        sound = pool[0]
+        pool.rotate(-1)
+        if sound.state == 'play':
+            sound.stop()
+        sound.seek(0)
+        sound.play()
     
     def play_nice_shot_sound(self):
         """Play nice shot sound for big scores"""
         try:
-            if self.sound_nice_shot:
-                self.sound_nice_shot.play()
+            self.play_sfx('nice_shot')
         except Exception as e:
             print(f"Error playing nice shot sound: {e}")
     
-    def load_diamond_sound(self):
-        """Load diamond sound effect"""
-        # Use the specified diamond sound file
-        diamond_sound_path = r"C:\Users\aminz\OneDrive\Documents\GitHub\bubble-shooter\bubble-shooter\bubble-shooter\asset\diamond.mp3"
-        
-        # Also try relative path for cross-platform compatibility
-        if not os.path.exists(diamond_sound_path):
-            diamond_sound_path = self.get_asset_path("diamond.mp3")
-        
-        if diamond_sound_path and os.path.exists(diamond_sound_path):
-            try:
-                self.sound_diamond = SoundLoader.load(diamond_sound_path)
-                if not self.sound_diamond:
-                    print(f"Failed to load diamond.mp3")
-                else:
-                    print(f"Successfully loaded diamond sound: {diamond_sound_path}")
-            except Exception as e:
-                print(f"Error loading diamond.mp3: {e}")
-        else:
-            print(f"Diamond sound file not found: {diamond_sound_path}")
-    
     def play_diamond_sound(self):
         """Play diamond sound when diamond is detected"""
         try:
-            if self.sound_diamond:
-                self.sound_diamond.play()
+            self.play_sfx('diamond')
         except Exception as e:
             print(f"Error playing diamond sound: {e}")
     
@@ -2926,85 +3091,86 @@ class BubbleShooterGame(Widget):
         try:
             if count <= 3:
                 # 1-3 bubbles: use one_bubble.mp3
-                if self.sound_one_bubble:
-                    self.sound_one_bubble.play()
+                self.play_sfx('one_bubble')
             elif count <= 6:
                 # 4-6 bubbles: use two_bubbles.mp3
-                if self.sound_two_bubbles:
-                    self.sound_two_bubbles.play()
+                self.play_sfx('two_bubbles')
             else:
                 # 7+ bubbles: use four_bubbles.mp3
-                if self.sound_four_bubbles:
-                    self.sound_four_bubbles.play()
+                self.play_sfx('four_bubbles')
         except Exception as e:
             print(f"Error playing explosion sound: {e}")
     
+    def remove_gold_background(self, pil_img):
+        """Make the gold image background (most common corner color) and near-white pixels transparent"""
+        # Threshold for background color matching (allow slight variations)
+        threshold = 30
+        threshold_sq = threshold * threshold
+        
+        if NUMPY_AVAILABLE:
+            arr = np.array(pil_img)
+            # Corner pixels (top-left, top-right, bottom-left, bottom-right), RGB only
+            corner_colors = [tuple(c) for c in arr[[0, 0, -1, -1], [0, -1, 0, -1], :3].tolist()]
+        else:
+            width, height = pil_img.size
+            corners = [
+                pil_img.getpixel((0, 0)),  # Top-left
+                pil_img.getpixel((width-1, 0)),  # Top-right
+                pil_img.getpixel((0, height-1)),  # Bottom-left
+                pil_img.getpixel((width-1, height-1))  # Bottom-right
+            ]
+            corner_colors = [tuple(c[:3]) for c in corners]  # RGB only
+        
+        # The most common corner color is likely the background
+        bg_color = Counter(corner_colors).most_common(1)[0][0]
+        
+        if NUMPY_AVAILABLE:
+            # Squared distance from background color (no sqrt per pixel)
+            diff = arr[..., :3].astype(np.int32) - np.array(bg_color, dtype=np.int32)
+            close_to_background = (diff * diff).sum(axis=-1) < threshold_sq
+            # Also check for very light colors (white/light backgrounds)
+            is_light = (arr[..., :3] > 240).all(axis=-1)
+            arr[close_to_background | is_light] = (255, 255, 255, 0)  # Transparent
+            pil_img = PILImage.fromarray(arr, 'RGBA')
+        else:
+            # Get image data
+            data = pil_img.getdata()
+            new_data = []
+            
+            bg_r, bg_g, bg_b = bg_color
+            for item in data:
+                r, g, b = item[0], item[1], item[2]
+                
+                # Squared distance from background color
+                dr = r - bg_r
+                dg = g - bg_g
+                db = b - bg_b
+                close_to_background = dr * dr + dg * dg + db * db < threshold_sq
+                
+                # Also check for very light colors (white/light backgrounds)
+                is_light = r > 240 and g > 240 and b > 240
+                
+                # If pixel is close to background color or very light, make it transparent
+                if close_to_background or is_light:
+                    new_data.append((255, 255, 255, 0))  # Transparent
+                else:
+                    new_data.append(item)  # Keep original
+            
+            pil_img.putdata(new_data)
+        return pil_img
+    
     def load_gold_image(self):
         """Load gold bubble image texture with background removed"""
         gold_path = self.get_asset_path("gold.jpg")
-        if gold_path and os.path.exists(gold_path):
+        if gold_path:
             try:
                 if PIL_AVAILABLE:
-                    # Use PIL to remove background
-                    pil_img = PILImage.open(gold_path)
-                    # Convert to RGBA if not already
-                    if pil_img.mode != 'RGBA':
-                        pil_img = pil_img.convert('RGBA')
-                    
-                    width, height = pil_img.size
-                    
-                    # Get corner pixels to determine background color
-                    # Check all four corners
-                    corners = [
-                        pil_img.getpixel((0, 0)),  # Top-left
-                        pil_img.getpixel((width-1, 0)),  # Top-right
-                        pil_img.getpixel((0, height-1)),  # Bottom-left
-                        pil_img.getpixel((width-1, height-1))  # Bottom-right
-                    ]
-                    
-                    # Find the most common corner color (likely the background)
-                    from collections import Counter
-                    corner_colors = [tuple(c[:3]) for c in corners]  # RGB only
-                    bg_color = Counter(corner_colors).most_common(1)[0][0]
-                    
-                    # Get image data
-                    data = pil_img.getdata()
-                    new_data = []
-                    
-                    # Threshold for background color matching (allow slight variations)
-                    threshold = 30
-                    
-                    for item in data:
-                        r, g, b = item[0], item[1], item[2]
-                        bg_r, bg_g, bg_b = bg_color
-                        
-                        # Calculate distance from background color
-                        color_distance = math.sqrt(
-                            (r - bg_r) ** 2 + 
-                            (g - bg_g) ** 2 + 
-                            (b - bg_b) ** 2
-                        )
-                        
-                        # Also check for very light colors (white/light backgrounds)
-                        is_light = r > 240 and g > 240 and b > 240
-                        
-                        # If pixel is close to background color or very light, make it transparent
-                        if color_distance < threshold or is_light:
-                            new_data.append((255, 255, 255, 0))  # Transparent
-                        else:
-                            new_data.append(item)  # Keep original
-                    
-                    pil_img.putdata(new_data)
+                    # Use PIL to remove background (cached on disk after the first run)
+                    pil_img = self.load_processed_image(gold_path, 'gold', self.remove_gold_background,
+                                                       self.get_sprite_source_size('gold'))
                     
-                    # Save to temporary file or use BytesIO
-                    import io
-                    img_bytes = io.BytesIO()
-                    pil_img.save(img_bytes, format='PNG')
-                    img_bytes.seek(0)
-                    
-                    # Load processed image
-                    img = CoreImage(img_bytes, ext='png')
-                    self.gold_texture = img.texture
+                    # Create texture (or collect image for the sprite atlas)
+                    self.gold_texture = self.load_sprite_texture('gold', pil_img)
                 else:
                     # Fallback: load image without processing
                     img = CoreImage(gold_path)
@@ -3030,161 +3196,277 @@ class BubbleShooterGame(Widget):
             Color(0.1, 0.1, 0.15)  # Dark gray-blue
             Rectangle(pos=(0, 0), size=(self.width, self.height))
     
+    def get_visible_bubbles(self, bubbles):
+        """Get the bubbles that overlap the screen"""
+        width = self.width
+        height = self.height
+        return [b for b in bubbles
+                if b.y + b.radius > 0 and b.y - b.radius < height
+                and b.x + b.radius > 0 and b.x - b.radius < width]
+    
+    def get_visible_grid_bubbles(self):
+        """Get grid bubbles that overlap the screen (off-screen bubbles can't be drawn or hit)"""
+        return self.get_visible_bubbles(self.grid_bubbles)
+    
+    def get_spatial_hash(self):
+        """Get on-screen grid bubbles bucketed into cells one bubble diameter wide"""
+        if self._spatial_dirty:
+            visible = self.get_visible_grid_bubbles()
+            # Cell size must cover the largest touching distance so only the 3x3 neighborhood needs checking
+            cell = max([self.bubble_radius] + [b.radius for b in visible]) * 2
+            spatial = defaultdict(list)
+            for b in visible:
+                spatial[(int(b.x // cell), int(b.y // cell))].append(b)
+            self._spatial = spatial
+            self._spatial_cell = cell
+            self._spatial_dirty = False
+        return self._spatial, self._spatial_cell
+    
     def draw_grid(self):
         """Draw bubble grid with 3D effects"""
-        for bubble in self.grid_bubbles:
-            self.draw_bubble_3d(bubble)
+        # Bubble bodies sharing a texture are drawn as one Mesh; indicators go on top afterwards
+        batches = {}  # id(texture) -> (texture, [(x, y, size), ...])
+        shape_rocks = []  # Rocks without an image, drawn with shapes
+        with_indicators = []
+        
+        # Only draw bubbles inside the viewport
+        for bubble in self.get_visible_grid_bubbles():
+            texture, size = self.get_bubble_body_texture(bubble)
+            if texture:
+                batch = batches.get(id(texture))
+                if batch is None:
+                    batch = batches[id(texture)] = (texture, [])
+                batch[1].append((bubble.x, bubble.y, size))
+            elif bubble.is_rock:
+                shape_rocks.append(bubble)
+            if not bubble.is_rock and (bubble.has_dynamite or bubble.has_mine or bubble.has_golden):
+                with_indicators.append(bubble)
+        
+        Color(1, 1, 1, 1)  # Full color (no tinting)
+        for texture, quads in batches.values():
+            self.draw_textured_bubbles(texture, quads)
+        for bubble in shape_rocks:
+            self.draw_rock_fallback(bubble, bubble.x, bubble.y)
+        for bubble in with_indicators:
+            self.draw_bubble_indicators(bubble, bubble.x, bubble.y)
     
     def draw_falling_bubbles(self):
         """Draw falling bubbles (rocks)"""
-        for bubble in self.falling_bubbles:
+        # Skip bubbles that have already fallen off screen
+        for bubble in self.get_visible_bubbles(self.falling_bubbles):
             self.draw_bubble_3d(bubble)
     
     def draw_shot_bubbles(self):
         """Draw bubbles that are being shot with 3D effects"""
-        for bubble in self.shot_bubbles:
+        for bubble in self.get_visible_bubbles(self.shot_bubbles):
             self.draw_bubble_3d(bubble)
     
-    def draw_bubble_3d(self, bubble, x=None, y=None):
-        """Draw a realistic bubble - transparent, glassy, with highlights like real soap bubbles"""
-        if x is None:
-            x = bubble.x
-        if y is None:
-            y = bubble.y
+    def get_cached_texture(self, cache, key):
+        """Get an entry from an LRU texture cache (None if missing)"""
+        texture = cache.get(key)
+        if texture is not None:
+            cache.move_to_end(key)  # Most recently used
+        return texture
+    
+    def cache_texture(self, cache, key, texture):
+        """Add an entry to an LRU texture cache, dropping the least recently used one when full"""
+        cache[key] = texture
+        if len(cache) > TEXTURE_CACHE_SIZE:
+            # Unreferenced textures are freed from GPU memory by Kivy
+            cache.popitem(last=False)
+    
+    def get_enemy_texture_size(self, width, height):
+        """Round a generated enemy texture size up to the cache bucket size"""
+        bucket = ENEMY_TEXTURE_BUCKET
+        return -(-int(width) // bucket) * bucket, -(-int(height) // bucket) * bucket
+    
+    def get_fallback_bubble_texture(self, color, radius):
+        """Get the basic-primitive bubble for a color/radius, rendered once into an Fbo texture"""
+        # Overlays (dynamite, mine, gold) are drawn on top separately, so only color and size matter
+        cache_key = (tuple(color), int(radius), round(self.scale * 20))
+        fbo = self.get_cached_texture(self.fallback_bubble_fbos, cache_key)
+        if fbo is None:
+            shadow_offset = 3 * self.scale
+            rim_width = 2 * self.scale
+            padding = int(shadow_offset + rim_width) + 2  # Room for the shadow and rim outside the ball
+            size = int(radius) * 2 + padding * 2
+            x = y = size / 2.0
+            
+            # Body, shaded bottom and rim colors
+            r, g, b = color[0], color[1], color[2]
+            bottom_darkness = 0.7
+            dark = (r * bottom_darkness, g * bottom_darkness, b * bottom_darkness, 1.0)
+            bright = (r * 1.3, g * 1.3, b * 1.3, 1.0)
+            diameter = radius * 2
+            
+            fbo = Fbo(size=(size, size))
+            with fbo:
+                ClearColor(0, 0, 0, 0)
+                ClearBuffers()
+                
+                # 1. Draw shadow (ball casts stronger shadow)
+                Color(0, 0, 0, 0.25)  # Stronger shadow for ball
+                Ellipse(pos=(x - radius + shadow_offset, y - radius - shadow_offset),
+                       size=(diameter, diameter))
+                
+                # 2. Draw main ball body - fully opaque solid ball
+                Color(r, g, b, 1.0)  # Fully opaque
+                Ellipse(pos=(x - radius, y - radius), size=(diameter, diameter))
+                
+                # 3. Draw darker bottom (simulate sphere shading)
+                # Bottom half darker for depth
+                Color(*dark)
+                # Draw darker bottom half
+                Ellipse(pos=(x - radius, y - radius), size=(diameter, radius))
+                
+                # 4. Draw highlight (bright spot at top-left for ball shine)
+                highlight_radius = radius * 0.4
+                highlight_x = x - radius * 0.3
+                highlight_y = y + radius * 0.3
+                Color(1, 1, 1, 0.5)  # White highlight
+                Ellipse(pos=(highlight_x - highlight_radius, highlight_y - highlight_radius),
+                       size=(highlight_radius * 2, highlight_radius * 2))
+                
+                # 5. Draw rim/edge (bright edge on lit side)
+                Color(*bright)  # Brighter rim
+                Line(circle=(x, y, radius), width=rim_width)
+            fbo.draw()
+            # Keep the Fbo alive - it owns the texture
+            self.cache_texture(self.fallback_bubble_fbos, cache_key, fbo)
+        return fbo.texture
+    
+    def get_bubble_body_texture(self, bubble):
+        """Get the texture and draw size for a bubble's body, or (None, 0) if it must be drawn with shapes"""
         radius = bubble.radius
-        color = bubble.get_color()
         
-        # Special drawing for rocks - use rock image if available
+        # Special drawing for rocks - use rock/diamond image if available
         if bubble.is_rock:
-            # Check if showing diamond
             if bubble.showing_diamond:
                 # Load texture lazily if not already loaded
                 if self.diamond_texture is None:
                     self.load_diamond_image()
-                
-                # Use diamond image if available
-                if self.diamond_texture:
-                    # Draw diamond image centered on bubble
-                    diamond_size = radius * 2  # Size to match bubble size
-                    Color(1, 1, 1, 1)  # Full color (no tinting)
-                    Rectangle(texture=self.diamond_texture,
-                             pos=(x - diamond_size / 2, y - diamond_size / 2),
-                             size=(diamond_size, diamond_size))
-                else:
-                    # Fallback: draw diamond shape - bright blue/cyan with sparkles
-                    # Outer glow
-                    Color(0.5, 0.8, 1.0, 0.3)  # Light blue glow
-                    Ellipse(pos=(x - radius * 1.2, y - radius * 1.2), size=(radius * 2.4, radius * 2.4))
-                    
-                    # Diamond shape - draw as rotated square (diamond)
-                    diamond_size = radius * 1.6
-                    Color(0.3, 0.8, 1.0, 1.0)  # Bright cyan/blue
-                    # Draw diamond as 4 triangles forming a diamond
-                    # Top triangle
-                    Triangle(points=[
-                        x, y + diamond_size * 0.6,  # Top point
-                        x - diamond_size * 0.5, y,  # Left point
-                        x + diamond_size * 0.5, y   # Right point
-                    ])
-                    # Bottom triangle
-                    Triangle(points=[
-                        x, y - diamond_size * 0.6,  # Bottom point
-                        x - diamond_size * 0.5, y,  # Left point
-                        x + diamond_size * 0.5, y   # Right point
-                    ])
-                    
-                    # Add highlights for sparkle effect
-                    Color(1.0, 1.0, 1.0, 0.8)  # White highlight
-                    highlight_size = radius * 0.3
-                    Ellipse(pos=(x - radius * 0.3 - highlight_size/2, y + radius * 0.3 - highlight_size/2), 
-                           size=(highlight_size, highlight_size))
-                    Ellipse(pos=(x + radius * 0.2 - highlight_size/2, y - radius * 0.2 - highlight_size/2), 
-                           size=(highlight_size * 0.6, highlight_size * 0.6))
+                texture = self.diamond_texture
             else:
                 # Load texture lazily if not already loaded
                 if self.rock_texture is None:
                     self.load_rock_image()
-                
-                # Use rock image if available
-                if self.rock_texture:
-                    # Draw rock image centered on bubble
-                    rock_size = radius * 2  # Size to match bubble size
-                    Color(1, 1, 1, 1)  # Full color (no tinting)
-                    Rectangle(texture=self.rock_texture,
-                             pos=(x - rock_size / 2, y - rock_size / 2),
-                             size=(rock_size, rock_size))
-                else:
-                    # Fallback: draw dark stone appearance if image not available
-                    # Outer dark border for visibility
-                    Color(0.1, 0.1, 0.15, 1)  # Very dark border
-                    Ellipse(pos=(x - radius * 1.1, y - radius * 1.1), size=(radius * 2.2, radius * 2.2))
-                    
-                    # Main rock body - dark stone gray
-                    Color(0.2, 0.2, 0.25, 1)  # Dark stone gray
-                    Ellipse(pos=(x - radius, y - radius), size=(radius * 2, radius * 2))
-            
-            return  # Don't draw normal bubble for rocks
+                texture = self.rock_texture
+            # Image size matches bubble size
+            return (texture, radius * 2) if texture else (None, 0)
         
         # Try to use enhanced graphics texture if available
-        has_special = bubble.has_dynamite or bubble.has_mine or bubble.has_golden
-        use_enhanced = self.graphics_enhancer and PIL_AVAILABLE
-        
-        if use_enhanced:
-            # Create cache key for this bubble type
-            cache_key = f"bubble_{bubble.element_type}_{int(radius)}_{has_special}"
+        if self.graphics_enhancer and PIL_AVAILABLE:
+            # Create cache key for this bubble type (element + flags + scale bin)
+            # Scale is binned to 5% steps so resizes reuse already generated textures
+            cache_key = (bubble.element_type, bubble.has_dynamite, bubble.has_mine,
+                         bubble.has_golden, round(self.scale * 20))
             
             # Get or create texture
-            texture = self.bubble_textures.get(cache_key)
+            texture = self.get_cached_texture(self.bubble_textures, cache_key)
             if texture is None:
+                has_special = bubble.has_dynamite or bubble.has_mine or bubble.has_golden
                 texture = self.graphics_enhancer.create_bubble_texture(
-                    radius, color, bubble.element_type, has_special
+                    radius, bubble.get_color(), bubble.element_type, has_special
                 )
                 if texture:
-                    self.bubble_textures[cache_key] = texture
+                    self.cache_texture(self.bubble_textures, cache_key, texture)
             
-            # Draw using texture if available
             if texture:
-                texture_size = texture.width / 2.5  # Account for 2.5x generation scale
-                Color(1, 1, 1, 1)  # Full color
-                Rectangle(texture=texture,
-                         pos=(x - texture_size / 2, y - texture_size / 2),
-                         size=(texture_size, texture_size))
-            else:
-                use_enhanced = False  # Fall back to basic drawing
+                # Size from current radius (matches 2.5x generation scale + padding),
+                # so a texture from the same scale bin stretches to the exact size
+                return texture, (int(radius * 2.5) * 2 + 20) / 2.5
         
         # Fallback to basic drawing if enhanced graphics not available
-        if not use_enhanced:
-            # Draw ball-like appearance with basic primitives
-            
-            # 1. Draw shadow (ball casts stronger shadow)
-            shadow_offset = 3 * self.scale
-            Color(0, 0, 0, 0.25)  # Stronger shadow for ball
-            Ellipse(pos=(x - radius + shadow_offset, y - radius - shadow_offset),
-                   size=(radius * 2, radius * 2))
+        # Ball-like appearance from basic primitives, rendered once per color/size
+        texture = self.get_fallback_bubble_texture(bubble.get_color(), radius)
+        return texture, texture.width
+    
+    def draw_rock_fallback(self, bubble, x, y):
+        """Draw a rock (or revealed diamond) with shapes when its image is not available"""
+        radius = bubble.radius
+        if bubble.showing_diamond:
+            # Fallback: draw diamond shape - bright blue/cyan with sparkles
+            # Outer glow
+            Color(0.5, 0.8, 1.0, 0.3)  # Light blue glow
+            Ellipse(pos=(x - radius * 1.2, y - radius * 1.2), size=(radius * 2.4, radius * 2.4))
+            
+            # Diamond shape - draw as rotated square (diamond)
+            diamond_size = radius * 1.6
+            Color(0.3, 0.8, 1.0, 1.0)  # Bright cyan/blue
+            # Draw diamond as 4 triangles forming a diamond
+            # Top triangle
+            Triangle(points=[
+                x, y + diamond_size * 0.6,  # Top point
+                x - diamond_size * 0.5, y,  # Left point
+                x + diamond_size * 0.5, y   # Right point
+            ])
+            # Bottom triangle
+            Triangle(points=[
+                x, y - diamond_size * 0.6,  # Bottom point
+                x - diamond_size * 0.5, y,  # Left point
+                x + diamond_size * 0.5, y   # Right point
+            ])
+            
+            # Add highlights for sparkle effect
+            Color(1.0, 1.0, 1.0, 0.8)  # White highlight
+            highlight_size = radius * 0.3
+            Ellipse(pos=(x - radius * 0.3 - highlight_size/2, y + radius * 0.3 - highlight_size/2), 
+                   size=(highlight_size, highlight_size))
+            Ellipse(pos=(x + radius * 0.2 - highlight_size/2, y - radius * 0.2 - highlight_size/2), 
+                   size=(highlight_size * 0.6, highlight_size * 0.6))
+        else:
+            # Fallback: draw dark stone appearance if image not available
+            # Outer dark border for visibility
+            Color(0.1, 0.1, 0.15, 1)  # Very dark border
+            Ellipse(pos=(x - radius * 1.1, y - radius * 1.1), size=(radius * 2.2, radius * 2.2))
             
-            # 2. Draw main ball body - fully opaque solid ball
-            Color(color[0], color[1], color[2], 1.0)  # Fully opaque
+            # Main rock body - dark stone gray
+            Color(0.2, 0.2, 0.25, 1)  # Dark stone gray
             Ellipse(pos=(x - radius, y - radius), size=(radius * 2, radius * 2))
-            
-            # 3. Draw darker bottom (simulate sphere shading)
-            # Bottom half darker for depth
-            bottom_darkness = 0.7
-            Color(color[0] * bottom_darkness, color[1] * bottom_darkness, color[2] * bottom_darkness, 1.0)
-            # Draw darker bottom half
-            Ellipse(pos=(x - radius, y - radius), size=(radius * 2, radius))
-            
-            # 4. Draw highlight (bright spot at top-left for ball shine)
-            highlight_radius = radius * 0.4
-            highlight_x = x - radius * 0.3
-            highlight_y = y + radius * 0.3
-            Color(1, 1, 1, 0.5)  # White highlight
-            Ellipse(pos=(highlight_x - highlight_radius, highlight_y - highlight_radius),
-                   size=(highlight_radius * 2, highlight_radius * 2))
-            
-            # 5. Draw rim/edge (bright edge on lit side)
-            rim_width = 2 * self.scale
-            Color(color[0] * 1.3, color[1] * 1.3, color[2] * 1.3, 1.0)  # Brighter rim
-            Line(circle=(x, y, radius), width=rim_width)
+    
+    def draw_textured_bubbles(self, texture, quads):
+        """Draw many copies of one texture as a single Mesh - quads are (center x, center y, size)"""
+        # Corner texture coordinates (handles atlas regions too): bottom-left, bottom-right, top-right, top-left
+        u0, v0, u1, v1, u2, v2, u3, v3 = texture.tex_coords
+        vertices = []
+        indices = []
+        for i, (x, y, size) in enumerate(quads):
+            half = size / 2
+            left = x - half
+            right = x + half
+            bottom = y - half
+            top = y + half
+            vertices.extend((left, bottom, u0, v0, right, bottom, u1, v1,
+                             right, top, u2, v2, left, top, u3, v3))
+            base = i * 4
+            indices.extend((base, base + 1, base + 2, base, base + 2, base + 3))
+        Mesh(vertices=vertices, indices=indices, mode='triangles', texture=texture)
+    
+    def draw_bubble_3d(self, bubble, x=None, y=None):
+        """Draw a realistic bubble - transparent, glassy, with highlights like real soap bubbles"""
+        if x is None:
+            x = bubble.x
+        if y is None:
+            y = bubble.y
+        
+        texture, size = self.get_bubble_body_texture(bubble)
+        if texture:
+            half = size / 2
+            Color(1, 1, 1, 1)  # Full color (no tinting)
+            Rectangle(texture=texture,
+                     pos=(x - half, y - half),
+                     size=(size, size))
+        elif bubble.is_rock:
+            self.draw_rock_fallback(bubble, x, y)
+        
+        if not bubble.is_rock:  # Rocks have no indicators
+            self.draw_bubble_indicators(bubble, x, y)
+    
+    def draw_bubble_indicators(self, bubble, x, y):
+        """Draw the dynamite, mine and golden indicators on top of a bubble"""
+        radius = bubble.radius
+        scale = self.scale
+        thick_width = 6 * scale  # 2 * 3
         
         # 5. Draw dynamite indicator if bubble has dynamite
         if bubble.has_dynamite:
@@ -3210,10 +3492,10 @@ class BubbleShooterGame(Widget):
                 fuse_length = radius * 0.3
                 fuse_y = stick_y + stick_height
                 Color(0.8, 0.8, 0.3, 0.9)  # Yellow/light color for fuse
-                Line(points=[x, fuse_y, x, fuse_y + fuse_length], width=6 * self.scale)  # 2 * 3
+                Line(points=[x, fuse_y, x, fuse_y + fuse_length], width=thick_width)
                 # Draw fuse tip (small circle)
                 Color(1, 0.3, 0, 0.9)  # Orange-red for lit fuse
-                tip_size = 6 * self.scale  # 2 * 3
+                tip_size = thick_width
                 Ellipse(pos=(x - tip_size, fuse_y + fuse_length - tip_size), size=(tip_size * 2, tip_size * 2))
         
         # 6. Draw mine indicator if bubble has a mine
@@ -3235,21 +3517,22 @@ class BubbleShooterGame(Widget):
                     x - mine_size * 0.5, y - mine_size * 0.3,  # Bottom left
                     x + mine_size * 0.5, y - mine_size * 0.3,  # Bottom right
                 ]
-                Color(1, 0.8, 0, 0.9)  # Yellow-orange warning color
-                Line(points=triangle_points, width=6 * self.scale, close=True)  # 2 * 3
-                
-                # Fill triangle slightly
+                # Fill triangle slightly (one Mesh triangle: x, y, u, v per vertex)
                 Color(1, 0.9, 0.3, 0.6)  # Lighter yellow fill
-                # Draw filled triangle using multiple lines (simplified)
-                for i in range(len(triangle_points) // 2 - 1):
-                    Line(points=[x, y, triangle_points[i*2], triangle_points[i*2+1]], width=3 * self.scale)  # 1 * 3
+                Mesh(vertices=[triangle_points[0], triangle_points[1], 0, 0,
+                               triangle_points[2], triangle_points[3], 0, 0,
+                               triangle_points[4], triangle_points[5], 0, 0],
+                     indices=[0, 1, 2], mode='triangles')
+                
+                Color(1, 0.8, 0, 0.9)  # Yellow-orange warning color
+                Line(points=triangle_points, width=thick_width, close=True)
                 
                 # Draw exclamation mark in center
                 Color(1, 0.2, 0.2, 1)  # Red for exclamation
                 # Exclamation mark line
-                Line(points=[x, y - mine_size * 0.15, x, y + mine_size * 0.15], width=6 * self.scale)  # 2 * 3
+                Line(points=[x, y - mine_size * 0.15, x, y + mine_size * 0.15], width=thick_width)
                 # Exclamation mark dot
-                dot_size = 6 * self.scale  # 2 * 3
+                dot_size = thick_width
                 Ellipse(pos=(x - dot_size, y + mine_size * 0.2 - dot_size), size=(dot_size * 2, dot_size * 2))
         
         # 7. Draw golden bubble indicator if bubble is golden
@@ -3265,8 +3548,8 @@ class BubbleShooterGame(Widget):
                          size=(gold_size, gold_size))
             else:
                 # Fallback: Draw golden glow/ring if image not loaded
-                golden_ring_width = 9 * self.scale  # 3 * 3
-                golden_ring_radius = radius + 6 * self.scale  # 2 * 3
+                golden_ring_width = 9 * scale  # 3 * 3
+                golden_ring_radius = radius + thick_width
                 
                 # Outer golden glow
                 Color(1, 0.84, 0.0, 0.8)  # Gold color with transparency
@@ -3274,26 +3557,41 @@ class BubbleShooterGame(Widget):
                 
                 # Inner golden highlight
                 Color(1, 0.9, 0.3, 0.9)  # Brighter gold
-                Line(circle=(x, y, golden_ring_radius - 3 * self.scale), width=6 * self.scale)  # 2 * 3
+                Line(circle=(x, y, golden_ring_radius - 3 * scale), width=thick_width)
                 
                 # Draw star symbol in center (simplified as small star)
                 star_size = radius * 0.6
-                star_points = []
-                num_points = 5
-                for i in range(num_points * 2):
-                    angle = (i * math.pi / num_points) - math.pi / 2
-                    if i % 2 == 0:
-                        # Outer point
-                        star_radius = star_size / 2
-                    else:
-                        # Inner point
-                        star_radius = star_size / 4
-                    px = x + star_radius * math.cos(angle)
-                    py = y + star_radius * math.sin(angle)
-                    star_points.extend([px, py])
+                star_points = self.get_star_points(x, y, star_size / 2, star_size / 4)
                 
                 Color(1, 0.95, 0.5, 1)  # Bright gold for star
-                Line(points=star_points, width=6 * self.scale, close=True)  # 2 * 3
+                Line(points=star_points, width=thick_width, close=True)
+    
+    def draw_enemy_shapes(self, kind, x, y, width, height, direction, draw_shapes):
+        """Draw an enemy's basic-shape fallback from a texture rendered once per size/direction"""
+        tex_width, tex_height = self.get_enemy_texture_size(width, height)
+        cache_key = (kind, tex_width, tex_height, direction)
+        fbo = self.get_cached_texture(self.enemy_shape_fbos, cache_key)
+        if fbo is None:
+            # Room for parts outside the nominal box (rotor blades, tail fins) plus line width
+            half_width = int(tex_width * 0.6) + 4
+            half_height = int(tex_height * 0.7 + tex_width * 0.1) + 4
+            fbo = Fbo(size=(half_width * 2, half_height * 2))
+            with fbo:
+                ClearColor(0, 0, 0, 0)
+                ClearBuffers()
+                draw_shapes(half_width, half_height, tex_width, tex_height, direction)
+            fbo.draw()
+            # Keep the Fbo alive - it owns the texture
+            self.cache_texture(self.enemy_shape_fbos, cache_key, fbo)
+        
+        # Stretch from the bucketed texture size to the exact size
+        texture = fbo.texture
+        draw_width = texture.width * width / tex_width
+        draw_height = texture.height * height / tex_height
+        Color(1, 1, 1, 1)
+        Rectangle(texture=texture,
+                 pos=(x - draw_width / 2, y - draw_height / 2),
+                 size=(draw_width, draw_height))
     
     def draw_airplane(self):
         """Draw the fighter jet if it's active using image texture"""
@@ -3305,6 +3603,9 @@ class BubbleShooterGame(Widget):
         width = self.airplane.width * self.scale
         height = self.airplane.height * self.scale
         
+        # Load texture lazily if not already loaded
+        self.load_sprite_once('jet')
+        
         # Use jet image if available
         if self.jet_texture:
             Color(1, 1, 1, 1)
@@ -3327,16 +3628,17 @@ class BubbleShooterGame(Widget):
                        GRAPHICS_ENHANCER_AVAILABLE and PIL_AVAILABLE)
         
         if use_enhanced:
-            # Generate or get cached fighter jet texture
-            cache_key = f"fighter_jet_{int(width)}_{int(height)}_{self.airplane.direction}"
-            airplane_texture = self.bazooka_textures.get(cache_key)
+            # Generate or get cached fighter jet texture (size bucketed so small resizes reuse it)
+            tex_width, tex_height = self.get_enemy_texture_size(width, height)
+            cache_key = ('fighter_jet', tex_width, tex_height, self.airplane.direction)
+            airplane_texture = self.get_cached_texture(self.bazooka_textures, cache_key)
             
             if airplane_texture is None:
                 airplane_texture = self.graphics_enhancer.create_fighter_jet_texture(
-                    width, height, self.airplane.direction
+                    tex_width, tex_height, self.airplane.direction
                 )
                 if airplane_texture:
-                    self.bazooka_textures[cache_key] = airplane_texture
+                    self.cache_texture(self.bazooka_textures, cache_key, airplane_texture)
             
             if airplane_texture:
                 Color(1, 1, 1, 1)
@@ -3346,13 +3648,17 @@ class BubbleShooterGame(Widget):
                 return
         
         # Fallback to basic drawing if enhanced graphics not available
+        self.draw_enemy_shapes('jet', x, y, width, height, self.airplane.direction, self.draw_jet_shapes)
+    
+    def draw_jet_shapes(self, x, y, width, height, direction):
+        """Draw the fighter jet from basic shapes"""
         # Draw fighter jet body (main fuselage)
         Color(0.3, 0.3, 0.4, 1)  # Gray-blue color
         Rectangle(pos=(x - width/2, y - height/2), size=(width * 0.4, height * 0.6))
         
         # Draw nose cone (pointed)
         nose_length = width * 0.3
-        if self.airplane.direction > 0:  # Moving right
+        if direction > 0:  # Moving right
             nose_points = [
                 x + width * 0.2, y,
                 x + width * 0.2 + nose_length, y - height * 0.15,
@@ -3372,7 +3678,7 @@ class BubbleShooterGame(Widget):
         Color(0.25, 0.25, 0.35, 1)  # Slightly darker
         
         # Top wing (swept back)
-        if self.airplane.direction > 0:
+        if direction > 0:
             top_wing_points = [
                 x - width * 0.15, y - height * 0.3,
                 x + width * 0.25, y - height * 0.3 - wing_height,
@@ -3389,7 +3695,7 @@ class BubbleShooterGame(Widget):
         Line(points=top_wing_points, close=True, width=2)
         
         # Bottom wing (swept back)
-        if self.airplane.direction > 0:
+        if direction > 0:
             bottom_wing_points = [
                 x - width * 0.15, y + height * 0.3,
                 x + width * 0.25, y + height * 0.3 + wing_height,
@@ -3430,7 +3736,7 @@ class BubbleShooterGame(Widget):
         # Draw cockpit (canopy)
         canopy_width = width * 0.25
         canopy_height = height * 0.2
-        canopy_x = x + width * 0.1 if self.airplane.direction > 0 else x - width * 0.1
+        canopy_x = x + width * 0.1 if direction > 0 else x - width * 0.1
         canopy_y = y - height * 0.2
         Color(0.4, 0.6, 0.8, 0.8)  # Blue tinted canopy
         Ellipse(pos=(canopy_x - canopy_width/2, canopy_y - canopy_height/2),
@@ -3446,6 +3752,9 @@ class BubbleShooterGame(Widget):
         width = self.helicopter.width * self.scale
         height = self.helicopter.height * self.scale
         
+        # Load texture lazily if not already loaded
+        self.load_sprite_once('helicopter')
+        
         # Use helicopter image if available
         if self.helicopter_texture:
             Color(1, 1, 1, 1)
@@ -3468,16 +3777,17 @@ class BubbleShooterGame(Widget):
         
         if use_enhanced:
             # Generate or get cached helicopter texture (always generate facing right, mirror at render)
-            cache_key = f"helicopter_{int(width)}_{int(height)}"
-            helicopter_texture = self.bazooka_textures.get(cache_key)
+            tex_width, tex_height = self.get_enemy_texture_size(width, height)
+            cache_key = ('helicopter', tex_width, tex_height)
+            helicopter_texture = self.get_cached_texture(self.bazooka_textures, cache_key)
             
             if helicopter_texture is None:
                 # Always generate texture facing right (direction=1)
                 helicopter_texture = self.graphics_enhancer.create_helicopter_texture(
-                    width, height, direction=1
+                    tex_width, tex_height, direction=1
                 )
                 if helicopter_texture:
-                    self.bazooka_textures[cache_key] = helicopter_texture
+                    self.cache_texture(self.bazooka_textures, cache_key, helicopter_texture)
             
             if helicopter_texture:
                 Color(1, 1, 1, 1)
@@ -3488,6 +3798,10 @@ class BubbleShooterGame(Widget):
                 return
         
         # Fallback to basic drawing if enhanced graphics not available
+        self.draw_enemy_shapes('helicopter', x, y, width, height, self.helicopter.direction, self.draw_helicopter_shapes)
+    
+    def draw_helicopter_shapes(self, x, y, width, height, direction):
+        """Draw the helicopter from basic shapes"""
         # Draw helicopter body (main cabin)
         Color(0.2, 0.5, 0.2, 1)  # Green color
         body_width = width * 0.5
@@ -3507,7 +3821,7 @@ class BubbleShooterGame(Widget):
         
         # Draw tail rotor (small circle on the back)
         tail_rotor_size = width * 0.15
-        tail_x = x + body_width/2 if self.helicopter.direction > 0 else x - body_width/2
+        tail_x = x + body_width/2 if direction > 0 else x - body_width/2
         Color(0.3, 0.3, 0.3, 1)
         Ellipse(pos=(tail_x - tail_rotor_size/2, y), 
                size=(tail_rotor_size, tail_rotor_size))
@@ -3515,7 +3829,7 @@ class BubbleShooterGame(Widget):
         # Draw tail boom
         tail_length = width * 0.3
         Color(0.25, 0.45, 0.25, 1)  # Slightly darker green
-        if self.helicopter.direction > 0:
+        if direction > 0:
             Rectangle(pos=(x + body_width/2, y - body_height * 0.1), 
                      size=(tail_length, body_height * 0.2))
         else:
@@ -3546,18 +3860,21 @@ class BubbleShooterGame(Widget):
         height = self.warship.height * self.scale
 
         # Load texture lazily if not already loaded
-        if self.warship_texture is None:
-            self.load_warship_image()
+        self.load_sprite_once('warship')
 
         # Use warship image if available
         if self.warship_texture:
             Color(1, 1, 1, 1)
-            # Mirror horizontally if moving left (using negative width)
+            # Mirror horizontally if moving left (swapped texture coordinates, computed once per texture)
             if self.warship.direction < 0:
-                # For left direction, mirror by using negative width
-                Rectangle(texture=self.warship_texture,
-                         pos=(x + width/2, y - height/2),
-                         size=(-width, height))
+                texture = self.warship_texture
+                if self.warship_mirrored is None or self.warship_mirrored[0] is not texture:
+                    # Corners are bottom-left, bottom-right, top-right, top-left (handles atlas regions too)
+                    u0, v0, u1, v1, u2, v2, u3, v3 = texture.tex_coords
+                    self.warship_mirrored = (texture, (u1, v1, u0, v0, u3, v3, u2, v2))
+                Rectangle(texture=texture, tex_coords=self.warship_mirrored[1],
+                         pos=(x - width/2, y - height/2),
+                         size=(width, height))
             else:
                 # Normal direction (right)
                 Rectangle(texture=self.warship_texture,
@@ -3590,16 +3907,11 @@ class BubbleShooterGame(Widget):
 
         # Draw movement direction indicator (bow/stern)
         Color(0.2, 0.2, 0.2, 1)  # Dark gray
-        if self.warship.direction > 0:
-            # Moving right - draw bow (pointed end) on right
-            bow_points = [(x + width/2, y), (x + width/2 - width*0.1, y - height/2),
-                         (x + width/2 - width*0.1, y + height/2)]
-            Triangle(points=[coord for point in bow_points for coord in point])
-        else:
-            # Moving left - draw bow (pointed end) on left
-            bow_points = [(x - width/2, y), (x - width/2 + width*0.1, y - height/2),
-                         (x - width/2 + width*0.1, y + height/2)]
-            Triangle(points=[coord for point in bow_points for coord in point])
+        # Bow (pointed end) on the side the ship is moving towards
+        side = 1 if self.warship.direction > 0 else -1
+        bow_x = x + side * width / 2
+        back_x = bow_x - side * width * 0.1
+        Triangle(points=[bow_x, y, back_x, y - height / 2, back_x, y + height / 2])
 
     def draw_balloon(self):
         """Draw the balloon if it's active using image texture"""
@@ -3612,8 +3924,7 @@ class BubbleShooterGame(Widget):
         height = self.balloon.height * self.scale
 
         # Load texture lazily if not already loaded
-        if self.balloon_texture is None:
-            self.load_balloon_image()
+        self.load_sprite_once('balloon')
 
         # Use balloon image if available
         if self.balloon_texture:
@@ -3666,14 +3977,14 @@ class BubbleShooterGame(Widget):
             # Calculate segment direction for orientation
             if i < num_segments - 1:
                 next_x, next_y = self.snake.segment_positions[i + 1]
-                angle = math.atan2(next_y - seg_y, next_x - seg_x)
-                cos_a = math.cos(angle)
-                sin_a = math.sin(angle)
+                angle = atan2(next_y - seg_y, next_x - seg_x)
+                cos_a = cos(angle)
+                sin_a = sin(angle)
             elif i > 0:
                 prev_x, prev_y = self.snake.segment_positions[i - 1]
-                angle = math.atan2(seg_y - prev_y, seg_x - prev_x)
-                cos_a = math.cos(angle)
-                sin_a = math.sin(angle)
+                angle = atan2(seg_y - prev_y, seg_x - prev_x)
+                cos_a = cos(angle)
+                sin_a = sin(angle)
             else:
                 if self.snake.direction > 0:
                     angle = 0
@@ -3797,9 +4108,9 @@ class BubbleShooterGame(Widget):
             # Calculate head direction for orientation
             if num_segments > 1:
                 next_x, next_y = self.snake.segment_positions[1]
-                head_angle = math.atan2(head_y - next_y, head_x - next_x)
-                head_cos = math.cos(head_angle)
-                head_sin = math.sin(head_angle)
+                head_angle = atan2(head_y - next_y, head_x - next_x)
+                head_cos = cos(head_angle)
+                head_sin = sin(head_angle)
             else:
                 if self.snake.direction > 0:
                     head_angle = 0
@@ -3833,8 +4144,8 @@ class BubbleShooterGame(Widget):
             for scale_idx in range(num_head_scales):
                 scale_angle = (scale_idx / num_head_scales) * math.pi * 2
                 scale_dist = head_radius * (0.4 + (scale_idx % 2) * 0.15)
-                scale_x = head_x + head_cos * scale_dist * math.cos(scale_angle) - head_sin * scale_dist * math.sin(scale_angle)
-                scale_y = head_y + head_sin * scale_dist * math.cos(scale_angle) + head_cos * scale_dist * math.sin(scale_angle)
+                scale_x = head_x + head_cos * scale_dist * cos(scale_angle) - head_sin * scale_dist * sin(scale_angle)
+                scale_y = head_y + head_sin * scale_dist * cos(scale_angle) + head_cos * scale_dist * sin(scale_angle)
                 
                 scale_size = head_radius * 0.15
                 Color(head_base_r * 1.15, head_base_g * 1.1, head_base_b * 0.95, 0.7)
@@ -3989,8 +4300,8 @@ class BubbleShooterGame(Widget):
             # Forked tips
             fork_length = tongue_length * 0.35
             fork_angle = 0.3  # radians
-            fork_cos = math.cos(fork_angle)
-            fork_sin = math.sin(fork_angle)
+            fork_cos = cos(fork_angle)
+            fork_sin = sin(fork_angle)
             
             # Left fork
             fork_left_end_x = tongue_end_x - eye_dir_x * fork_length * fork_cos + eye_dir_y * fork_length * fork_sin
@@ -4004,252 +4315,363 @@ class BubbleShooterGame(Widget):
             Line(points=[tongue_end_x, tongue_end_y, fork_right_end_x, fork_right_end_y],
                  width=max(1, int(tongue_width * 0.6)))
 
-    def draw_shooter(self):
-        """Draw bazooka-style shooter with laser aim"""
-        x, y = self.shooter_x, self.shooter_y
+    def find_laser_hit(self, start_x, start_y, dir_x, dir_y):
+        """Get the first point where a ray (unit direction) enters a grid bubble, or (None, None)"""
+        if not self.grid_bubbles:
+            return None, None
+        
+        if NUMPY_AVAILABLE:
+            _, bx, by, brad, _ = self.get_grid_arrays()
+            dx = bx - start_x
+            dy = by - start_y
+            # Project bubble centers onto the ray; squared distance from center to the ray
+            proj = dx * dir_x + dy * dir_y
+            perp_sq = dx * dx + dy * dy - proj * proj
+            rad_sq = brad * brad
+            # Only bubbles in front that the ray actually crosses (usually a handful)
+            crossed = np.flatnonzero((proj >= 0) & (perp_sq <= rad_sq))
+            if not len(crossed):
+                return None, None
+            # Distance along the ray to the first intersection
+            t = proj[crossed] - np.sqrt(rad_sq[crossed] - perp_sq[crossed])
+            t = t[t > 0]
+            if not len(t):
+                return None, None
+            hit_t = float(t.min())
+        else:
+            hit_t = self.trace_laser_cells(start_x, start_y, dir_x, dir_y)
+            if hit_t is None:
+                return None, None
+        
+        return start_x + dir_x * hit_t, start_y + dir_y * hit_t
+    
+    def build_bazooka(self):
+        """Build the bazooka graphics once, in local coordinates aimed along +x (rebuilt when the size changes)"""
         # Scale bazooka size based on bubble radius (make it bigger)
         bubble_radius = self.bubble_radius
+        scale = self.scale
         shooter_length = bubble_radius * 6.0  # 6x bubble radius for length (x2 of original 3.0)
         barrel_width = bubble_radius * 0.9 * 1.5  # Barrel width x1.5
         base_radius = bubble_radius * 0.85  # Base radius proportional to bubble
         tip_radius = bubble_radius * 0.3  # Tip radius proportional to bubble
+        half_width = barrel_width / 2
+        end_x = shooter_length  # Tip of bazooka
+        # Rings, grain, trigger, sights and bands only when they are big enough to see
+        detailed = bubble_radius >= SHOOTER_DETAIL_MIN_RADIUS
+        
+        bazooka = Canvas()
+        rotations = []  # (Rotate, sign) - set to sign * aim angle every frame
+        
+        def add_rotation(sign):
+            rotations.append((Rotate(angle=0, axis=(0, 0, 1), origin=(0, 0)), sign))
+        
+        def begin_shadow(dx, dy):
+            # Shadows are offset in screen space (light from top-left), not along the aim
+            PushMatrix()
+            add_rotation(-1)
+            Translate(dx, dy)
+            add_rotation(1)
+        
+        with bazooka:
+            PushMatrix()
+            translate = Translate(0, 0)
+            
+            # Draw bazooka base (larger, more detailed) - round, so drawn unrotated
+            # Base shadow
+            Color(0, 0, 0, 0.3)
+            Ellipse(pos=(-base_radius + 2, -base_radius - 2), size=(base_radius * 2, base_radius * 2))
+            
+            # Main base (dark metallic)
+            Color(0.25, 0.25, 0.3, 1)  # Dark metallic gray
+            Ellipse(pos=(-base_radius, -base_radius), size=(base_radius * 2, base_radius * 2))
+            
+            # Base highlight (top-left)
+            Color(0.4, 0.4, 0.45, 0.6)
+            highlight_radius = base_radius * 0.6
+            highlight_x = -base_radius * 0.3
+            highlight_y = base_radius * 0.3
+            Ellipse(pos=(highlight_x - highlight_radius, highlight_y - highlight_radius),
+                    size=(highlight_radius * 2, highlight_radius * 2))
+            
+            # Base rim (metallic edge)
+            Color(0.5, 0.5, 0.55, 0.8)
+            Line(circle=(0, 0, base_radius), width=3 * scale)
+            
+            # Draw bazooka barrel (cylindrical, metallic with detailed segments)
+            # Barrel shadow
+            shadow_offset = 3
+            # No aim rotation is active yet, so offset in screen space and then rotate
+            PushMatrix()
+            Translate(shadow_offset, -shadow_offset)
+            add_rotation(1)
+            Color(0, 0, 0, 0.25)
+            Line(points=[0, 0, end_x, 0], width=barrel_width)
+            PopMatrix()
+            
+            # Everything below is rotated with the aim
+            add_rotation(1)
+            
+            # Main barrel body (metallic gray with gradient effect)
+            Color(0.35, 0.35, 0.4, 1)  # Darker metallic gray
+            Line(points=[0, 0, end_x, 0], width=barrel_width)
+            
+            if detailed:
+                # Barrel segments/rings for detail (draw multiple rings along barrel)
+                # Rings don't overlap each other, so all rings share one Color and all highlights another
+                num_segments = 4
+                segment_xs = [end_x * i / num_segments for i in range(1, num_segments)]
+                
+                # Segment rings (darker line)
+                Color(0.25, 0.25, 0.3, 0.9)
+                for seg_x in segment_xs:
+                    Line(points=[seg_x, half_width, seg_x, -half_width], width=2 * scale)
+                
+                # Segment highlights (brighter on top)
+                Color(0.5, 0.5, 0.55, 0.7)
+                highlight_offset = half_width * 0.7
+                for seg_x in segment_xs:
+                    Line(points=[seg_x, highlight_offset, seg_x, -highlight_offset], width=1.5 * scale)
+            
+            # Barrel top highlight (brighter on top - main highlight)
+            top_line_width = barrel_width * 0.35
+            top_offset = half_width * 0.65
+            Color(0.6, 0.6, 0.65, 0.9)
+            Line(points=[0, top_offset, end_x, top_offset], width=top_line_width)
+            
+            # Barrel bottom shadow (darker on bottom)
+            Color(0.2, 0.2, 0.25, 0.9)
+            Line(points=[0, -top_offset, end_x, -top_offset], width=top_line_width)
+            
+            # Barrel rim/edge lines (top and bottom edges)
+            Color(0.45, 0.45, 0.5, 1.0)  # Brighter edge
+            Line(points=[0, half_width, end_x, half_width], width=2.5 * scale)
+            Color(0.2, 0.2, 0.25, 1.0)  # Darker bottom edge
+            Line(points=[0, -half_width, end_x, -half_width], width=2.5 * scale)
+            
+            # Barrel side highlights (for 3D cylindrical effect)
+            side_offset = half_width * 0.8
+            Color(0.5, 0.5, 0.55, 0.6)
+            Line(points=[0, side_offset, end_x, side_offset], width=1.5 * scale)
+            Color(0.25, 0.25, 0.3, 0.6)
+            Line(points=[0, -side_offset, end_x, -side_offset], width=1.5 * scale)
+            
+            # Draw bazooka tip/muzzle (larger, more detailed)
+            # Tip shadow
+            begin_shadow(2, -2)
+            Color(0, 0, 0, 0.4)
+            Ellipse(pos=(end_x - tip_radius, -tip_radius), size=(tip_radius * 2, tip_radius * 2))
+            PopMatrix()
+            
+            # Main tip (dark metallic)
+            Color(0.2, 0.2, 0.25, 1)  # Darker metallic
+            Ellipse(pos=(end_x - tip_radius, -tip_radius), size=(tip_radius * 2, tip_radius * 2))
+            
+            # Tip rim (metallic edge with highlight)
+            Color(0.5, 0.5, 0.55, 1.0)
+            Line(circle=(end_x, 0, tip_radius), width=3 * scale)
+            
+            # Tip top highlight (for 3D effect) - 90 degrees clockwise from the aim
+            highlight_y = -tip_radius * 0.7
+            highlight_size = tip_radius * 0.4
+            Color(0.6, 0.6, 0.65, 0.8)
+            Ellipse(pos=(end_x - highlight_size, highlight_y - highlight_size),
+                    size=(highlight_size * 2, highlight_size * 2))
+            
+            # Muzzle opening (dark center with rim)
+            muzzle_radius = tip_radius * 0.55
+            Color(0.05, 0.05, 0.1, 1)  # Very dark
+            Ellipse(pos=(end_x - muzzle_radius, -muzzle_radius), size=(muzzle_radius * 2, muzzle_radius * 2))
+            
+            # Muzzle rim (inner edge)
+            Color(0.3, 0.3, 0.35, 0.9)
+            Line(circle=(end_x, 0, muzzle_radius), width=1.5 * scale)
+            
+            # Muzzle depth effect (darker inner ring)
+            inner_muzzle_radius = muzzle_radius * 0.7
+            Color(0.0, 0.0, 0.05, 1)  # Almost black
+            Ellipse(pos=(end_x - inner_muzzle_radius, -inner_muzzle_radius),
+                    size=(inner_muzzle_radius * 2, inner_muzzle_radius * 2))
+            
+            # Draw grip/handle (on the side of bazooka, perpendicular to barrel)
+            grip_length = bubble_radius * 0.7  # Proportional to bubble
+            grip_width = bubble_radius * 0.2  # Proportional to bubble
+            grip_x = 0
+            grip_y = base_radius * 0.7
+            grip_end_x = grip_length
+            grip_end_y = grip_y
+            grip_points = [grip_x, grip_y, grip_end_x, grip_end_y]
+            
+            # Grip shadow
+            begin_shadow(2, -2)
+            Color(0, 0, 0, 0.3)
+            Line(points=grip_points, width=grip_width)
+            PopMatrix()
+            
+            # Main grip body
+            Color(0.25, 0.2, 0.15, 1)  # Dark brown/dark wood color
+            Line(points=grip_points, width=grip_width)
+            
+            if detailed:
+                # Grip texture lines (wood grain effect)
+                num_grain_lines = 3
+                Color(0.2, 0.15, 0.1, 0.8)  # Darker grain
+                for i in range(1, num_grain_lines):
+                    grain_x = grip_x + (grip_end_x - grip_x) * i / num_grain_lines
+                    Line(points=[grip_x, grip_y, grain_x, grip_y], width=1 * scale)
+            
+            # Grip highlight (top edge)
+            Color(0.4, 0.35, 0.3, 0.7)
+            Line(points=grip_points, width=grip_width * 0.4)
+            
+            # Grip bottom shadow
+            Color(0.15, 0.12, 0.1, 0.8)
+            Line(points=grip_points, width=grip_width * 0.3)
+            
+            if detailed:
+                # Draw trigger guard (semi-circle around grip, simplified as line segments)
+                trigger_guard_radius = grip_width * 1.2
+                guard_points = []
+                for off_cos, off_sin in TRIGGER_GUARD_OFFSETS:
+                    guard_points.extend([grip_end_x + off_cos * trigger_guard_radius,
+                                         grip_end_y + off_sin * trigger_guard_radius])
+                Color(0.3, 0.3, 0.35, 1)  # Metallic gray
+                Line(points=guard_points, width=2 * scale)
+                
+                # Draw trigger (small rectangle)
+                trigger_width = grip_width * 0.6
+                trigger_height = grip_width * 0.8
+                trigger_x = grip_end_x - trigger_height
+                trigger_y = grip_end_y
+                Color(0.2, 0.2, 0.25, 1)  # Dark metallic
+                Line(points=[trigger_x, trigger_y - trigger_width,
+                             trigger_x, trigger_y + trigger_width,
+                             trigger_x + trigger_height, trigger_y + trigger_width,
+                             trigger_x + trigger_height, trigger_y - trigger_width],
+                     width=2 * scale, close=True)
+                
+                # Draw sights (front and rear)
+                sight_size = bubble_radius * 0.15
+                # Rear sight (near base) as small rectangle
+                rear_sight_x = base_radius * 0.5
+                Color(0.4, 0.4, 0.45, 1)  # Metallic
+                Line(points=[rear_sight_x, sight_size, rear_sight_x, -sight_size], width=2 * scale)
+                
+                # Front sight (near tip) as small post
+                front_sight_x = end_x - tip_radius * 0.5
+                Color(0.5, 0.5, 0.55, 1)  # Brighter metallic
+                Line(points=[front_sight_x, sight_size * 0.5, front_sight_x, -sight_size * 0.5],
+                     width=2.5 * scale)
+                
+                # Draw barrel reinforcement bands (20% and 60% along barrel)
+                band_xs = [end_x * 0.2, end_x * 0.6]
+                Color(0.25, 0.25, 0.3, 1)  # Dark metallic band
+                for band_x in band_xs:
+                    Line(points=[band_x, half_width, band_x, -half_width], width=3 * scale)
+                # Band highlights
+                Color(0.45, 0.45, 0.5, 0.6)
+                for band_x in band_xs:
+                    Line(points=[band_x, half_width * 0.8, band_x, -half_width * 0.8], width=1 * scale)
+            
+            PopMatrix()
+        
+        self.bazooka = (bazooka, translate, rotations)
+        self.bazooka_key = (bubble_radius, scale)
+    
+    def trace_laser_cells(self, start_x, start_y, dir_x, dir_y):
+        """Walk a ray through the spatial hash cells, returns the distance to the first bubble it enters (or None)"""
+        spatial, cell = self.get_spatial_hash()
+        if not spatial:
+            return None
+        
+        # A bubble lies inside the 3x3 cells around its center cell, so visiting a cell tests that neighborhood
+        cx = int(start_x // cell)
+        cy = int(start_y // cell)
+        step_x = 1 if dir_x > 0 else -1
+        step_y = 1 if dir_y > 0 else -1
+        # Ray distance to the next vertical/horizontal cell boundary, and between boundaries
+        if dir_x:
+            next_x = ((cx + (step_x > 0)) * cell - start_x) / dir_x
+            delta_x = cell / abs(dir_x)
+        else:
+            next_x = delta_x = float('inf')
+        if dir_y:
+            next_y = ((cy + (step_y > 0)) * cell - start_y) / dir_y
+            delta_y = cell / abs(dir_y)
+        else:
+            next_y = delta_y = float('inf')
+        max_cx = int(self.width // cell) + 1
+        max_cy = int(self.height // cell) + 1
+        
+        tested = set()
+        hit_t = None
+        cell_enter_t = 0.0
+        while -1 <= cx <= max_cx and -1 <= cy <= max_cy:
+            # Bubbles entered later along the ray can't beat a hit that is closer than this cell
+            if hit_t is not None and hit_t <= cell_enter_t:
+                break
+            for ncx in (cx - 1, cx, cx + 1):
+                for ncy in (cy - 1, cy, cy + 1):
+                    for grid_bubble in spatial.get((ncx, ncy), ()):
+                        if grid_bubble in tested:
+                            continue
+                        tested.add(grid_bubble)
+                        
+                        # Project bubble center onto ray direction, only bubbles in front of the start
+                        dx = grid_bubble.x - start_x
+                        dy = grid_bubble.y - start_y
+                        proj = dx * dir_x + dy * dir_y
+                        if proj < 0:
+                            continue
+                        
+                        # Squared distance from bubble center to the ray
+                        perp_sq = dx * dx + dy * dy - proj * proj
+                        rad_sq = grid_bubble.radius * grid_bubble.radius
+                        if perp_sq > rad_sq:
+                            continue
+                        
+                        # First intersection is offset back along the ray from the closest point
+                        t = proj - sqrt(max(rad_sq - perp_sq, 0.0))
+                        if t > 0 and (hit_t is None or t < hit_t):
+                            hit_t = t
+            
+            # Step into the next cell along the ray
+            if next_x < next_y:
+                cell_enter_t = next_x
+                next_x += delta_x
+                cx += step_x
+            else:
+                cell_enter_t = next_y
+                next_y += delta_y
+                cy += step_y
+        return hit_t
+    
+    def draw_shooter(self):
+        """Draw bazooka-style shooter with laser aim"""
+        x, y = self.shooter_x, self.shooter_y
+        bubble_radius = self.bubble_radius
+        shooter_length = bubble_radius * 6.0  # 6x bubble radius for length (x2 of original 3.0)
+        base_radius = bubble_radius * 0.85  # Base radius proportional to bubble
         
-        # Convert angle to radians
-        angle_rad = math.radians(self.aim_angle)
+        # Convert angle to radians (trig computed once - every rotation below is derived from it)
+        angle_rad = radians(self.aim_angle)
+        cs = cos(angle_rad)
+        sn = sin(angle_rad)
         
         # Calculate shooter end point (tip of bazooka)
-        end_x = x + math.cos(angle_rad) * shooter_length
-        end_y = y + math.sin(angle_rad) * shooter_length
+        end_x = x + cs * shooter_length
+        end_y = y + sn * shooter_length
         
         # Calculate bubble position at the back of bazooka (near base, slightly forward)
         bubble_offset = base_radius * 0.8  # Position bubble slightly forward from base center
-        bubble_x = x + math.cos(angle_rad) * bubble_offset
-        bubble_y = y + math.sin(angle_rad) * bubble_offset
+        bubble_x = x + cs * bubble_offset
+        bubble_y = y + sn * bubble_offset
         
-        # Calculate perpendicular vector for barrel width
-        perp_x = -math.sin(angle_rad)
-        perp_y = math.cos(angle_rad)
-        half_width = barrel_width / 2
-        
-        # Draw bazooka base (larger, more detailed)
-        # Base shadow
-        Color(0, 0, 0, 0.3)
-        Ellipse(pos=(x - base_radius + 2, y - base_radius - 2), size=(base_radius * 2, base_radius * 2))
-        
-        # Main base (dark metallic)
-        Color(0.25, 0.25, 0.3, 1)  # Dark metallic gray
-        Ellipse(pos=(x - base_radius, y - base_radius), size=(base_radius * 2, base_radius * 2))
-        
-        # Base highlight (top-left)
-        Color(0.4, 0.4, 0.45, 0.6)
-        highlight_radius = base_radius * 0.6
-        highlight_x = x - base_radius * 0.3
-        highlight_y = y + base_radius * 0.3
-        Ellipse(pos=(highlight_x - highlight_radius, highlight_y - highlight_radius), 
-               size=(highlight_radius * 2, highlight_radius * 2))
-        
-        # Base rim (metallic edge)
-        Color(0.5, 0.5, 0.55, 0.8)
-        Line(circle=(x, y, base_radius), width=3 * self.scale)
-        
-        # Draw bazooka barrel (cylindrical, metallic with detailed segments)
-        # Barrel shadow
-        Color(0, 0, 0, 0.25)
-        shadow_offset = 3
-        Line(points=[x + shadow_offset, y - shadow_offset, end_x + shadow_offset, end_y - shadow_offset], width=barrel_width)
-        
-        # Main barrel body (metallic gray with gradient effect)
-        Color(0.35, 0.35, 0.4, 1)  # Darker metallic gray
-        Line(points=[x, y, end_x, end_y], width=barrel_width)
-        
-        # Barrel segments/rings for detail (draw multiple rings along barrel)
-        num_segments = 4
-        for i in range(1, num_segments):
-            segment_t = i / num_segments
-            seg_x = x + (end_x - x) * segment_t
-            seg_y = y + (end_y - y) * segment_t
-            
-            # Segment ring (darker line)
-            Color(0.25, 0.25, 0.3, 0.9)
-            Line(points=[seg_x + perp_x * half_width, seg_y + perp_y * half_width,
-                         seg_x - perp_x * half_width, seg_y - perp_y * half_width], width=2 * self.scale)
-            
-            # Segment highlight (brighter on top)
-            Color(0.5, 0.5, 0.55, 0.7)
-            highlight_offset = half_width * 0.7
-            Line(points=[seg_x + perp_x * highlight_offset, seg_y + perp_y * highlight_offset,
-                         seg_x - perp_x * highlight_offset, seg_y - perp_y * highlight_offset], width=1.5 * self.scale)
-        
-        # Barrel top highlight (brighter on top - main highlight)
-        Color(0.6, 0.6, 0.65, 0.9)
-        top_line_width = barrel_width * 0.35
-        top_offset = half_width * 0.65
-        top_start_x = x + perp_x * top_offset
-        top_start_y = y + perp_y * top_offset
-        top_end_x = end_x + perp_x * top_offset
-        top_end_y = end_y + perp_y * top_offset
-        Line(points=[top_start_x, top_start_y, top_end_x, top_end_y], width=top_line_width)
-        
-        # Barrel bottom shadow (darker on bottom)
-        Color(0.2, 0.2, 0.25, 0.9)
-        bottom_offset = -top_offset
-        bottom_start_x = x + perp_x * bottom_offset
-        bottom_start_y = y + perp_y * bottom_offset
-        bottom_end_x = end_x + perp_x * bottom_offset
-        bottom_end_y = end_y + perp_y * bottom_offset
-        Line(points=[bottom_start_x, bottom_start_y, bottom_end_x, bottom_end_y], width=top_line_width)
-        
-        # Barrel rim/edge lines (top and bottom edges)
-        Color(0.45, 0.45, 0.5, 1.0)  # Brighter edge
-        Line(points=[x + perp_x * half_width, y + perp_y * half_width, 
-                     end_x + perp_x * half_width, end_y + perp_y * half_width], width=2.5 * self.scale)
-        Color(0.2, 0.2, 0.25, 1.0)  # Darker bottom edge
-        Line(points=[x - perp_x * half_width, y - perp_y * half_width, 
-                     end_x - perp_x * half_width, end_y - perp_y * half_width], width=2.5 * self.scale)
-        
-        # Barrel side highlights (for 3D cylindrical effect)
-        Color(0.5, 0.5, 0.55, 0.6)
-        side_offset = half_width * 0.8
-        Line(points=[x + perp_x * side_offset, y + perp_y * side_offset,
-                     end_x + perp_x * side_offset, end_y + perp_y * side_offset], width=1.5 * self.scale)
-        Color(0.25, 0.25, 0.3, 0.6)
-        Line(points=[x - perp_x * side_offset, y - perp_y * side_offset,
-                     end_x - perp_x * side_offset, end_y - perp_y * side_offset], width=1.5 * self.scale)
-        
-        # Draw bazooka tip/muzzle (larger, more detailed)
-        # Tip shadow
-        Color(0, 0, 0, 0.4)
-        Ellipse(pos=(end_x - tip_radius + 2, end_y - tip_radius - 2), size=(tip_radius * 2, tip_radius * 2))
-        
-        # Main tip (dark metallic)
-        Color(0.2, 0.2, 0.25, 1)  # Darker metallic
-        Ellipse(pos=(end_x - tip_radius, end_y - tip_radius), size=(tip_radius * 2, tip_radius * 2))
-        
-        # Tip rim (metallic edge with highlight)
-        Color(0.5, 0.5, 0.55, 1.0)
-        Line(circle=(end_x, end_y, tip_radius), width=3 * self.scale)
-        
-        # Tip top highlight (for 3D effect)
-        highlight_angle = angle_rad - math.pi / 2  # Top of tip
-        highlight_x = end_x + math.cos(highlight_angle) * tip_radius * 0.7
-        highlight_y = end_y + math.sin(highlight_angle) * tip_radius * 0.7
-        Color(0.6, 0.6, 0.65, 0.8)
-        highlight_size = tip_radius * 0.4
-        Ellipse(pos=(highlight_x - highlight_size, highlight_y - highlight_size), 
-               size=(highlight_size * 2, highlight_size * 2))
-        
-        # Muzzle opening (dark center with rim)
-        muzzle_radius = tip_radius * 0.55
-        Color(0.05, 0.05, 0.1, 1)  # Very dark
-        Ellipse(pos=(end_x - muzzle_radius, end_y - muzzle_radius), size=(muzzle_radius * 2, muzzle_radius * 2))
-        
-        # Muzzle rim (inner edge)
-        Color(0.3, 0.3, 0.35, 0.9)
-        Line(circle=(end_x, end_y, muzzle_radius), width=1.5 * self.scale)
-        
-        # Muzzle depth effect (darker inner ring)
-        inner_muzzle_radius = muzzle_radius * 0.7
-        Color(0.0, 0.0, 0.05, 1)  # Almost black
-        Ellipse(pos=(end_x - inner_muzzle_radius, end_y - inner_muzzle_radius), 
-               size=(inner_muzzle_radius * 2, inner_muzzle_radius * 2))
-        
-        # Draw grip/handle (on the side of bazooka)
-        grip_length = bubble_radius * 0.7  # Proportional to bubble
-        grip_width = bubble_radius * 0.2  # Proportional to bubble
-        grip_angle = angle_rad + math.pi / 2  # Perpendicular to barrel
-        grip_x = x + math.cos(grip_angle) * (base_radius * 0.7)
-        grip_y = y + math.sin(grip_angle) * (base_radius * 0.7)
-        grip_end_x = grip_x + math.cos(angle_rad) * grip_length
-        grip_end_y = grip_y + math.sin(angle_rad) * grip_length
-        
-        # Grip shadow
-        Color(0, 0, 0, 0.3)
-        Line(points=[grip_x + 2, grip_y - 2, grip_end_x + 2, grip_end_y - 2], width=grip_width)
-        
-        # Main grip body
-        Color(0.25, 0.2, 0.15, 1)  # Dark brown/dark wood color
-        Line(points=[grip_x, grip_y, grip_end_x, grip_end_y], width=grip_width)
-        
-        # Grip texture lines (wood grain effect)
-        num_grain_lines = 3
-        for i in range(1, num_grain_lines):
-            grain_t = i / num_grain_lines
-            grain_x = grip_x + (grip_end_x - grip_x) * grain_t
-            grain_y = grip_y + (grip_end_y - grip_y) * grain_t
-            Color(0.2, 0.15, 0.1, 0.8)  # Darker grain
-            Line(points=[grip_x, grip_y, grain_x, grain_y], width=1 * self.scale)
-        
-        # Grip highlight (top edge)
-        Color(0.4, 0.35, 0.3, 0.7)
-        Line(points=[grip_x, grip_y, grip_end_x, grip_end_y], width=grip_width * 0.4)
-        
-        # Grip bottom shadow
-        Color(0.15, 0.12, 0.1, 0.8)
-        Line(points=[grip_x, grip_y, grip_end_x, grip_end_y], width=grip_width * 0.3)
-        
-        # Draw trigger guard (semi-circle around grip)
-        trigger_guard_radius = grip_width * 1.2
-        trigger_guard_x = grip_end_x
-        trigger_guard_y = grip_end_y
-        Color(0.3, 0.3, 0.35, 1)  # Metallic gray
-        # Draw trigger guard as arc (simplified as line segments)
-        guard_points = []
-        for i in range(5):
-            guard_angle = angle_rad - math.pi / 2 + (i / 4) * math.pi
-            px = trigger_guard_x + math.cos(guard_angle) * trigger_guard_radius
-            py = trigger_guard_y + math.sin(guard_angle) * trigger_guard_radius
-            guard_points.extend([px, py])
-        Line(points=guard_points, width=2 * self.scale)
-        
-        # Draw trigger (small rectangle)
-        trigger_width = grip_width * 0.6
-        trigger_height = grip_width * 0.8
-        trigger_x = grip_end_x - math.cos(angle_rad) * trigger_height
-        trigger_y = grip_end_y - math.sin(angle_rad) * trigger_height
-        Color(0.2, 0.2, 0.25, 1)  # Dark metallic
-        # Draw trigger as small rectangle (simplified)
-        trigger_points = [
-            trigger_x - perp_x * trigger_width, trigger_y - perp_y * trigger_width,
-            trigger_x + perp_x * trigger_width, trigger_y + perp_y * trigger_width,
-            trigger_x + perp_x * trigger_width + math.cos(angle_rad) * trigger_height,
-            trigger_y + perp_y * trigger_width + math.sin(angle_rad) * trigger_height,
-            trigger_x - perp_x * trigger_width + math.cos(angle_rad) * trigger_height,
-            trigger_y - perp_y * trigger_width + math.sin(angle_rad) * trigger_height
-        ]
-        Line(points=trigger_points, width=2 * self.scale, close=True)
-        
-        # Draw sights (front and rear)
-        sight_size = bubble_radius * 0.15
-        # Rear sight (near base)
-        rear_sight_x = x + math.cos(angle_rad) * (base_radius * 0.5)
-        rear_sight_y = y + math.sin(angle_rad) * (base_radius * 0.5)
-        Color(0.4, 0.4, 0.45, 1)  # Metallic
-        # Rear sight as small rectangle
-        sight_offset = perp_x * sight_size
-        Line(points=[rear_sight_x + sight_offset, rear_sight_y + perp_y * sight_size,
-                     rear_sight_x - sight_offset, rear_sight_y - perp_y * sight_size], width=2 * self.scale)
-        
-        # Front sight (near tip)
-        front_sight_x = end_x - math.cos(angle_rad) * (tip_radius * 0.5)
-        front_sight_y = end_y - math.sin(angle_rad) * (tip_radius * 0.5)
-        Color(0.5, 0.5, 0.55, 1)  # Brighter metallic
-        # Front sight as small post
-        Line(points=[front_sight_x + perp_x * sight_size * 0.5, front_sight_y + perp_y * sight_size * 0.5,
-                     front_sight_x - perp_x * sight_size * 0.5, front_sight_y - perp_y * sight_size * 0.5], 
-             width=2.5 * self.scale)
-        
-        # Draw barrel reinforcement bands (near base and middle)
-        band_width = 3 * self.scale
-        for band_pos in [0.2, 0.6]:  # 20% and 60% along barrel
-            band_x = x + (end_x - x) * band_pos
-            band_y = y + (end_y - y) * band_pos
-            Color(0.25, 0.25, 0.3, 1)  # Dark metallic band
-            Line(points=[band_x + perp_x * half_width, band_y + perp_y * half_width,
-                         band_x - perp_x * half_width, band_y - perp_y * half_width], width=band_width)
-            # Band highlight
-            Color(0.45, 0.45, 0.5, 0.6)
-            Line(points=[band_x + perp_x * half_width * 0.8, band_y + perp_y * half_width * 0.8,
-                         band_x - perp_x * half_width * 0.8, band_y - perp_y * half_width * 0.8], width=1 * self.scale)
+        # The bazooka itself is built once (see rebuild_static_layers) and only moved/rotated here
+        bazooka, translate, rotations = self.bazooka
+        translate.xy = (x, y)
+        for rotation, sign in rotations:
+            rotation.angle = sign * self.aim_angle
+        self.dynamic_layer.add(bazooka)
         
         # Draw current bubble with 3D effect (positioned at back of bazooka)
         if self.current_bubble and not self.current_bubble.attached:
@@ -4259,62 +4681,24 @@ class BubbleShooterGame(Widget):
         # Draw laser that stops at the closest ball
         laser_start_x = end_x
         laser_start_y = end_y
-        laser_dir_x = math.cos(angle_rad)
-        laser_dir_y = math.sin(angle_rad)
-        
-        # Find the closest ball that the laser would hit using proper line-circle intersection
-        min_distance = float('inf')
-        hit_point_x = None
-        hit_point_y = None
+        laser_dir_x = cs
+        laser_dir_y = sn
         
-        # Check all grid bubbles to find the first one the laser hits
-        for grid_bubble in self.grid_bubbles:
-            # Vector from laser start to bubble center
-            dx = grid_bubble.x - laser_start_x
-            dy = grid_bubble.y - laser_start_y
-            
-            # Project bubble center onto laser direction
-            proj_length = dx * laser_dir_x + dy * laser_dir_y
-            
-            # Only consider bubbles in front of the laser
-            if proj_length < 0:
-                continue
-            
-            # Closest point on laser ray to bubble center
-            closest_x = laser_start_x + laser_dir_x * proj_length
-            closest_y = laser_start_y + laser_dir_y * proj_length
-            
-            # Distance from bubble center to laser ray
-            dist_to_line = math.sqrt((grid_bubble.x - closest_x)**2 + (grid_bubble.y - closest_y)**2)
+        # The hit point only changes with the aim, shooter, size or grid - reuse last frame's otherwise
+        laser_sig = (self.aim_angle, x, y, bubble_radius, self.width, self.height, self._grid_version)
+        if self._laser_hit and self._laser_hit[0] == laser_sig:
+            _, hit_point_x, hit_point_y = self._laser_hit
+        else:
+            # Find the closest ball that the laser would hit using proper line-circle intersection
+            hit_point_x, hit_point_y = self.find_laser_hit(laser_start_x, laser_start_y, laser_dir_x, laser_dir_y)
             
-            # Check if laser ray intersects the bubble
-            if dist_to_line <= grid_bubble.radius:
-                # Calculate the actual intersection point using line-circle intersection
-                # Distance along the ray from closest point to intersection
-                # Using Pythagorean theorem: radius^2 = dist_to_line^2 + offset^2
-                offset = math.sqrt(grid_bubble.radius**2 - dist_to_line**2)
-                
-                # Intersection point is offset back along the ray from closest point
-                # (towards laser start, so we get the first intersection)
-                intersect_x = closest_x - laser_dir_x * offset
-                intersect_y = closest_y - laser_dir_y * offset
-                
-                # Verify this point is in front of laser start (should be, but check)
-                dist_to_intersect = math.sqrt((intersect_x - laser_start_x)**2 + (intersect_y - laser_start_y)**2)
-                
-                # Check if intersection is in the forward direction
-                dot_product = (intersect_x - laser_start_x) * laser_dir_x + (intersect_y - laser_start_y) * laser_dir_y
-                if dot_product > 0 and dist_to_intersect < min_distance:
-                    min_distance = dist_to_intersect
-                    hit_point_x = intersect_x
-                    hit_point_y = intersect_y
-        
-        # If no bubble hit, extend laser to screen edge
-        if hit_point_x is None:
-            # Extend laser to screen edge
-            max_length = max(self.width, self.height) * 2  # Long enough to reach edge
-            hit_point_x = laser_start_x + laser_dir_x * max_length
-            hit_point_y = laser_start_y + laser_dir_y * max_length
+            # If no bubble hit, extend laser to screen edge
+            if hit_point_x is None:
+                # Extend laser to screen edge
+                max_length = max(self.width, self.height) * 2  # Long enough to reach edge
+                hit_point_x = laser_start_x + laser_dir_x * max_length
+                hit_point_y = laser_start_y + laser_dir_y * max_length
+            self._laser_hit = (laser_sig, hit_point_x, hit_point_y)
         
         # Draw laser target point/dot at hit location (no line, just the point)
         dot_size = 10 * self.scale
@@ -4333,6 +4717,34 @@ class BubbleShooterGame(Widget):
         Ellipse(pos=(hit_point_x - dot_size * 0.5, hit_point_y - dot_size * 0.5), 
                size=(dot_size, dot_size))
     
+    def get_star_points(self, x, y, outer_radius, inner_radius):
+        """Get the flat point list of a 5-point star outline centered at (x, y)"""
+        points = []
+        for i, (dx, dy) in enumerate(STAR_DIRECTIONS):
+            radius = outer_radius if i % 2 == 0 else inner_radius
+            points.extend((x + dx * radius, y + dy * radius))
+        return points
+    
+    def draw_star_fill(self, x, y, star_points):
+        """Fill a star outline (from get_star_points) as one triangle fan around its center"""
+        vertices = [x, y, 0, 0]
+        for k in range(0, len(star_points), 2):
+            vertices.extend((star_points[k], star_points[k + 1], 0, 0))
+        # Close the fan back on the first outline point
+        vertices.extend((star_points[0], star_points[1], 0, 0))
+        Mesh(vertices=vertices, indices=list(range(len(vertices) // 4)), mode='triangle_fan')
+    
+    def get_label_texture(self, text, font_size, color):
+        """Get the texture for a piece of text, rendering it only the first time it is shown"""
+        cache_key = (text, round(font_size, 1), tuple(color))
+        texture = self.get_cached_texture(self.label_textures, cache_key)
+        if texture is None:
+            label = CoreLabel(text=text, font_size=font_size, color=color)
+            label.refresh()
+            texture = label.texture
+            self.cache_texture(self.label_textures, cache_key, texture)
+        return texture
+    
     def draw_ui(self):
         """Draw UI elements with beautiful design"""
         if self.height > 0:
@@ -4342,15 +4754,12 @@ class BubbleShooterGame(Widget):
             # ===== SHOTS REMAINING (Bottom Left) =====
             shots_text = f'{display_shots}/{self.max_shots}'
             font_size = self.base_font_size_large * self.scale
-            shots_label = CoreLabel(text=shots_text, 
-                                  font_size=font_size, 
-                                  color=(1, 1, 1, 1))
-            shots_label.refresh()
+            shots_texture = self.get_label_texture(shots_text, font_size, (1, 1, 1, 1))
             
             # Draw background panel with rounded corners effect
             panel_padding = 36 * self.scale  # 12 * 3
-            panel_height = shots_label.texture.size[1] + panel_padding * 2
-            panel_width = shots_label.texture.size[0] + panel_padding * 2 + 180 * self.scale  # Extra space for icon
+            panel_height = shots_texture.size[1] + panel_padding * 2
+            panel_width = shots_texture.size[0] + panel_padding * 2 + 180 * self.scale  # Extra space for icon
             
             # Shadow
             Color(0, 0, 0, 0.3)
@@ -4378,46 +4787,34 @@ class BubbleShooterGame(Widget):
             text_x = icon_x + 60 * self.scale  # 20 * 3
             text_y = 30 * self.scale + panel_padding
             Color(1, 1, 1, 1)  # White text
-            Rectangle(texture=shots_label.texture, 
+            Rectangle(texture=shots_texture, 
                      pos=(text_x, text_y), 
-                     size=shots_label.texture.size)
+                     size=shots_texture.size)
             
             # ===== DIAMOND STORAGE (Above Total Score) =====
             diamond_text = str(self.diamond_storage)  # Just the count (diamond image will be drawn separately)
             diamond_font_size = self.base_font_size_small * self.scale
-            diamond_label = CoreLabel(text=diamond_text, 
-                                     font_size=diamond_font_size, 
-                                     color=(0.3, 0.8, 1.0, 1))  # Bright cyan/blue for diamond
-            diamond_label.refresh()
+            diamond_count_texture = self.get_label_texture(diamond_text, diamond_font_size, (0.3, 0.8, 1.0, 1))  # Bright cyan/blue for diamond
             
             # ===== TOTAL SCORE (Above Score Box) =====
             total_score_text = f'Total Score: {self.total_score + self.score:,}'  # Current level score + cumulative
             total_score_font_size = self.base_font_size_small * self.scale
-            total_score_label = CoreLabel(text=total_score_text, 
-                                         font_size=total_score_font_size, 
-                                         color=(1, 1, 0.8, 1))  # Light yellow/gold color
-            total_score_label.refresh()
+            total_score_texture = self.get_label_texture(total_score_text, total_score_font_size, (1, 1, 0.8, 1))  # Light yellow/gold color
             
             # ===== LEVEL NUMBER (Above Score Box) =====
             level_text = f'Level {self.level}'
             level_font_size = self.base_font_size_medium * self.scale
-            level_label = CoreLabel(text=level_text, 
-                                  font_size=level_font_size, 
-                                  color=(1, 1, 1, 1))
-            level_label.refresh()
+            level_texture = self.get_label_texture(level_text, level_font_size, (1, 1, 1, 1))
             
             # ===== SCORE (Bottom Right) =====
             score_text = f'{self.score:,}'  # Add comma formatting
             score_font_size = self.base_font_size_large * self.scale
-            score_label = CoreLabel(text=score_text, 
-                                  font_size=score_font_size, 
-                                  color=(1, 1, 1, 1))
-            score_label.refresh()
+            score_texture = self.get_label_texture(score_text, score_font_size, (1, 1, 1, 1))
             
             # Score panel dimensions
             score_panel_padding = 24 * self.scale  # Reduced from 36
-            score_panel_height = score_label.texture.size[1] + score_panel_padding * 2
-            score_panel_width = score_label.texture.size[0] + score_panel_padding * 2 + 120 * self.scale + 160 * self.scale  # Reduced extra space for stars (from 180+240)
+            score_panel_height = score_texture.size[1] + score_panel_padding * 2
+            score_panel_width = score_texture.size[0] + score_panel_padding * 2 + 120 * self.scale + 160 * self.scale  # Reduced extra space for stars (from 180+240)
             
             # Calculate position for bottom right
             score_panel_x = self.width - score_panel_width - 30 * self.scale
@@ -4428,19 +4825,19 @@ class BubbleShooterGame(Widget):
             level_panel_x = 30 * self.scale  # Left side, same as shots panel
             
             # Draw level number background (small panel above shots) - use only text width
-            level_panel_width = level_label.texture.size[0] + 40 * self.scale
-            level_panel_height = level_label.texture.size[1] + 18 * self.scale
+            level_panel_width = level_texture.size[0] + 40 * self.scale
+            level_panel_height = level_texture.size[1] + 18 * self.scale
             
             # Total Score position (above score box on RIGHT side)
             total_score_panel_y = 30 * self.scale + score_panel_height + 2 * self.scale  # Minimal gap (2px scaled) above score panel
-            total_score_panel_width = total_score_label.texture.size[0] + 40 * self.scale
-            total_score_panel_height = total_score_label.texture.size[1] + 15 * self.scale
+            total_score_panel_width = total_score_texture.size[0] + 40 * self.scale
+            total_score_panel_height = total_score_texture.size[1] + 15 * self.scale
             
             # Diamond Storage position (above total score on RIGHT side)
             diamond_panel_y = total_score_panel_y + total_score_panel_height + 2 * self.scale  # Above total score
             # Make panel wider to accommodate diamond image + text
-            diamond_panel_width = diamond_label.texture.size[0] + 130 * self.scale  # Extra space for diamond image (increased for 2x size)
-            diamond_panel_height = max(diamond_label.texture.size[1], 110 * self.scale) + 15 * self.scale  # Ensure enough height for image (increased for 2x size)
+            diamond_panel_width = diamond_count_texture.size[0] + 130 * self.scale  # Extra space for diamond image (increased for 2x size)
+            diamond_panel_height = max(diamond_count_texture.size[1], 110 * self.scale) + 15 * self.scale  # Ensure enough height for image (increased for 2x size)
             
             # Diamond Storage panel shadow
             Color(0, 0, 0, 0.3)
@@ -4472,11 +4869,11 @@ class BubbleShooterGame(Widget):
             
             # Draw Diamond Storage text (right of icon)
             diamond_text_x = score_panel_x + 130 * self.scale  # Start after icon (increased for 2x size)
-            diamond_text_y = diamond_panel_y + (diamond_panel_height - diamond_label.texture.size[1]) / 2
+            diamond_text_y = diamond_panel_y + (diamond_panel_height - diamond_count_texture.size[1]) / 2
             Color(0.3, 0.8, 1.0, 1)  # Bright cyan/blue text
-            Rectangle(texture=diamond_label.texture, 
+            Rectangle(texture=diamond_count_texture, 
                      pos=(diamond_text_x, diamond_text_y), 
-                     size=diamond_label.texture.size)
+                     size=diamond_count_texture.size)
             
             # Total Score panel shadow
             Color(0, 0, 0, 0.3)
@@ -4494,12 +4891,12 @@ class BubbleShooterGame(Widget):
                      size=(total_score_panel_width, 9 * self.scale))
             
             # Draw Total Score text (centered in panel)
-            total_score_text_x = score_panel_x + (total_score_panel_width - total_score_label.texture.size[0]) / 2
+            total_score_text_x = score_panel_x + (total_score_panel_width - total_score_texture.size[0]) / 2
             total_score_text_y = total_score_panel_y + 10 * self.scale
             Color(1, 1, 0.8, 1)  # Light yellow/gold text
-            Rectangle(texture=total_score_label.texture, 
+            Rectangle(texture=total_score_texture, 
                      pos=(total_score_text_x, total_score_text_y), 
-                     size=total_score_label.texture.size)
+                     size=total_score_texture.size)
             
             # Level panel shadow (on LEFT side)
             Color(0, 0, 0, 0.3)
@@ -4514,12 +4911,12 @@ class BubbleShooterGame(Widget):
             Rectangle(pos=(level_panel_x, level_panel_y + level_panel_height - 9 * self.scale), size=(level_panel_width, 9 * self.scale))
             
             # Draw level text (centered in level panel)
-            level_text_x = level_panel_x + (level_panel_width - level_label.texture.size[0]) / 2
+            level_text_x = level_panel_x + (level_panel_width - level_texture.size[0]) / 2
             level_text_y = level_panel_y + 12 * self.scale
             Color(1, 1, 1, 1)  # White text
-            Rectangle(texture=level_label.texture, 
+            Rectangle(texture=level_texture, 
                      pos=(level_text_x, level_text_y), 
-                     size=level_label.texture.size)
+                     size=level_texture.size)
             
             # Score box shadow
             Color(0, 0, 0, 0.3)
@@ -4548,12 +4945,12 @@ class BubbleShooterGame(Widget):
             score_text_x = score_icon_x + 60 * self.scale  # 20 * 3
             score_text_y = 30 * self.scale + score_panel_padding
             Color(1, 1, 1, 1)  # White text
-            Rectangle(texture=score_label.texture, 
+            Rectangle(texture=score_texture, 
                      pos=(score_text_x, score_text_y), 
-                     size=score_label.texture.size)
+                     size=score_texture.size)
             
             # Draw three achievement stars next to score
-            stars_start_x = score_text_x + score_label.texture.size[0] + 45 * self.scale
+            stars_start_x = score_text_x + score_texture.size[0] + 45 * self.scale
             stars_y = 30 * self.scale + score_panel_height / 2
             star_size = 48 * self.scale  # 16 * 3
             star_spacing = 60 * self.scale  # 20 * 3
@@ -4569,46 +4966,21 @@ class BubbleShooterGame(Widget):
                 # Draw star shape (5-pointed star)
                 outer_radius = star_size / 2
                 inner_radius = outer_radius * 0.4
-                num_points = 5
                 
                 # Calculate star points
-                star_points = []
-                for j in range(num_points * 2):
-                    angle = (j * math.pi / num_points) - math.pi / 2  # Start from top
-                    if j % 2 == 0:
-                        # Outer point
-                        radius = outer_radius
-                    else:
-                        # Inner point
-                        radius = inner_radius
-                    px = star_x + radius * math.cos(angle)
-                    py = star_center_y + radius * math.sin(angle)
-                    star_points.extend([px, py])
+                star_points = self.get_star_points(star_x, star_center_y, outer_radius, inner_radius)
                 
                 if is_gold:
                     # Gold star - outer glow
                     Color(1, 0.8, 0.2, 0.4)  # Gold glow with transparency
-                    glow_points = []
-                    for j in range(num_points * 2):
-                        angle = (j * math.pi / num_points) - math.pi / 2
-                        if j % 2 == 0:
-                            radius = outer_radius + 2
-                        else:
-                            radius = inner_radius + 1
-                        px = star_x + radius * math.cos(angle)
-                        py = star_center_y + radius * math.sin(angle)
-                        glow_points.extend([px, py])
-                    # Draw glow (simplified as filled shape)
-                    for k in range(len(glow_points) // 2 - 1):
-                        Line(points=[glow_points[k*2], glow_points[k*2+1], 
-                                    glow_points[(k+1)*2], glow_points[(k+1)*2+1]], width=9 * self.scale)  # 3 * 3
+                    glow_points = self.get_star_points(star_x, star_center_y, outer_radius + 2, inner_radius + 1)
+                    # Draw glow as one thick polyline
+                    Line(points=glow_points, width=9 * self.scale)  # 3 * 3
                     
-                    # Gold star - main
+                    # Gold star - main (filled, then outlined)
                     Color(1, 0.85, 0.3, 1)  # Bright gold
+                    self.draw_star_fill(star_x, star_center_y, star_points)
                     Line(points=star_points, width=6 * self.scale, close=True)  # 2 * 3
-                    # Fill star (simplified - draw lines to center)
-                    for k in range(0, len(star_points), 2):
-                        Line(points=[star_x, star_center_y, star_points[k], star_points[k+1]], width=3 * self.scale)  # 1 * 3
                     
                     # Gold star - highlight (inner glow)
                     Color(1, 0.95, 0.6, 0.8)  # Light gold
@@ -4618,10 +4990,8 @@ class BubbleShooterGame(Widget):
                 else:
                     # Gray star - outer
                     Color(0.3, 0.3, 0.3, 0.5)  # Dark gray with transparency
+                    self.draw_star_fill(star_x, star_center_y, star_points)
                     Line(points=star_points, width=6 * self.scale, close=True)  # 2 * 3
-                    # Fill star
-                    for k in range(0, len(star_points), 2):
-                        Line(points=[star_x, star_center_y, star_points[k], star_points[k+1]], width=3 * self.scale)  # 1 * 3
                     
                     # Gray star - inner
                     Color(0.5, 0.5, 0.5, 0.6)  # Lighter gray
@@ -4678,30 +5048,24 @@ class BubbleShooterGame(Widget):
                     title_color = (1, 0.3, 0.3, 1)  # Bright red
                 
                 title_font_size = 96 * self.scale  # 32 * 3
-                title_label = CoreLabel(text=title_text, 
-                                      font_size=title_font_size, 
-                                      color=title_color)
-                title_label.refresh()
-                title_x = center_x - title_label.texture.size[0] / 2
+                title_texture = self.get_label_texture(title_text, title_font_size, title_color)
+                title_x = center_x - title_texture.size[0] / 2
                 title_y = panel_y + panel_height - 150 * self.scale  # 50 * 3
                 Color(1, 1, 1, 1)
-                Rectangle(texture=title_label.texture,
+                Rectangle(texture=title_texture,
                          pos=(title_x, title_y),
-                         size=title_label.texture.size)
+                         size=title_texture.size)
                 
                 # Draw score display
                 score_text = f'Final Score: {self.score:,}'
                 score_font_size = 60 * self.scale  # 20 * 3
-                score_label = CoreLabel(text=score_text,
-                                      font_size=score_font_size,
-                                      color=(1, 1, 1, 1))
-                score_label.refresh()
-                score_x = center_x - score_label.texture.size[0] / 2
+                score_texture = self.get_label_texture(score_text, score_font_size, (1, 1, 1, 1))
+                score_x = center_x - score_texture.size[0] / 2
                 score_y = title_y - 105 * self.scale  # 35 * 3
                 Color(1, 1, 1, 1)
-                Rectangle(texture=score_label.texture,
+                Rectangle(texture=score_texture,
                          pos=(score_x, score_y),
-                         size=score_label.texture.size)
+                         size=score_texture.size)
                 
                 # Draw buttons - scaled
                 button_width = self.base_button_width * self.scale
@@ -4753,16 +5117,13 @@ class BubbleShooterGame(Widget):
         
         # Draw "Loading..." text
         loading_font_size = 84 * self.scale  # 28 * 3
-        loading_label = CoreLabel(text='Loading...', 
-                                 font_size=loading_font_size, 
-                                 color=(1, 1, 1, 1))
-        loading_label.refresh()
-        loading_x = center_x - loading_label.texture.size[0] / 2
+        loading_texture = self.get_label_texture('Loading...', loading_font_size, (1, 1, 1, 1))
+        loading_x = center_x - loading_texture.size[0] / 2
         loading_y = panel_y + panel_height - 150 * self.scale  # 50 * 3
         Color(1, 1, 1, 1)
-        Rectangle(texture=loading_label.texture,
+        Rectangle(texture=loading_texture,
                  pos=(loading_x, loading_y),
-                 size=loading_label.texture.size)
+                 size=loading_texture.size)
         
         # Draw animated loading spinner (simple pulsing dots) - scaled
         spinner_y = panel_y + 180 * self.scale  # 60 * 3
@@ -4804,11 +5165,10 @@ class BubbleShooterGame(Widget):
         
         # Button text
         button_font_size = 60 * self.scale  # 20 * 3
-        text_label = CoreLabel(text=text, font_size=button_font_size, color=(1, 1, 1, 1))
-        text_label.refresh()
-        text_x = x + (width - text_label.texture.size[0]) / 2
-        text_y = y + (height - text_label.texture.size[1]) / 2
+        text_texture = self.get_label_texture(text, button_font_size, (1, 1, 1, 1))
+        text_x = x + (width - text_texture.size[0]) / 2
+        text_y = y + (height - text_texture.size[1]) / 2
         Color(1, 1, 1, 1)
-        Rectangle(texture=text_label.texture,
+        Rectangle(texture=text_texture,
                  pos=(text_x, text_y),
-                 size=text_label.texture.size)
+                 size=text_texture.size)
@@ -8,17 +8,30 @@ import os
 from kivy.core.image import Image as CoreImage
 from kivy.graphics.texture import Texture
 try:
-    from PIL import Image, ImageDraw, ImageFilter, ImageEnhance
+    from PIL import Image, ImageChops, ImageDraw, ImageFilter, ImageEnhance
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
 
+# NumPy is optional - used to shade whole textures at once (per-pixel fallback otherwise)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Maximum number of shared particle textures kept (oldest are dropped first)
+PARTICLE_TEXTURE_CACHE_SIZE = 256
+# Maximum number of generated shooter/panel textures kept in texture_cache (oldest are dropped first)
+TEXTURE_CACHE_SIZE = 64
+
 
 class GraphicsEnhancer:
     """Creates enhanced graphics with depth and detail"""
     
     def __init__(self):
         self.texture_cache = {}
+        self.particle_textures = {}  # (size, quantized color) -> shared particle texture
         self.scale_factor = 1.0
         
     def set_scale(self, scale):
@@ -68,130 +81,14 @@ class GraphicsEnhancer:
         light_dir_y /= light_len
         light_dir_z /= light_len
         
-        for y in range(size):
-            for x in range(size):
-                dx = x - center
-                dy = y - center
-                dist = math.sqrt(dx*dx + dy*dy)
-                
-                if dist <= tex_radius:
-                    # Calculate 3D position on sphere surface
-                    # Normalize to unit sphere
-                    nx = dx / tex_radius
-                    ny = dy / tex_radius
-                    # Calculate z using sphere equation: x^2 + y^2 + z^2 = 1
-                    z_squared = 1.0 - (nx*nx + ny*ny)
-                    if z_squared < 0:
-                        continue  # Outside sphere
-                    nz = math.sqrt(z_squared)  # Normal vector z component
-                    
-                    # Calculate dot product with light direction (Lambertian shading)
-                    dot_product = nx * light_dir_x + ny * light_dir_y + nz * light_dir_z
-                    
-                    # Clamp dot product to [0, 1] for lighting
-                    dot_product = max(0.0, min(1.0, dot_product))
-                    
-                    # Ambient light (minimum brightness)
-                    ambient = 0.3
-                    
-                    # Diffuse lighting (main lighting)
-                    diffuse = dot_product * 0.7
-                    
-                    # Total brightness
-                    brightness = ambient + diffuse
-                    
-                    # Darken bottom of sphere (ambient occlusion effect)
-                    if ny > 0.3:  # Bottom half
-                        bottom_darkening = (ny - 0.3) * 0.4  # Darken by up to 40%
-                        brightness *= (1.0 - bottom_darkening)
-                    
-                    # Darken edges slightly for depth
-                    edge_factor = 1.0 - (dist / tex_radius) ** 2 * 0.1
-                    brightness *= edge_factor
-                    
-                    # Apply color with lighting
-                    r = min(1.0, color[0] * brightness)
-                    g = min(1.0, color[1] * brightness)
-                    b = min(1.0, color[2] * brightness)
-                    
-                    # Fully opaque for solid ball
-                    alpha = 255
-                    
-                    img.putpixel((x, y), (
-                        int(r * 255),
-                        int(g * 255),
-                        int(b * 255),
-                        alpha
-                    ))
-        
-        # 3. Add specular highlight (shiny ball reflection)
-        # Highlight position (top-left, slightly forward)
-        highlight_offset_x = -tex_radius * 0.35
-        highlight_offset_y = -tex_radius * 0.35
-        highlight_center_x = center + highlight_offset_x
-        highlight_center_y = center + highlight_offset_y
-        highlight_radius = int(tex_radius * 0.35)
-        
-        for y in range(size):
-            for x in range(size):
-                dx = x - highlight_center_x
-                dy = y - highlight_center_y
-                dist = math.sqrt(dx*dx + dy*dy)
-                
-                if dist <= highlight_radius:
-                    # Check if this point is on the visible side of the sphere
-                    sphere_dx = x - center
-                    sphere_dy = y - center
-                    sphere_dist = math.sqrt(sphere_dx*sphere_dx + sphere_dy*sphere_dy)
-                    
-                    if sphere_dist <= tex_radius:
-                        # Calculate highlight intensity (stronger at center)
-                        highlight_intensity = 1.0 - (dist / highlight_radius)
-                        highlight_intensity = highlight_intensity ** 1.5  # Sharper highlight
-                        
-                        # Make highlight more intense
-                        highlight_strength = highlight_intensity * 0.6  # 60% white overlay
-                        
-                        r, g, b, a = img.getpixel((x, y))
-                        
-                        # Add white specular highlight
-                        r = min(255, int(r + (255 - r) * highlight_strength))
-                        g = min(255, int(g + (255 - g) * highlight_strength))
-                        b = min(255, int(b + (255 - b) * highlight_strength))
-                        
-                        img.putpixel((x, y), (r, g, b, a))
-        
-        # 4. Add rim lighting (bright edge where light hits the sphere edge)
-        rim_width = int(3 * self.scale_factor)
-        for y in range(size):
-            for x in range(size):
-                dx = x - center
-                dy = y - center
-                dist = math.sqrt(dx*dx + dy*dy)
-                
-                # Draw rim on the lit side (top-left edge)
-                if tex_radius - rim_width <= dist <= tex_radius:
-                    # Check if this is on the lit edge
-                    angle = math.atan2(dy, dx)
-                    # Lit edge is around 135 degrees (top-left)
-                    lit_angle = math.radians(135)
-                    angle_diff = abs(angle - lit_angle)
-                    if angle_diff > math.pi:
-                        angle_diff = 2 * math.pi - angle_diff
-                    
-                    # Only add rim lighting on the lit side
-                    if angle_diff < math.radians(60):  # Within 60 degrees of lit edge
-                        rim_intensity = 1.0 - abs(dist - tex_radius) / rim_width
-                        rim_intensity *= (1.0 - angle_diff / math.radians(60))  # Fade with angle
-                        
-                        r, g, b, a = img.getpixel((x, y))
-                        
-                        # Brighten edge significantly
-                        r = min(255, int(r + rim_intensity * 120))
-                        g = min(255, int(g + rim_intensity * 120))
-                        b = min(255, int(b + rim_intensity * 120))
-                        
-                        img.putpixel((x, y), (r, g, b, a))
+        if NUMPY_AVAILABLE:
+            # Body shading, specular highlight and rim lighting in one pass over the whole image
+            img = self._shade_bubble_array(img, size, center, tex_radius, color,
+                                           (light_dir_x, light_dir_y, light_dir_z))
+        else:
+            # Same lighting built from PIL's C-level gradients, ellipses and arcs (no per-pixel Python)
+            img = self._shade_bubble_pil(img, size, center, tex_radius, color,
+                                         (light_dir_x, light_dir_y, light_dir_z))
         
         # 5. Add outer glow for special bubbles
         if has_special:
@@ -209,17 +106,149 @@ class GraphicsEnhancer:
         # Convert to Kivy texture
         return self._pil_to_kivy_texture(img)
     
+    def _shade_bubble_array(self, img, size, center, tex_radius, color, light_dir):
+        """Shade the ball body, specular highlight and lit rim over img with NumPy (same math as the per-pixel loops)"""
+        light_dir_x, light_dir_y, light_dir_z = light_dir
+        pixels = np.array(img)
+        yy, xx = np.mgrid[0:size, 0:size].astype(np.float64)
+        dx = xx - center
+        dy = yy - center
+        dist = np.sqrt(dx * dx + dy * dy)
+        inside = dist <= tex_radius
+        
+        # Sphere normals and Lambertian shading (ambient 0.3 + diffuse 0.7)
+        nx = dx / tex_radius
+        ny = dy / tex_radius
+        nz = np.sqrt(np.maximum(0.0, 1.0 - (nx * nx + ny * ny)))
+        dot_product = np.clip(nx * light_dir_x + ny * light_dir_y + nz * light_dir_z, 0.0, 1.0)
+        brightness = 0.3 + dot_product * 0.7
+        # Darken bottom of sphere (ambient occlusion effect) and edges slightly for depth
+        brightness *= np.where(ny > 0.3, 1.0 - (ny - 0.3) * 0.4, 1.0)
+        brightness *= 1.0 - (dist / tex_radius) ** 2 * 0.1
+        
+        # Channel values truncated to ints like the per-pixel path, (size, size, 3)
+        rgb = np.stack([(np.minimum(1.0, color[i] * brightness) * 255).astype(np.int32) for i in range(3)], axis=-1)
+        
+        # Specular highlight (top-left, stronger at center)
+        highlight_center_x = center - tex_radius * 0.35
+        highlight_center_y = center - tex_radius * 0.35
+        highlight_radius = int(tex_radius * 0.35)
+        if highlight_radius > 0:
+            hx = xx - highlight_center_x
+            hy = yy - highlight_center_y
+            highlight_dist = np.sqrt(hx * hx + hy * hy)
+            in_highlight = inside & (highlight_dist <= highlight_radius)
+            highlight_strength = np.where(in_highlight, np.maximum(0.0, 1.0 - highlight_dist / highlight_radius) ** 1.5 * 0.6, 0.0)
+            rgb = np.where(in_highlight[..., None],
+                           np.minimum(255, (rgb + (255 - rgb) * highlight_strength[..., None]).astype(np.int32)),
+                           rgb)
+        
+        # Rim lighting on the lit (top-left) edge, fading with distance from 135 degrees
+        rim_width = int(3 * self.scale_factor)
+        if rim_width > 0:
+            angle_diff = np.abs(np.arctan2(dy, dx) - math.radians(135))
+            angle_diff = np.where(angle_diff > math.pi, 2 * math.pi - angle_diff, angle_diff)
+            on_rim = inside & (dist >= tex_radius - rim_width) & (angle_diff < math.radians(60))
+            rim_intensity = np.where(on_rim, (1.0 - np.abs(dist - tex_radius) / rim_width) *
+                                     (1.0 - angle_diff / math.radians(60)), 0.0)
+            rgb = np.where(on_rim[..., None],
+                           np.minimum(255, (rgb + rim_intensity[..., None] * 120).astype(np.int32)),
+                           rgb)
+        
+        # Fully opaque ball over the shadow
+        pixels[inside, :3] = rgb[inside]
+        pixels[inside, 3] = 255
+        return Image.fromarray(pixels, 'RGBA')
+    
+    def _radial_mask(self, size, center_x, center_y, radius, lut):
+        """Get a size x size 'L' mask whose value is lut[distance from (center_x, center_y) / radius * 255]"""
+        diameter = max(1, int(round(radius * 2)))
+        # radial_gradient is 0 at the center rising to 255 at the corners of its 256x256 square (about 180 at
+        # the edge midpoints), so indices are scaled by sqrt(2) to put lut[255] at the radius
+        scaled_lut = [lut[min(255, int(round(v * math.sqrt(2))))] for v in range(256)]
+        gradient = Image.radial_gradient('L').resize((diameter, diameter), Image.BILINEAR).point(scaled_lut)
+        # Pixels past the radius get lut[255]
+        mask = Image.new('L', (size, size), lut[255])
+        mask.paste(gradient, (int(round(center_x - diameter / 2)), int(round(center_y - diameter / 2))))
+        return mask
+    
+    def _shade_bubble_pil(self, img, size, center, tex_radius, color, light_dir):
+        """Shade the ball body, specular highlight and lit rim over img with PIL primitives (close to the NumPy shading)"""
+        light_dir_x, light_dir_y, light_dir_z = light_dir
+        light_xy = math.sqrt(light_dir_x * light_dir_x + light_dir_y * light_dir_y)
+        sphere_box = [center - tex_radius, center - tex_radius, center + tex_radius, center + tex_radius]
+        sphere_mask = Image.new('L', (size, size), 0)
+        ImageDraw.Draw(sphere_mask).ellipse(sphere_box, fill=255)
+        
+        # Lambertian shading as a function of the distance from the brightest point (exact along the light axis)
+        lit_offset = light_xy * tex_radius
+        max_dist = lit_offset + tex_radius
+        lut = []
+        for v in range(256):
+            s = (lit_offset - v / 255 * max_dist) / tex_radius
+            nz = math.sqrt(max(0.0, 1.0 - s * s))
+            dot_product = max(0.0, min(1.0, s * light_xy + nz * light_dir_z))
+            lut.append(int((0.3 + dot_product * 0.7) * 255))
+        lit_x = center + light_dir_x / light_xy * lit_offset
+        lit_y = center + light_dir_y / light_xy * lit_offset
+        brightness = self._radial_mask(size, lit_x, lit_y, max_dist, lut)
+        
+        # Darken bottom of sphere (ambient occlusion effect), a per-row factor
+        column = Image.new('L', (1, size))
+        column.putdata([int((1.0 - max(0.0, (y - center) / tex_radius - 0.3) * 0.4) * 255) for y in range(size)])
+        brightness = ImageChops.multiply(brightness, column.resize((size, size)))
+        # Darken edges slightly for depth
+        edge_lut = [int((1.0 - (v / 255) ** 2 * 0.1) * 255) for v in range(256)]
+        brightness = ImageChops.multiply(brightness, self._radial_mask(size, center, center, tex_radius, edge_lut))
+        
+        # Apply color with lighting, fully opaque for solid ball
+        base = Image.new('RGB', (size, size), tuple(int(min(1.0, c) * 255) for c in color[:3]))
+        body = ImageChops.multiply(base, brightness.convert('RGB'))
+        img = img.copy()
+        img.paste(body, (0, 0), sphere_mask)
+        
+        # Specular highlight (top-left, stronger at center)
+        highlight_radius = int(tex_radius * 0.35)
+        if highlight_radius > 0:
+            highlight_lut = [int((1.0 - v / 255) ** 1.5 * 0.6 * 255) for v in range(256)]
+            highlight = self._radial_mask(size, center - tex_radius * 0.35, center - tex_radius * 0.35,
+                                          highlight_radius, highlight_lut)
+            highlight = ImageChops.multiply(highlight, sphere_mask)
+            white = Image.new('RGBA', (size, size), (255, 255, 255, 255))
+            img = Image.composite(white, img, highlight)
+        
+        # Rim lighting on the lit edge (around 135 degrees), stepped fade away from it
+        rim_width = int(3 * self.scale_factor)
+        if rim_width > 0:
+            rim = Image.new('L', (size, size), 0)
+            rim_draw = ImageDraw.Draw(rim)
+            steps = 6
+            for k in range(1, steps + 1):
+                spread = 60 * (1 - (k - 1) / steps)
+                rim_draw.arc(sphere_box, 135 - spread, 135 + spread, fill=int(120 * k / steps), width=rim_width)
+            r, g, b, a = img.split()
+            img = Image.merge('RGBA', (ImageChops.add(r, rim), ImageChops.add(g, rim), ImageChops.add(b, rim), a))
+        
+        return img
+    
     def create_shooter_texture(self, length, width, base_radius):
         """Create enhanced shooter/cannon texture"""
         if not PIL_AVAILABLE:
             return None
         
+        # Generated once per size
+        cache_key = ('shooter', length, width, base_radius)
+        texture = self.get_cached_texture(cache_key)
+        if texture is not None:
+            return texture
+        
         # Create texture for shooter base
         size = int(base_radius * 2.5)
         center = size // 2
         
         img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
         draw = ImageDraw.Draw(img)
+        pixels = img.load()  # Direct pixel access, much cheaper than putpixel/getpixel per pixel
         
         # Draw metallic base with gradient
         base_radius_int = int(base_radius * 1.2)
@@ -236,7 +265,7 @@ class GraphicsEnhancer:
                     
                     # Metallic gray color
                     gray = int(brightness * 180)
-                    img.putpixel((x, y), (gray, gray, gray, 255))
+                    pixels[x, y] = (gray, gray, gray, 255)
         
         # Add highlight
         highlight_radius = int(base_radius_int * 0.5)
@@ -251,98 +280,176 @@ class GraphicsEnhancer:
                 
                 if dist <= highlight_radius:
                     intensity = 1.0 - (dist / highlight_radius)
-                    r, g, b, a = img.getpixel((x, y))
+                    r, g, b, a = pixels[x, y]
                     bright = min(255, int(r + intensity * 60))
-                    img.putpixel((x, y), (bright, bright, bright, a))
+                    pixels[x, y] = (bright, bright, bright, a)
         
-        return self._pil_to_kivy_texture(img)
+        return self.cache_texture(cache_key, self._pil_to_kivy_texture(img))
     
     def create_panel_texture(self, width, height, style='default'):
         """Create enhanced UI panel texture with depth"""
         if not PIL_AVAILABLE:
             return None
         
+        # Generated once per size/style (corner radius and highlight depend on the scale)
+        cache_key = ('panel', width, height, style, self.scale_factor)
+        texture = self.get_cached_texture(cache_key)
+        if texture is not None:
+            return texture
+        
         # Scale for quality
         tex_width = int(width * 2)
         tex_height = int(height * 2)
         
-        img = Image.new('RGBA', (tex_width, tex_height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        
         # Draw panel with gradient
         corner_radius = int(8 * self.scale_factor)
         
-        # Main panel gradient (darker at bottom)
-        for y in range(tex_height):
-            brightness = 0.7 + 0.3 * (y / tex_height)  # Darker at bottom
-            color_val = int(brightness * 60)
-            alpha = int(brightness * 220)
+        if NUMPY_AVAILABLE:
+            # Gradient, rounded corners and top highlight for all rows at once
+            img = self._panel_array(tex_width, tex_height, corner_radius, style)
+        else:
+            img = Image.new('RGBA', (tex_width, tex_height), (0, 0, 0, 0))
+            pixels = img.load()  # Direct pixel access, much cheaper than putpixel/getpixel per pixel
             
-            # Draw rounded rectangle row
-            for x in range(tex_width):
-                # Check if in rounded corners
-                in_corner = False
-                if x < corner_radius and y < corner_radius:
-                    dist = math.sqrt((x - corner_radius)**2 + (y - corner_radius)**2)
-                    in_corner = dist > corner_radius
-                elif x >= tex_width - corner_radius and y < corner_radius:
-                    dist = math.sqrt((x - (tex_width - corner_radius))**2 + (y - corner_radius)**2)
-                    in_corner = dist > corner_radius
-                elif x < corner_radius and y >= tex_height - corner_radius:
-                    dist = math.sqrt((x - corner_radius)**2 + (y - (tex_height - corner_radius))**2)
-                    in_corner = dist > corner_radius
-                elif x >= tex_width - corner_radius and y >= tex_height - corner_radius:
-                    dist = math.sqrt((x - (tex_width - corner_radius))**2 + (y - (tex_height - corner_radius))**2)
-                    in_corner = dist > corner_radius
+            # Main panel gradient (darker at bottom)
+            for y in range(tex_height):
+                brightness = 0.7 + 0.3 * (y / tex_height)  # Darker at bottom
+                color_val = int(brightness * 60)
+                alpha = int(brightness * 220)
                 
-                if not in_corner:
-                    if style == 'default':
-                        img.putpixel((x, y), (color_val, color_val + 10, color_val + 20, alpha))
-                    else:
-                        img.putpixel((x, y), (color_val, color_val, color_val, alpha))
+                # Draw rounded rectangle row
+                for x in range(tex_width):
+                    # Check if in rounded corners
+                    in_corner = False
+                    if x < corner_radius and y < corner_radius:
+                        dist = math.sqrt((x - corner_radius)**2 + (y - corner_radius)**2)
+                        in_corner = dist > corner_radius
+                    elif x >= tex_width - corner_radius and y < corner_radius:
+                        dist = math.sqrt((x - (tex_width - corner_radius))**2 + (y - corner_radius)**2)
+                        in_corner = dist > corner_radius
+                    elif x < corner_radius and y >= tex_height - corner_radius:
+                        dist = math.sqrt((x - corner_radius)**2 + (y - (tex_height - corner_radius))**2)
+                        in_corner = dist > corner_radius
+                    elif x >= tex_width - corner_radius and y >= tex_height - corner_radius:
+                        dist = math.sqrt((x - (tex_width - corner_radius))**2 + (y - (tex_height - corner_radius))**2)
+                        in_corner = dist > corner_radius
+                    
+                    if not in_corner:
+                        if style == 'default':
+                            pixels[x, y] = (color_val, color_val + 10, color_val + 20, alpha)
+                        else:
+                            pixels[x, y] = (color_val, color_val, color_val, alpha)
+            
+            # Add top highlight
+            highlight_height = int(6 * self.scale_factor)
+            for y in range(highlight_height):
+                for x in range(tex_width):
+                    r, g, b, a = pixels[x, y]
+                    bright = min(255, int(r + 40))
+                    pixels[x, y] = (bright, bright, bright, a)
+        
+        return self.cache_texture(cache_key, self._pil_to_kivy_texture(img))
+    
+    def _panel_array(self, tex_width, tex_height, corner_radius, style):
+        """Build the panel image with NumPy (same gradient, corner and highlight rules as the per-pixel loops)"""
+        # Main panel gradient (darker at bottom) - depends on the row only
+        brightness = 0.7 + 0.3 * (np.arange(tex_height) / tex_height)
+        color_val = (brightness * 60).astype(np.int32)[:, None]
+        alpha = (brightness * 220).astype(np.int32)[:, None]
+        
+        # Rounded corners: pixels in a corner square farther than corner_radius from its center
+        xs = np.arange(tex_width)[None, :]
+        ys = np.arange(tex_height)[:, None]
+        left = xs < corner_radius
+        top = ys < corner_radius
+        corner_x = np.where(left, corner_radius, tex_width - corner_radius)
+        corner_y = np.where(top, corner_radius, tex_height - corner_radius)
+        in_square = (left | (xs >= tex_width - corner_radius)) & (top | (ys >= tex_height - corner_radius))
+        in_corner = in_square & ((xs - corner_x) ** 2 + (ys - corner_y) ** 2 > corner_radius ** 2)
+        
+        pixels = np.zeros((tex_height, tex_width, 4), dtype=np.uint8)
+        shape = (tex_height, tex_width)
+        if style == 'default':
+            channels = (color_val, color_val + 10, color_val + 20, alpha)
+        else:
+            channels = (color_val, color_val, color_val, alpha)
+        for i, channel in enumerate(channels):
+            pixels[..., i] = np.where(in_corner, 0, np.broadcast_to(channel, shape))
         
-        # Add top highlight
+        # Add top highlight (gray from the red channel, alpha kept)
         highlight_height = int(6 * self.scale_factor)
-        for y in range(highlight_height):
-            for x in range(tex_width):
-                r, g, b, a = img.getpixel((x, y))
-                bright = min(255, int(r + 40))
-                img.putpixel((x, y), (bright, bright, bright, a))
+        bright = np.minimum(255, pixels[:highlight_height, :, 0].astype(np.int32) + 40)
+        pixels[:highlight_height, :, :3] = bright[..., None]
         
-        return self._pil_to_kivy_texture(img)
+        return Image.fromarray(pixels, 'RGBA')
     
     def create_particle_texture(self, size, color, fade=True):
         """Create particle texture for explosion effects"""
         if not PIL_AVAILABLE:
             return None
         
-        img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
         center = size // 2
         
         # Create soft circular particle
-        for y in range(size):
-            for x in range(size):
-                dx = x - center
-                dy = y - center
-                dist = math.sqrt(dx*dx + dy*dy)
-                
-                if dist <= size // 2:
-                    if fade:
-                        intensity = 1.0 - (dist / (size // 2))
-                        intensity = intensity ** 1.5  # Softer falloff
-                    else:
-                        intensity = 1.0 if dist <= size // 2 else 0.0
-                    
-                    r = int(color[0] * 255 * intensity)
-                    g = int(color[1] * 255 * intensity)
-                    b = int(color[2] * 255 * intensity)
-                    a = int(255 * intensity)
+        if NUMPY_AVAILABLE:
+            img = self._particle_array(size, center, color, fade)
+        else:
+            img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+            pixels = img.load()  # Direct pixel access, much cheaper than putpixel/getpixel per pixel
+            
+            for y in range(size):
+                for x in range(size):
+                    dx = x - center
+                    dy = y - center
+                    dist = math.sqrt(dx*dx + dy*dy)
                     
-                    img.putpixel((x, y), (r, g, b, a))
+                    if dist <= size // 2:
+                        if fade:
+                            intensity = 1.0 - (dist / (size // 2))
+                            intensity = intensity ** 1.5  # Softer falloff
+                        else:
+                            intensity = 1.0 if dist <= size // 2 else 0.0
+                        
+                        r = int(color[0] * 255 * intensity)
+                        g = int(color[1] * 255 * intensity)
+                        b = int(color[2] * 255 * intensity)
+                        a = int(255 * intensity)
+                        
+                        pixels[x, y] = (r, g, b, a)
         
         return self._pil_to_kivy_texture(img)
     
+    def _particle_array(self, size, center, color, fade):
+        """Build the soft circular particle image with NumPy (same falloff as the per-pixel loop)"""
+        half = size // 2
+        ys, xs = np.ogrid[0:size, 0:size]
+        dist = np.sqrt((xs - center) ** 2 + (ys - center) ** 2)
+        inside = dist <= half
+        if fade:
+            intensity = np.where(inside, np.maximum(0.0, 1.0 - dist / half) ** 1.5, 0.0)  # Softer falloff
+        else:
+            intensity = inside.astype(np.float64)
+        
+        pixels = np.empty((size, size, 4), dtype=np.uint8)
+        for i in range(3):
+            pixels[..., i] = (color[i] * 255 * intensity).astype(np.uint8)
+        pixels[..., 3] = (255 * intensity).astype(np.uint8)
+        return Image.fromarray(pixels, 'RGBA')
+    
+    def get_particle_texture(self, size, color):
+        """Get a shared faded particle texture (sizes and colors are quantized so particles reuse textures)"""
+        size = max(2, int(size) // 2 * 2)  # Even pixel sizes
+        color = (round(color[0], 1), round(color[1], 1), round(color[2], 1))
+        cache_key = (size, color)
+        texture = self.particle_textures.get(cache_key)
+        if texture is None:
+            if len(self.particle_textures) >= PARTICLE_TEXTURE_CACHE_SIZE:
+                # Drop the oldest texture (dicts keep insertion order)
+                del self.particle_textures[next(iter(self.particle_textures))]
+            texture = self.create_particle_texture(size, color, fade=True)
+            self.particle_textures[cache_key] = texture
+        return texture
+    
     def create_bazooka_texture(self, length, width, base_radius, tip_radius, angle_rad=0):
         """Create a beautiful high-quality bazooka texture with depth and detail"""
         if not PIL_AVAILABLE:
@@ -361,6 +468,7 @@ class GraphicsEnhancer:
         img_height = max(tex_base_radius * 2, tex_width) + padding * 2
         img = Image.new('RGBA', (img_width, img_height), (0, 0, 0, 0))
         draw = ImageDraw.Draw(img)
+        pixels = img.load()  # Direct pixel access, much cheaper than putpixel/getpixel per pixel
         
         # Calculate positions (bazooka pointing right)
         start_x = padding
@@ -407,7 +515,7 @@ class GraphicsEnhancer:
                     
                     # Metallic color (dark gray to light gray)
                     gray = int(brightness * 200)
-                    img.putpixel((x, y), (gray, gray, int(gray * 1.1), 255))
+                    pixels[x, y] = (gray, gray, int(gray * 1.1), 255)
         
         # Add base rim highlight
         rim_width = int(3 * scale)
@@ -421,9 +529,9 @@ class GraphicsEnhancer:
                     # Bright rim on top-left
                     angle = math.atan2(dy, dx)
                     if angle < -math.pi/4 and angle > -3*math.pi/4:
-                        r, g, b, a = img.getpixel((x, y))
+                        r, g, b, a = pixels[x, y]
                         bright = min(255, int(r + 80))
-                        img.putpixel((x, y), (bright, bright, bright, a))
+                        pixels[x, y] = (bright, bright, bright, a)
         
         # Draw bazooka barrel (cylindrical with metallic finish)
         half_width = tex_width // 2
@@ -453,15 +561,15 @@ class GraphicsEnhancer:
                         
                         # Metallic gray color
                         gray = int(brightness * 180)
-                        img.putpixel((x, y), (gray, gray, int(gray * 1.05), 255))
+                        pixels[x, y] = (gray, gray, int(gray * 1.05), 255)
         
         # Add barrel top highlight
         highlight_width = int(tex_width * 0.3)
         for y in range(start_y - half_width, start_y - half_width + highlight_width):
             for x in range(start_x, end_x):
-                r, g, b, a = img.getpixel((x, y))
+                r, g, b, a = pixels[x, y]
                 bright = min(255, int(r + 60))
-                img.putpixel((x, y), (bright, bright, bright, a))
+                pixels[x, y] = (bright, bright, bright, a)
         
         # Add barrel reinforcement bands
         band_positions = [0.2, 0.6]
@@ -471,9 +579,9 @@ class GraphicsEnhancer:
             for y in range(start_y - half_width, start_y + half_width):
                 for x in range(band_x - band_width, band_x + band_width):
                     if 0 <= x < img_width and 0 <= y < img_height:
-                        r, g, b, a = img.getpixel((x, y))
+                        r, g, b, a = pixels[x, y]
                         dark = max(0, int(r - 40))
-                        img.putpixel((x, y), (dark, dark, dark, a))
+                        pixels[x, y] = (dark, dark, dark, a)
         
         # Draw bazooka tip/muzzle
         tip_center_x = end_x
@@ -513,7 +621,7 @@ class GraphicsEnhancer:
                     
                     # Darker metallic for tip
                     gray = int(brightness * 150)
-                    img.putpixel((x, y), (gray, gray, int(gray * 1.1), 255))
+                    pixels[x, y] = (gray, gray, int(gray * 1.1), 255)
         
         # Muzzle opening (dark center)
         muzzle_radius = int(tex_tip_radius * 0.55)
@@ -525,7 +633,7 @@ class GraphicsEnhancer:
                 
                 if dist <= muzzle_radius:
                     # Very dark center
-                    img.putpixel((x, y), (20, 20, 25, 255))
+                    pixels[x, y] = (20, 20, 25, 255)
         
         # Add inner muzzle rim
         rim_radius = int(muzzle_radius * 0.9)
@@ -536,7 +644,7 @@ class GraphicsEnhancer:
                 dist = math.sqrt(dx*dx + dy*dy)
                 
                 if rim_radius - 2 <= dist <= rim_radius:
-                    img.putpixel((x, y), (80, 80, 90, 255))
+                    pixels[x, y] = (80, 80, 90, 255)
         
         return self._pil_to_kivy_texture(img)
     
@@ -552,6 +660,7 @@ class GraphicsEnhancer:
         
         img = Image.new('RGBA', (tex_width, tex_height), (0, 0, 0, 0))
         draw = ImageDraw.Draw(img)
+        pixels = img.load()  # Direct pixel access, much cheaper than putpixel/getpixel per pixel
         
         center_x = tex_width // 2
         center_y = tex_height // 2
@@ -598,7 +707,7 @@ class GraphicsEnhancer:
                     base_gray = 160
                     gray = int(base_gray * brightness)
                     blue_tint = int(gray * 1.15)  # Slight blue tint
-                    img.putpixel((x, y), (gray, gray, blue_tint, 255))
+                    pixels[x, y] = (gray, gray, blue_tint, 255)
         
         # Draw nose cone (pointed, more aerodynamic)
         nose_length = int(tex_width * 0.35)
@@ -740,7 +849,7 @@ class GraphicsEnhancer:
                     g = int(120 + intensity * 60)
                     b = int(180 + intensity * 50)
                     alpha = int(180 + intensity * 60)
-                    img.putpixel((x, y), (r, g, b, alpha))
+                    pixels[x, y] = (r, g, b, alpha)
         
         # Add canopy highlight
         highlight_bbox = [
@@ -778,10 +887,10 @@ class GraphicsEnhancer:
                 brightness = 0.7 + 0.3 * (1.0 - abs(x - center_x) / (body_width / 2))
                 gray = int(brightness * 200)
                 if 0 <= highlight_y < tex_height:
-                    r, g, b, a = img.getpixel((x, highlight_y))
+                    r, g, b, a = pixels[x, highlight_y]
                     bright = min(255, int(r + 50))
                     blue = min(255, int(b + 30))
-                    img.putpixel((x, highlight_y), (bright, bright, blue, a))
+                    pixels[x, highlight_y] = (bright, bright, blue, a)
         
         # Add shadow/outline for depth
         shadow_img = Image.new('RGBA', (tex_width, tex_height), (0, 0, 0, 0))
@@ -819,6 +928,7 @@ class GraphicsEnhancer:
         
         img = Image.new('RGBA', (tex_width, tex_height), (0, 0, 0, 0))
         draw = ImageDraw.Draw(img)
+        pixels = img.load()  # Direct pixel access, much cheaper than putpixel/getpixel per pixel
         
         center_x = tex_width // 2
         center_y = tex_height // 2
@@ -867,7 +977,7 @@ class GraphicsEnhancer:
                     base_r = int(40 * brightness)
                     base_g = int(120 * brightness)
                     base_b = int(60 * brightness)
-                    img.putpixel((x, y), (base_r, base_g, base_b, 255))
+                    pixels[x, y] = (base_r, base_g, base_b, 255)
         
         # Draw windows/cockpit (front and side)
         window_width = int(tex_width * 0.2)
@@ -894,12 +1004,12 @@ class GraphicsEnhancer:
                     b = int(160 + intensity * 60)
                     alpha = int(200 + intensity * 50)
                     # Blend with existing pixel
-                    existing = img.getpixel((x, y))
+                    existing = pixels[x, y]
                     if len(existing) == 4:
                         blend_r = int(existing[0] * 0.3 + r * 0.7)
                         blend_g = int(existing[1] * 0.3 + g * 0.7)
                         blend_b = int(existing[2] * 0.3 + b * 0.7)
-                        img.putpixel((x, y), (blend_r, blend_g, blend_b, existing[3]))
+                        pixels[x, y] = (blend_r, blend_g, blend_b, existing[3])
         
         # Draw tail boom (narrow cylinder extending back)
         tail_boom_length = int(tex_width * 0.35)
@@ -952,7 +1062,7 @@ class GraphicsEnhancer:
                     r = int(35 * brightness)
                     g = int(110 * brightness)
                     b = int(55 * brightness)
-                    img.putpixel((x, y), (r, g, b, 255))
+                    pixels[x, y] = (r, g, b, 255)
         
         # Draw main rotor (circular disc on top)
         rotor_center_x = center_x
@@ -972,7 +1082,7 @@ class GraphicsEnhancer:
                     intensity = 1.0 - (abs(dy) / rotor_disc_height)
                     gray = int(80 + intensity * 60)
                     alpha = int(180 + intensity * 60)
-                    img.putpixel((x, y), (gray, gray, gray, alpha))
+                    pixels[x, y] = (gray, gray, gray, alpha)
         
         # Draw rotor blades (two main blades)
         blade_width = int(tex_width * 0.03)
@@ -1014,7 +1124,7 @@ class GraphicsEnhancer:
                 if dist <= tail_rotor_radius:
                     gray = int(70 + (1.0 - dist/tail_rotor_radius) * 40)
                     alpha = int(200 + (1.0 - dist/tail_rotor_radius) * 50)
-                    img.putpixel((x, y), (gray, gray, gray, alpha))
+                    pixels[x, y] = (gray, gray, gray, alpha)
         
         # Tail rotor blades (small cross pattern)
         blade_size = tail_rotor_radius * 0.8
@@ -1064,14 +1174,14 @@ class GraphicsEnhancer:
                 
                 if dist_squared <= 1.0 and y < highlight_y:
                     # Add highlight
-                    existing = img.getpixel((x, y))
+                    existing = pixels[x, y]
                     if len(existing) == 4:
                         highlight_intensity = (highlight_y - y) / (tex_height * 0.08)
                         highlight_intensity = min(1.0, highlight_intensity)
                         new_r = min(255, existing[0] + int(30 * highlight_intensity))
                         new_g = min(255, existing[1] + int(40 * highlight_intensity))
                         new_b = min(255, existing[2] + int(20 * highlight_intensity))
-                        img.putpixel((x, y), (new_r, new_g, new_b, existing[3]))
+                        pixels[x, y] = (new_r, new_g, new_b, existing[3])
         
         return self._pil_to_kivy_texture(img)
     
@@ -1092,5 +1202,9 @@ class GraphicsEnhancer:
     
     def cache_texture(self, cache_key, texture):
         """Cache texture for reuse"""
+        if cache_key not in self.texture_cache and len(self.texture_cache) >= TEXTURE_CACHE_SIZE:
+            # Drop the oldest texture (dicts keep insertion order)
+            del self.texture_cache[next(iter(self.texture_cache))]
         self.texture_cache[cache_key] = texture
+        return texture
 